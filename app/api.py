@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import json
 import re
 from pathlib import Path
 import time
 from typing import Any
+import zlib
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import Response
+from pydantic import ValidationError
 from .logging_config import get_logger, short_id
 from .schemas import (
     InterviewCreateResponse,
     InterviewSummaryResponse,
     LiveSessionRequest,
     LiveSessionResponse,
+    LiveCapacityResponse,
     VoiceIntroRequest,
     VoiceIntroResponse,
     VoiceFeedbackRequest,
@@ -34,19 +38,24 @@ from .schemas import (
     RestartResponse,
     SessionListResponse,
     LogSummaryResponse,
+    ClientEventBatchResponse,
     ClientEventRequest,
     ClientEventResponse
 )
 from .services import interview_service
-from .services.log_metrics import build_log_summary
+from .services.live_capacity import live_capacity
+from .services.log_tail import log_tail
 from .services.document_text import DocumentInput, fetch_url_text, is_supported_document
-from .services.ga4_telemetry import send_ga4_event
+from .services.ga4_telemetry import ga4_dispatcher
 from .access_control import require_api_access
 from .settings import load_settings
 
 router = APIRouter(prefix="/api", dependencies=[Depends(require_api_access)])
 logger = get_logger()
 
+TELEMETRY_BATCH_MAX_EVENTS = 200
+TELEMETRY_BATCH_MAX_BYTES = 1024 * 1024
+
 
 def _model_dump(item):
     if hasattr(item, "model_dump"):
@@ -260,6 +269,15 @@ async def create_live_session(request: Request, payload: LiveSessionRequest):
     return response
 
 
+@router.get("/live/capacity", response_model=LiveCapacityResponse)
+async def get_live_capacity() -> LiveCapacityResponse:
+    settings = load_settings()
+    snapshot = live_capacity.snapshot()
+    snapshot["max_sessions"] = settings.live_max_sessions
+    snapshot["queue_max"] = settings.live_queue_max
+    return LiveCapacityResponse(**snapshot)
+
+
 @router.post("/voice/turn", response_model=VoiceTurnResponse)
 async def voice_turn(request: Request, payload: VoiceTurnRequest):
     user_id = _get_user_id(request)
@@ -731,8 +749,13 @@ async def get_log_summary() -> LogSummaryResponse:
     log_path = log_dir / "app.log"
     if not log_path.exists():
         return LogSummaryResponse()
-    lines = log_path.read_text().splitlines()[-2000:]
-    summary = build_log_summary(lines)
+    log_tail.follow(log_path)
+    if not log_tail.running:
+        # No background tail (tests, scripts): catch up inline; still only the new bytes are read.
+        log_tail.poll()
+    summary = log_tail.snapshot()
+    if summary is None:
+        return LogSummaryResponse()
     return LogSummaryResponse(**summary)
 
 
@@ -741,6 +764,72 @@ async def log_client_event(request: Request, payload: ClientEventRequest):
     settings = load_settings()
     user_id = _get_user_id(request)
     access_token_id = getattr(request.state, "access_token_id", None)
+    _record_client_event(settings, payload, user_id, access_token_id)
+    return {"status": "ok"}
+
+
+@router.post("/telemetry/batch", response_model=ClientEventBatchResponse)
+async def log_client_event_batch(request: Request):
+    start = time.perf_counter()
+    items = _read_telemetry_batch(request.headers.get("content-encoding"), await request.body())
+    settings = load_settings()
+    user_id = _get_user_id(request)
+    access_token_id = getattr(request.state, "access_token_id", None)
+    results = []
+    accepted = 0
+    for index, item in enumerate(items):
+        try:
+            payload = ClientEventRequest.model_validate(item)
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            location = ".".join(str(part) for part in error["loc"]) or "item"
+            results.append({"index": index, "status": "invalid", "error": f"{location}: {error['msg']}"})
+            continue
+        _record_client_event(settings, payload, user_id, access_token_id)
+        results.append({"index": index, "status": "ok"})
+        accepted += 1
+    logger.info(
+        "event=client_event_batch status=complete user_id=%s events=%s accepted=%s duration_ms=%s",
+        short_id(user_id),
+        len(items),
+        accepted,
+        int((time.perf_counter() - start) * 1000)
+    )
+    return {"status": "ok", "accepted": accepted, "rejected": len(items) - accepted, "results": results}
+
+
+def _read_telemetry_batch(content_encoding: str | None, body: bytes) -> list[Any]:
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(body, TELEMETRY_BATCH_MAX_BYTES + 1)
+        except zlib.error:
+            raise HTTPException(status_code=400, detail="Telemetry batch is not valid gzip.")
+    elif encoding not in {"", "identity"}:
+        raise HTTPException(status_code=415, detail="Telemetry batch must be JSON or gzip-encoded JSON.")
+    if len(body) > TELEMETRY_BATCH_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="Telemetry batch is too large.")
+    try:
+        items = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Telemetry batch must be a JSON array of events.")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Telemetry batch must be a JSON array of events.")
+    if len(items) > TELEMETRY_BATCH_MAX_EVENTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Telemetry batch is limited to {TELEMETRY_BATCH_MAX_EVENTS} events."
+        )
+    return items
+
+
+def _record_client_event(
+    settings,
+    payload: ClientEventRequest,
+    user_id: str,
+    access_token_id: str | None
+) -> None:
     properties = payload.properties or {}
     logger.info(
         (
@@ -812,7 +901,7 @@ async def log_client_event(request: Request, payload: ClientEventRequest):
             coerced = _coerce_telemetry_param(value)
             if coerced is not None:
                 ga4_params[f"prop_{key}"] = coerced
-        await send_ga4_event(
+        ga4_dispatcher.enqueue(
             measurement_id=settings.ga4_measurement_id or "",
             api_secret=settings.ga4_api_secret or "",
             client_id=payload.anonymous_id,
@@ -820,7 +909,6 @@ async def log_client_event(request: Request, payload: ClientEventRequest):
             event_name=payload.event,
             params=ga4_params
         )
-    return {"status": "ok"}
 
 
 @router.get("/interviews/{interview_id}", response_model=InterviewSummaryResponse)
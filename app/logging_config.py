@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import atexit
+import copy
 import hashlib
+import json
 import logging
+from logging.handlers import BaseRotatingHandler, QueueHandler, QueueListener
 import os
+import queue
 import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
 
 _LOGGER_NAME = "preptalk"
 _CONFIGURED = False
+_LISTENER: QueueListener | None = None
+_QUEUE_HANDLER: "_BoundedQueueHandler | None" = None
+
+LOG_QUEUE_SIZE = 10000
+LOG_ROTATE_MAX_BYTES = 10 * 1024 * 1024
+LOG_ROTATE_INTERVAL_S = 86400
 
 
 _LEVEL_COLORS = {
@@ -43,6 +55,7 @@ _VALUE_PALETTE = [
     214,
 ]
 _KV_PATTERN = re.compile(r"(?P<key>[A-Za-z0-9_]+)=(?P<value>[^\s]+)")
+_EXCEPTION_FORMATTER = logging.Formatter()
 
 
 def _color_enabled() -> bool:
@@ -56,6 +69,16 @@ def _env_truthy(name: str) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
 def _stable_value_color(value: str, *, salt: str) -> str:
     digest = hashlib.sha1(f"{salt}:{value}".encode("utf-8")).digest()
     color_code = _VALUE_PALETTE[digest[0] % len(_VALUE_PALETTE)]
@@ -90,17 +113,154 @@ class _ColorFormatter(logging.Formatter):
             if color:
                 levelname = f"{color}{levelname}{_COLOR_RESET}"
         output = f"{self.formatTime(record, self.datefmt)} {levelname} {message}"
-        if record.exc_info:
-            if not record.exc_text:
-                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
             output = f"{output}\n{record.exc_text}"
         if record.stack_info:
             output = f"{output}\n{self.formatStack(record.stack_info)}"
         return output
 
 
+class _JsonFormatter(logging.Formatter):
+    """One JSON object per line with the message's key=value pairs lifted to top-level keys.
+
+    Matches what ``log_parse.parse_log_line`` returns for the text format, so
+    readers get the same fields from a single ``json.loads``. Pairs come from
+    the first line only and the first occurrence wins, so text further down
+    (an exception message, a pasted payload) cannot overwrite real fields.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        fields = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "message": message
+        }
+        for match in _KV_PATTERN.finditer(message.split("\n", 1)[0]):
+            fields.setdefault(match.group("key"), match.group("value"))
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            fields["exc_text"] = record.exc_text
+        if record.stack_info:
+            fields["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(fields, ensure_ascii=False)
+
+
+def _archive_path(archive_dir: Path) -> Path:
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    archive_file = archive_dir / f"app-{timestamp}.log"
+    suffix = 1
+    while archive_file.exists():
+        archive_file = archive_dir / f"app-{timestamp}-{suffix}.log"
+        suffix += 1
+    return archive_file
+
+
+class ArchiveRotatingFileHandler(BaseRotatingHandler):
+    """Moves app.log into archive/ once it passes a size or age limit.
+
+    Runs on the queue listener thread, so the rename never blocks a request.
+    A limit of 0 disables that trigger.
+    """
+
+    def __init__(self, filename: Path, archive_dir: Path, max_bytes: int = 0, interval_seconds: int = 0) -> None:
+        super().__init__(filename, "a", encoding="utf-8", delay=False)
+        self.archive_dir = archive_dir
+        self.max_bytes = max(0, max_bytes)
+        self.interval_seconds = max(0, interval_seconds)
+        self.rollovers = 0
+        self._opened_at = time.time()
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.interval_seconds and time.time() - self._opened_at >= self.interval_seconds:
+            return True
+        if self.max_bytes and self.stream is not None:
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def doRollover(self) -> None:
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        try:
+            if os.path.getsize(self.baseFilename) > 0:
+                os.rename(self.baseFilename, _archive_path(self.archive_dir))
+                self.rollovers += 1
+        except OSError:
+            pass
+        self.stream = self._open()
+        self._opened_at = time.time()
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """Hands records to the listener thread; drops instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() folds the traceback into msg; keep it in exc_text
+        # so the output formatters can place it themselves.
+        message = record.getMessage()
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def bounded_queue_handler(maxsize: int = LOG_QUEUE_SIZE) -> QueueHandler:
+    """Builds a queue handler with the app log's drop-on-full behaviour, for other queued writers."""
+    return _BoundedQueueHandler(queue.Queue(maxsize=maxsize))
+
+
+def log_queue_stats() -> dict[str, int]:
+    handler = _QUEUE_HANDLER
+    if handler is None:
+        return {"depth": 0, "capacity": 0, "dropped": 0}
+    return {"depth": handler.queue.qsize(), "capacity": handler.queue.maxsize, "dropped": handler.dropped}
+
+
+def log_output_handlers() -> tuple[logging.Handler, ...]:
+    if _LISTENER is not None:
+        return tuple(_LISTENER.handlers)
+    return tuple(logging.getLogger(_LOGGER_NAME).handlers)
+
+
+def flush_logging() -> None:
+    """Stops the listener after it writes everything queued; later records are written inline."""
+    global _LISTENER, _QUEUE_HANDLER
+    listener, handler = _LISTENER, _QUEUE_HANDLER
+    if listener is None or handler is None:
+        return
+    _LISTENER = None
+    _QUEUE_HANDLER = None
+    listener.stop()
+    logger = logging.getLogger(_LOGGER_NAME)
+    logger.removeHandler(handler)
+    for output in listener.handlers:
+        logger.addHandler(output)
+    if handler.dropped:
+        logger.warning("event=log_queue status=overflow dropped=%s", handler.dropped)
+
+
 def setup_logging() -> None:
-    global _CONFIGURED
+    global _CONFIGURED, _LISTENER, _QUEUE_HANDLER
     if _CONFIGURED:
         return
 
@@ -113,10 +273,8 @@ def setup_logging() -> None:
     archive_dir.mkdir(parents=True, exist_ok=True)
 
     if log_file.exists() and log_file.stat().st_size > 0:
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        archive_file = archive_dir / f"app-{timestamp}.log"
         try:
-            log_file.rename(archive_file)
+            log_file.rename(_archive_path(archive_dir))
         except OSError:
             pass
 
@@ -130,17 +288,32 @@ def setup_logging() -> None:
             "%(asctime)s %(levelname)s %(message)s",
             use_color=_color_enabled()
         )
-        file_formatter = (
-            _ColorFormatter("%(asctime)s %(levelname)s %(message)s", use_color=True)
-            if _env_truthy("LOG_COLOR_FILE")
-            else formatter
+        if os.getenv("LOG_FORMAT", "text").strip().lower() == "json":
+            file_formatter = _JsonFormatter()
+        elif _env_truthy("LOG_COLOR_FILE"):
+            file_formatter = _ColorFormatter("%(asctime)s %(levelname)s %(message)s", use_color=True)
+        else:
+            file_formatter = formatter
+        file_handler = ArchiveRotatingFileHandler(
+            log_file,
+            archive_dir,
+            max_bytes=_env_int("LOG_ROTATE_MAX_BYTES", LOG_ROTATE_MAX_BYTES),
+            interval_seconds=_env_int("LOG_ROTATE_INTERVAL_S", LOG_ROTATE_INTERVAL_S)
         )
-        file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(file_formatter)
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(stream_formatter)
-        logger.addHandler(file_handler)
-        logger.addHandler(stream_handler)
+        queue_size = _env_int("LOG_QUEUE_SIZE", LOG_QUEUE_SIZE)
+        if queue_size > 0:
+            # Callers only enqueue; formatting, writes and rotation happen on the listener thread.
+            _QUEUE_HANDLER = _BoundedQueueHandler(queue.Queue(maxsize=queue_size))
+            _LISTENER = QueueListener(_QUEUE_HANDLER.queue, file_handler, stream_handler, respect_handler_level=True)
+            logger.addHandler(_QUEUE_HANDLER)
+            _LISTENER.start()
+            atexit.register(flush_logging)
+        else:
+            logger.addHandler(file_handler)
+            logger.addHandler(stream_handler)
 
     _CONFIGURED = True
 
@@ -1,8 +1,9 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 import json
 import uuid
 
-from fastapi import FastAPI, Form, Request, WebSocket
+from fastapi import Depends, FastAPI, Form, Request, WebSocket
 from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -10,11 +11,20 @@ from fastapi.templating import Jinja2Templates
 from .access_control import (
     ACCESS_TOKEN_COOKIE,
     is_access_control_enabled,
+    require_api_access,
     resolve_request_access,
     validate_access_token,
 )
 from .api import router as api_router
 from .logging_config import setup_logging
+from .services.ga4_telemetry import ga4_dispatcher
+from .services.live_auth_tokens import auth_token_cache
+from .services.live_drain import live_drain
+from .services.log_tail import log_tail
+from .services.metrics import PROMETHEUS_CONTENT_TYPE, HttpMetricsMiddleware, registry
+from .services.profiler import ProfilerMiddleware
+from .services.tracing import TracingMiddleware, flush_trace_export
+from .services.store import store
 from .settings import load_settings
 from .ws import live_audio_websocket
 
@@ -22,7 +32,31 @@ BASE_DIR = Path(__file__).resolve().parent
 
 setup_logging()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    settings = load_settings()
+    drain_timeout = settings.live_drain_timeout_ms / 1000
+    restore_signal_handler = live_drain.install_signal_handler(drain_timeout)
+    log_tail.follow(Path(settings.log_dir) / "app.log")
+    log_tail.start(settings.log_summary_poll_ms / 1000)
+    ga4_dispatcher.start(settings.ga4_flush_ms / 1000, settings.ga4_queue_size)
+    try:
+        yield
+    finally:
+        restore_signal_handler()
+        await log_tail.stop()
+        await live_drain.drain(drain_timeout)
+        store.flush()
+        await ga4_dispatcher.stop()
+        await auth_token_cache.close()
+        flush_trace_export()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(ProfilerMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(HttpMetricsMiddleware)
 app.include_router(api_router)
 
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
@@ -188,6 +222,11 @@ def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_api_access)])
+def metrics():
+    return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.get("/favicon.ico", include_in_schema=False)
 def favicon():
     return Response(status_code=204)
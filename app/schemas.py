@@ -207,12 +207,26 @@ class LogSummaryResponse(BaseModel):
     server_disconnects: int = 0
     gemini_disconnects: int = 0
     turn_completion_checks: int = 0
+    live_latency: dict = Field(default_factory=dict)
+    latency_windows: dict = Field(default_factory=dict)
     error_count: int = 0
     error_event_count: int = 0
     error_session_count: int = 0
     recent_errors: list = Field(default_factory=list)
 
 
+class LiveCapacityResponse(BaseModel):
+    active: int = 0
+    queued: int = 0
+    max_sessions: int = 0
+    queue_max: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    reaped: int = 0
+    reaped_idle_seconds: float = 0.0
+
+
 class ClientEventRequest(BaseModel):
     event: str
     interview_id: str | None = None
@@ -229,3 +243,16 @@ class ClientEventRequest(BaseModel):
 
 class ClientEventResponse(BaseModel):
     status: str
+
+
+class ClientEventBatchItem(BaseModel):
+    index: int
+    status: str
+    error: str | None = None
+
+
+class ClientEventBatchResponse(BaseModel):
+    status: str
+    accepted: int
+    rejected: int
+    results: list[ClientEventBatchItem]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from array import array
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+LIVE_INPUT_SAMPLE_RATES = (16000, 24000, 48000)
+LIVE_INPUT_FORMATS = ("pcm16", "float32")
+# Rates Gemini Live ingests without resampling on its side; 16 kHz is the model's native input rate.
+LIVE_MODEL_INPUT_RATES = (16000, 24000)
+LIVE_MODEL_NATIVE_INPUT_RATE = 16000
+DEFAULT_INPUT_SAMPLE_RATE = 24000
+DEFAULT_INPUT_FORMAT = "pcm16"
+
+_SAMPLE_WIDTH = {"pcm16": 2, "float32": 4}
+
+
+def select_model_input_rate(source_rate: int) -> int:
+    if source_rate in LIVE_MODEL_INPUT_RATES:
+        return source_rate
+    return LIVE_MODEL_NATIVE_INPUT_RATE
+
+
+class PcmConverter:
+    """Convert client capture audio to the int16 PCM rate sent to Gemini Live.
+
+    Downsampling uses a block average over ``source_rate / target_rate``
+    samples, which doubles as the anti-alias filter for speech. Partial samples
+    and blocks are carried between calls so frame boundaries do not matter.
+    """
+
+    def __init__(self, source_rate: int, source_format: str = DEFAULT_INPUT_FORMAT, target_rate: int | None = None) -> None:
+        if source_rate not in LIVE_INPUT_SAMPLE_RATES:
+            raise ValueError(f"Unsupported input sample rate: {source_rate}")
+        if source_format not in LIVE_INPUT_FORMATS:
+            raise ValueError(f"Unsupported input format: {source_format}")
+        target = target_rate or select_model_input_rate(source_rate)
+        if target > source_rate or source_rate % target:
+            raise ValueError(f"Cannot resample {source_rate} Hz to {target} Hz")
+        self.source_rate = source_rate
+        self.source_format = source_format
+        self.target_rate = target
+        self._factor = source_rate // target
+        self._width = _SAMPLE_WIDTH[source_format]
+        self._partial = b""
+        self._pending: list[float] = []
+
+    @property
+    def passthrough(self) -> bool:
+        return self.source_format == "pcm16" and self._factor == 1
+
+    def convert(self, chunk: bytes) -> bytes:
+        if self.passthrough:
+            return chunk
+        data = self._partial + chunk if self._partial else chunk
+        usable = len(data) - (len(data) % self._width)
+        self._partial = data[usable:]
+        if not usable:
+            return b""
+        if np is not None:
+            return self._convert_numpy(data, usable)
+        return self._convert_array(data, usable)
+
+    def _convert_numpy(self, data: bytes, usable: int) -> bytes:
+        if self.source_format == "float32":
+            samples = np.frombuffer(data, dtype="<f4", count=usable // 4) * 32767.0
+        else:
+            samples = np.frombuffer(data, dtype="<i2", count=usable // 2).astype(np.float32)
+        if self._factor > 1:
+            if self._pending:
+                samples = np.concatenate((np.asarray(self._pending, dtype=np.float32), samples))
+            whole = samples.size - samples.size % self._factor
+            self._pending = samples[whole:].tolist()
+            samples = samples[:whole].reshape(-1, self._factor).mean(axis=1)
+        return np.clip(np.rint(samples), -32768, 32767).astype("<i2").tobytes()
+
+    def _convert_array(self, data: bytes, usable: int) -> bytes:
+        decoded = array("f" if self.source_format == "float32" else "h")
+        decoded.frombytes(data[:usable])
+        if sys.byteorder == "big":
+            decoded.byteswap()
+        if self.source_format == "float32":
+            samples = [value * 32767.0 for value in decoded]
+        else:
+            samples = decoded.tolist()
+        factor = self._factor
+        if factor > 1:
+            samples = self._pending + samples
+            whole = len(samples) - len(samples) % factor
+            self._pending = list(samples[whole:])
+            samples = [sum(samples[index:index + factor]) / factor for index in range(0, whole, factor)]
+        encoded = array("h", (max(-32768, min(32767, round(value))) for value in samples))
+        if sys.byteorder == "big":
+            encoded.byteswap()
+        return encoded.tobytes()
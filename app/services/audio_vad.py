@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+import math
+from operator import mul
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+VAD_THRESHOLD_DBFS = -45.0
+VAD_HANGOVER_MS = 400
+VAD_PREROLL_MS = 200
+VAD_ZCR_MAX = 0.35
+# Frames this far above the threshold count as speech whatever their zero-crossing rate.
+VAD_LOUD_FACTOR = 4.0
+PCM16_FULL_SCALE = 32768.0
+
+
+def dbfs_to_rms(dbfs: float) -> float:
+    return 10 ** (dbfs / 20)
+
+
+def frame_energy(pcm: bytes) -> tuple[float, float]:
+    """Return (rms, zero-crossing rate) for little-endian int16 PCM, rms scaled to 0..1."""
+    usable = len(pcm) - (len(pcm) % 2)
+    if usable < 4:
+        return 0.0, 0.0
+    if np is not None:
+        samples = np.frombuffer(pcm, dtype="<i2", count=usable // 2).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples * samples))) / PCM16_FULL_SCALE
+        negative = np.signbit(samples)
+        zcr = float(np.count_nonzero(negative[1:] != negative[:-1])) / (samples.size - 1)
+        return rms, zcr
+    samples = array("h")
+    samples.frombytes(pcm[:usable])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    count = len(samples)
+    rms = math.sqrt(sum(map(mul, samples, samples)) / count) / PCM16_FULL_SCALE
+    crossings = sum(1 for left, right in zip(samples, samples[1:]) if (left < 0) != (right < 0))
+    return rms, crossings / (count - 1)
+
+
+class EnergyVad:
+    """Gate int16 PCM frames on energy so long silences never leave the server.
+
+    Speech frames are forwarded together with up to ``preroll_ms`` of the audio
+    that preceded them, and forwarding continues for ``hangover_ms`` after the
+    last speech frame so word endings and short pauses are not clipped.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        *,
+        threshold_dbfs: float = VAD_THRESHOLD_DBFS,
+        hangover_ms: int = VAD_HANGOVER_MS,
+        preroll_ms: int = VAD_PREROLL_MS,
+        zcr_max: float = VAD_ZCR_MAX
+    ) -> None:
+        self._bytes_per_ms = sample_rate * 2 / 1000
+        self._threshold = dbfs_to_rms(threshold_dbfs)
+        self._hangover_ms = hangover_ms
+        self._preroll_bytes = int(preroll_ms * self._bytes_per_ms)
+        self._zcr_max = zcr_max
+        self._preroll: deque[bytes] = deque()
+        self._preroll_size = 0
+        self._hangover_left_ms = 0.0
+        self.frames_in = 0
+        self.frames_forwarded = 0
+        self.bytes_in = 0
+        self.bytes_forwarded = 0
+
+    def is_speech(self, pcm: bytes) -> bool:
+        rms, zcr = frame_energy(pcm)
+        if rms < self._threshold:
+            return False
+        return zcr <= self._zcr_max or rms >= self._threshold * VAD_LOUD_FACTOR
+
+    def process(self, pcm: bytes) -> list[bytes]:
+        """Return the frames to forward upstream for one inbound frame (possibly none)."""
+        self.frames_in += 1
+        self.bytes_in += len(pcm)
+        if self.is_speech(pcm):
+            forwarded = list(self._preroll)
+            forwarded.append(pcm)
+            self._preroll.clear()
+            self._preroll_size = 0
+            self._hangover_left_ms = self._hangover_ms
+        elif self._hangover_left_ms > 0:
+            forwarded = [pcm]
+            self._hangover_left_ms -= len(pcm) / self._bytes_per_ms
+        else:
+            self._remember(pcm)
+            return []
+        self.frames_forwarded += len(forwarded)
+        self.bytes_forwarded += sum(len(frame) for frame in forwarded)
+        return forwarded
+
+    @property
+    def suppressed_pct(self) -> float:
+        if not self.bytes_in:
+            return 0.0
+        return round(100 * (self.bytes_in - self.bytes_forwarded) / self.bytes_in, 1)
+
+    def _remember(self, pcm: bytes) -> None:
+        if self._preroll_bytes <= 0:
+            return
+        self._preroll.append(pcm)
+        self._preroll_size += len(pcm)
+        while self._preroll and self._preroll_size - len(self._preroll[0]) >= self._preroll_bytes:
+            self._preroll_size -= len(self._preroll.popleft())
@@ -0,0 +1,203 @@
+"""In-process stand-in for the Gemini Live client, used for offline load and soak tests.
+
+Enabled with GEMINI_LIVE_FAKE=1. It mirrors the surface GeminiLiveBridge relies on:
+``client.aio.live.connect(...)`` as an async context manager, ``send_realtime_input``,
+``send`` and a continuous ``receive()`` stream of transcription, audio, turn and
+resumption events, with configurable latency and failure injection.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import itertools
+import random
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+
+from ..settings import AppSettings, load_settings
+
+
+FAKE_LIVE_OUTPUT_RATE = 24000
+FAKE_LIVE_REPLY_AUDIO_MS = 1200
+FAKE_LIVE_CHUNK_MS = 100
+FAKE_LIVE_REPLY = "Thanks, that is helpful. Can you walk me through the result you measured?"
+
+_handles = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class FakeLiveConfig:
+    connect_ms: int = 80
+    response_ms: int = 400
+    failure_rate: float = 0.0
+    drop_rate: float = 0.0
+    unsupported_models: tuple[str, ...] = ()
+    reply_audio_ms: int = FAKE_LIVE_REPLY_AUDIO_MS
+    chunk_ms: int = FAKE_LIVE_CHUNK_MS
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> "FakeLiveConfig":
+        return cls(
+            connect_ms=settings.live_fake_connect_ms,
+            response_ms=settings.live_fake_response_ms,
+            failure_rate=settings.live_fake_failure_rate,
+            drop_rate=settings.live_fake_drop_rate,
+            unsupported_models=settings.live_fake_unsupported_models
+        )
+
+
+def fake_live_client() -> "FakeLiveClient | None":
+    settings = load_settings()
+    if not settings.live_fake_enabled:
+        return None
+    return FakeLiveClient(FakeLiveConfig.from_settings(settings))
+
+
+def _response(**server_content: Any) -> SimpleNamespace:
+    fields = {
+        "input_transcription": None,
+        "output_transcription": None,
+        "model_turn": None,
+        "turn_complete": False,
+        "interrupted": False,
+        "generation_complete": False,
+        "session_resumption_update": None
+    }
+    fields.update(server_content)
+    return SimpleNamespace(server_content=SimpleNamespace(**fields))
+
+
+class FakeLiveSession:
+    def __init__(self, config: FakeLiveConfig, model: str, live_config: dict | None, rng: random.Random) -> None:
+        self.model = model
+        self._config = config
+        self._rng = rng
+        self._resumable = bool((live_config or {}).get("session_resumption") is not None)
+        self.resume_handle = ((live_config or {}).get("session_resumption") or {}).get("handle")
+        self._events: asyncio.Queue = asyncio.Queue()
+        self._reply_task: asyncio.Task | None = None
+        self._turn_bytes = 0
+        self._closed = False
+        self.audio_bytes = 0
+        self.audio_frames = 0
+        self.turns = 0
+        self.text_inputs = 0
+
+    async def send_realtime_input(self, **kwargs: Any) -> None:
+        if self._closed:
+            raise RuntimeError("Fake live session is closed.")
+        audio = kwargs.get("audio")
+        if audio is not None:
+            size = len(getattr(audio, "data", b"") or b"")
+            self.audio_bytes += size
+            self.audio_frames += 1
+            self._turn_bytes += size
+        if kwargs.get("activity_start") is not None:
+            if self._reply_task and not self._reply_task.done():
+                self._reply_task.cancel()
+                self._events.put_nowait(_response(interrupted=True))
+            self._turn_bytes = 0
+        if kwargs.get("activity_end") is not None:
+            heard = f"Candidate answer with {self._turn_bytes} bytes of audio."
+            self._start_reply(heard)
+
+    async def send(self, input: Any = None, **kwargs: Any) -> None:
+        if self._closed:
+            raise RuntimeError("Fake live session is closed.")
+        self.text_inputs += 1
+        self._start_reply(None)
+
+    async def receive(self) -> AsyncIterator[SimpleNamespace]:
+        while True:
+            event = await self._events.get()
+            if event is None:
+                return
+            yield event
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._reply_task and not self._reply_task.done():
+            self._reply_task.cancel()
+        self._events.put_nowait(None)
+
+    def _start_reply(self, heard: str | None) -> None:
+        if self._reply_task and not self._reply_task.done():
+            self._reply_task.cancel()
+        self._reply_task = asyncio.create_task(self._reply(heard))
+
+    async def _reply(self, heard: str | None) -> None:
+        try:
+            if heard:
+                self._events.put_nowait(_response(input_transcription=SimpleNamespace(text=heard)))
+            await asyncio.sleep(self._config.response_ms / 1000)
+            if self._config.drop_rate and self._rng.random() < self._config.drop_rate:
+                await self.close()
+                return
+            chunk_bytes = FAKE_LIVE_OUTPUT_RATE * 2 * self._config.chunk_ms // 1000
+            chunks = max(1, self._config.reply_audio_ms // self._config.chunk_ms)
+            words = FAKE_LIVE_REPLY.split()
+            for index in range(chunks):
+                text = " ".join(words[len(words) * index // chunks:len(words) * (index + 1) // chunks])
+                part = SimpleNamespace(
+                    text=None,
+                    inline_data=SimpleNamespace(data=bytes(chunk_bytes), mime_type=f"audio/pcm;rate={FAKE_LIVE_OUTPUT_RATE}")
+                )
+                self._events.put_nowait(
+                    _response(
+                        output_transcription=SimpleNamespace(text=text) if text else None,
+                        model_turn=SimpleNamespace(parts=[part])
+                    )
+                )
+                # Audio is produced roughly in real time, like the live model.
+                await asyncio.sleep(self._config.chunk_ms / 1000)
+            self.turns += 1
+            self._events.put_nowait(_response(turn_complete=True))
+            if self._resumable:
+                self._events.put_nowait(
+                    _response(
+                        session_resumption_update=SimpleNamespace(new_handle=f"fake-handle-{next(_handles)}", resumable=True)
+                    )
+                )
+        except asyncio.CancelledError:
+            return
+
+
+class _FakeConnection:
+    def __init__(self, client: "FakeLiveClient", model: str, config: dict | None) -> None:
+        self._client = client
+        self._model = model
+        self._config = config
+        self._session: FakeLiveSession | None = None
+
+    async def __aenter__(self) -> FakeLiveSession:
+        fake = self._client.config
+        await asyncio.sleep(fake.connect_ms / 1000)
+        if self._model in fake.unsupported_models:
+            raise RuntimeError(f"models/{self._model} is not found for API version v1beta, or is not supported for bidiGenerateContent.")
+        if fake.failure_rate and self._client.rng.random() < fake.failure_rate:
+            raise RuntimeError("Fake live connect failure injected.")
+        self._session = FakeLiveSession(fake, self._model, self._config, self._client.rng)
+        self._client.sessions.append(self._session)
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
+class _FakeLive:
+    def __init__(self, client: "FakeLiveClient") -> None:
+        self._client = client
+
+    def connect(self, *, model: str, config: dict | None = None) -> _FakeConnection:
+        return _FakeConnection(self._client, model, config)
+
+
+class FakeLiveClient:
+    def __init__(self, config: FakeLiveConfig | None = None, seed: int | None = None) -> None:
+        self.config = config or FakeLiveConfig()
+        self.rng = random.Random(seed)
+        self.sessions: list[FakeLiveSession] = []
+        self.aio = SimpleNamespace(live=_FakeLive(self))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 import re
 import time
 from typing import Any
@@ -11,6 +13,9 @@ from ..logging_config import get_logger, short_id
 logger = get_logger()
 
 _GA4_COLLECT_URL = "https://www.google-analytics.com/mp/collect"
+GA4_BATCH_MAX_EVENTS = 25
+GA4_QUEUE_SIZE = 5000
+GA4_TIMEOUT_S = 2.5
 _NAME_PATTERN = re.compile(r"[^a-zA-Z0-9_]")
 
 
@@ -31,54 +36,201 @@ def _coerce_param(value: Any):
     return str(value)
 
 
-async def send_ga4_event(
-    *,
-    measurement_id: str,
-    api_secret: str,
-    client_id: str,
-    user_id: str | None,
-    event_name: str,
-    params: dict[str, Any] | None = None,
-    timeout_s: float = 2.5
-) -> None:
-    if not measurement_id or not api_secret or not client_id or not event_name:
-        return
-
-    normalized_name = _normalize_name(event_name, fallback="client_event")
+def build_ga4_event(event_name: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
     payload_params = {"engagement_time_msec": 1, "session_id": int(time.time())}
     for key, value in (params or {}).items():
         if value is None:
             continue
-        normalized_key = _normalize_name(key, fallback="param", limit=40)
-        payload_params[normalized_key] = _coerce_param(value)
-
-    payload: dict[str, Any] = {
-        "client_id": client_id,
-        "events": [{"name": normalized_name, "params": payload_params}],
-    }
-    if user_id:
-        payload["user_id"] = user_id
-
-    url = f"{_GA4_COLLECT_URL}?measurement_id={measurement_id}&api_secret={api_secret}"
-    try:
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
+        payload_params[_normalize_name(key, fallback="param", limit=40)] = _coerce_param(value)
+    return {"name": _normalize_name(event_name, fallback="client_event"), "params": payload_params}
+
+
+class Ga4Dispatcher:
+    """Queues Measurement Protocol events and posts them in batches from a background task.
+
+    ``enqueue`` never waits on the network: it drops (and counts) events when the
+    queue is full. The flush loop groups pending events by client and sends up to
+    ``GA4_BATCH_MAX_EVENTS`` per request over one pooled ``httpx.AsyncClient``.
+    Until ``start`` runs nothing drains the queue, so it keeps only the newest
+    ``max_queue`` events for a manual ``flush``.
+    """
+
+    def __init__(
+        self,
+        *,
+        collect_url: str = _GA4_COLLECT_URL,
+        max_queue: int = GA4_QUEUE_SIZE,
+        batch_size: int = GA4_BATCH_MAX_EVENTS,
+        timeout_s: float = GA4_TIMEOUT_S
+    ) -> None:
+        self.collect_url = collect_url
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.timeout_s = timeout_s
+        self._pending: deque[tuple[tuple[str, str, str, str | None], dict[str, Any]]] = deque()
+        self._client: httpx.AsyncClient | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._stopping = False
+        self._warned_not_started = False
+        self._dropped_since_flush = 0
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+
+    def enqueue(
+        self,
+        *,
+        measurement_id: str,
+        api_secret: str,
+        client_id: str,
+        user_id: str | None,
+        event_name: str,
+        params: dict[str, Any] | None = None
+    ) -> bool:
+        if not measurement_id or not api_secret or not client_id or not event_name:
+            return False
+        if not self.running:
+            if not self._warned_not_started:
+                self._warned_not_started = True
+                logger.warning("event=ga4_forward status=not_started queue_max=%s", self.max_queue)
+            if self.max_queue <= 0:
+                self.dropped += 1
+                return False
+            while len(self._pending) >= self.max_queue:
+                # Nothing is draining: evict the oldest so the queue holds the most recent events.
+                self._pending.popleft()
+                self.dropped += 1
+                self._dropped_since_flush += 1
+        elif len(self._pending) >= self.max_queue:
+            self.dropped += 1
+            self._dropped_since_flush += 1
+            return False
+        self._pending.append(((measurement_id, api_secret, client_id, user_id), build_ga4_event(event_name, params)))
+        self.enqueued += 1
+        if self._loop is not None and self._wake is not None and len(self._pending) >= self.batch_size:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "depth": len(self._pending),
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "batches": self.batches,
+        }
+
+    def reset(self) -> None:
+        self._pending.clear()
+        self._warned_not_started = False
+        self._dropped_since_flush = 0
+        self.enqueued = self.sent = self.failed = self.dropped = self.batches = 0
+
+    def start(self, interval_seconds: float, max_queue: int | None = None) -> None:
+        if max_queue is not None:
+            self.max_queue = max_queue
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._client = httpx.AsyncClient(timeout=self.timeout_s)
+        self._task = asyncio.create_task(self._run(interval_seconds))
+
+    async def stop(self) -> None:
+        """Stops the flush loop, sends whatever is still queued and closes the pooled client.
+
+        The loop is asked to exit rather than cancelled, so a batch it has already
+        taken off the queue is still posted.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            self._stopping = True
+            if self._wake is not None:
+                self._wake.set()
+            await task
+        try:
+            await self.flush()
+        finally:
+            client, self._client = self._client, None
+            self._loop = self._wake = None
+            if client is not None:
+                await client.aclose()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def flush(self) -> int:
+        """Sends every queued event now; returns how many the collector accepted."""
+        groups: dict[tuple[str, str, str, str | None], list[dict[str, Any]]] = {}
+        while self._pending:
+            key, event = self._pending.popleft()
+            groups.setdefault(key, []).append(event)
+        dropped, self._dropped_since_flush = self._dropped_since_flush, 0
+        if dropped:
+            logger.warning("event=ga4_forward status=dropped events=%s queue_max=%s", dropped, self.max_queue)
+        if not groups:
+            return 0
+        if self._client is not None:
+            return await self._send_groups(self._client, groups)
+        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
+            return await self._send_groups(client, groups)
+
+    async def _send_groups(self, client: httpx.AsyncClient, groups) -> int:
+        accepted = 0
+        for (measurement_id, api_secret, client_id, user_id), events in groups.items():
+            url = f"{self.collect_url}?measurement_id={measurement_id}&api_secret={api_secret}"
+            for index in range(0, len(events), self.batch_size):
+                batch = events[index:index + self.batch_size]
+                payload: dict[str, Any] = {"client_id": client_id, "events": batch}
+                if user_id:
+                    payload["user_id"] = user_id
+                if await self._post(client, url, payload, user_id):
+                    accepted += len(batch)
+        if accepted:
+            logger.info("event=ga4_forward status=sent events=%s clients=%s", accepted, len(groups))
+        return accepted
+
+    async def _post(self, client: httpx.AsyncClient, url: str, payload: dict[str, Any], user_id: str | None) -> bool:
+        count = len(payload["events"])
+        self.batches += 1
+        try:
             response = await client.post(url, json=payload)
+        except Exception:
+            self.failed += count
+            logger.exception(
+                "event=ga4_forward status=exception events=%s user_id=%s", count, short_id(user_id)
+            )
+            return False
         if response.status_code >= 400:
+            self.failed += count
             logger.warning(
-                "event=ga4_forward status=error code=%s event_type=%s user_id=%s",
+                "event=ga4_forward status=error code=%s events=%s user_id=%s",
                 response.status_code,
-                normalized_name,
+                count,
                 short_id(user_id)
             )
-            return
-        logger.info(
-            "event=ga4_forward status=sent event_type=%s user_id=%s",
-            normalized_name,
-            short_id(user_id)
-        )
-    except Exception:
-        logger.exception(
-            "event=ga4_forward status=exception event_type=%s user_id=%s",
-            normalized_name,
-            short_id(user_id)
-        )
+            return False
+        self.sent += count
+        return True
+
+    async def _run(self, interval_seconds: float) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("event=ga4_forward status=error reason=flush")
+
+
+ga4_dispatcher = Ga4Dispatcher()
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import base64
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 import re
+import time
 from typing import Any, Awaitable, Callable
 import os
 
@@ -16,7 +18,12 @@ except ImportError as exc:
     types = None
     _GENAI_IMPORT_ERROR = exc
 
+from .fake_live import fake_live_client
+from .live_auth_tokens import auth_token_cache
+from .live_latency import LiveLatencyRecorder
+from .metrics import ws_audio_out_bytes
 from .store import store
+from .tracing import detached, span
 from ..logging_config import get_logger, short_id
 
 
@@ -44,11 +51,11 @@ QUESTION_WORDS = re.compile(
     re.IGNORECASE
 )
 
-REHYDRATE_MAX_TURNS = 8
-REHYDRATE_MAX_TEXT = 240
 COACH_FLUSH_DELAY = 0.8
+CANDIDATE_FLUSH_DELAY = 1.2
 QUESTION_OVERLAP_THRESHOLD = 0.45
 QUESTION_OVERLAP_MIN_TOKENS = 8
+QUESTION_MATCHER_CACHE_SIZE = 256
 
 
 def _normalize_question(text: str) -> str:
@@ -72,19 +79,6 @@ def _question_overlap_ratio(text: str, question: str) -> float:
     return matches / len(tokens)
 
 
-def _question_overlap_match(text: str, question: str) -> bool:
-    tokens = _tokenize(question)
-    if not tokens:
-        return False
-    text_tokens = set(_tokenize(text))
-    if not text_tokens:
-        return False
-    matches = sum(1 for token in tokens if token in text_tokens)
-    if matches >= min(QUESTION_OVERLAP_MIN_TOKENS, len(tokens)):
-        return True
-    return (matches / len(tokens)) >= QUESTION_OVERLAP_THRESHOLD
-
-
 def _looks_like_question(text: str) -> bool:
     if not text:
         return False
@@ -93,40 +87,76 @@ def _looks_like_question(text: str) -> bool:
     return QUESTION_WORDS.search(text) is not None
 
 
+class QuestionMatcher:
+    def __init__(self, questions: list[str]) -> None:
+        self.questions = list(questions)
+        self._normalized = [_normalize_question(question) for question in self.questions]
+        self._token_totals: list[int] = []
+        self._token_index: dict[str, list[tuple[int, int]]] = {}
+        for index, normalized in enumerate(self._normalized):
+            tokens = _tokenize(normalized)
+            self._token_totals.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                self._token_index.setdefault(token, []).append((index, count))
+
+    def is_current(self, questions: list[str]) -> bool:
+        return self.questions == questions
+
+    def match(self, text: str, max_index: int | None = None) -> int | None:
+        if max_index is None:
+            max_index = len(self.questions) - 1
+        if max_index < 0:
+            return None
+        if not _looks_like_question(text):
+            return None
+        normalized_text = _normalize_question(text)
+        if not normalized_text:
+            return None
+        hits: dict[int, int] = {}
+        for token in set(_tokenize(normalized_text)):
+            for index, count in self._token_index.get(token, ()):
+                if index <= max_index:
+                    hits[index] = hits.get(index, 0) + count
+        overlap_index = None
+        for index, matches in hits.items():
+            total = self._token_totals[index]
+            if matches >= min(QUESTION_OVERLAP_MIN_TOKENS, total) or (matches / total) >= QUESTION_OVERLAP_THRESHOLD:
+                if overlap_index is None or index < overlap_index:
+                    overlap_index = index
+        limit = max_index if overlap_index is None else overlap_index - 1
+        for index in range(min(limit, len(self._normalized) - 1) + 1):
+            normalized_question = self._normalized[index]
+            if normalized_question and normalized_question in normalized_text:
+                return index
+        return overlap_index
+
+
+_QUESTION_MATCHERS: OrderedDict[tuple[str, str], QuestionMatcher] = OrderedDict()
+
+
+def _question_matcher_for(record) -> QuestionMatcher:
+    key = (record.user_id, record.interview_id)
+    matcher = _QUESTION_MATCHERS.get(key)
+    if matcher is None or not matcher.is_current(record.questions):
+        matcher = QuestionMatcher(record.questions)
+        _QUESTION_MATCHERS[key] = matcher
+        while len(_QUESTION_MATCHERS) > QUESTION_MATCHER_CACHE_SIZE:
+            _QUESTION_MATCHERS.popitem(last=False)
+    else:
+        _QUESTION_MATCHERS.move_to_end(key)
+    return matcher
+
+
 def _match_repeat_question(text: str, questions: list[str], max_index: int | None) -> int | None:
     if max_index is None or max_index < 0:
         return None
-    if not _looks_like_question(text):
-        return None
-    normalized_text = _normalize_question(text)
-    if not normalized_text:
-        return None
-    for index, question in enumerate(questions):
-        if index > max_index:
-            break
-        normalized_question = _normalize_question(question)
-        if not normalized_question:
-            continue
-        if normalized_question in normalized_text:
-            return index
-        if _question_overlap_match(normalized_text, normalized_question):
-            return index
-    return None
+    return QuestionMatcher(questions).match(text, max_index)
 
 
 def _match_question_index(text: str, questions: list[str]) -> int | None:
     if not questions:
         return None
-    return _match_repeat_question(text, questions, len(questions) - 1)
-
-
-def _truncate_text(value: str, limit: int) -> str:
-    if not value:
-        return ""
-    cleaned = value.strip()
-    if len(cleaned) <= limit:
-        return cleaned
-    return f"{cleaned[:limit].rstrip()}..."
+    return QuestionMatcher(questions).match(text)
 
 
 def _merge_text(previous: str, incoming: str) -> str:
@@ -147,44 +177,6 @@ def _merge_text(previous: str, incoming: str) -> str:
     return f"{prev} {next_text}"
 
 
-def _build_rehydrate_prompt(record, transcript_tail: list[dict]) -> str | None:
-    if not record or not transcript_tail:
-        return None
-    lines = []
-    for entry in transcript_tail:
-        role = entry.get("role", "system")
-        text = _truncate_text(entry.get("text", ""), REHYDRATE_MAX_TEXT)
-        if not text:
-            continue
-        lines.append(f"{role}: {text}")
-    if not lines:
-        return None
-    asked_index = record.asked_question_index
-    current_question = ""
-    next_question = ""
-    if asked_index is not None and 0 <= asked_index < len(record.questions):
-        current_question = record.questions[asked_index]
-        next_index = asked_index + 1
-        if 0 <= next_index < len(record.questions):
-            next_question = record.questions[next_index]
-    last_role = transcript_tail[-1].get("role", "system")
-    return (
-        "We got disconnected. Continue the conversation without repeating prior questions.\n"
-        f"Last speaker: {last_role}\n"
-        "Recent transcript:\n"
-        f"{chr(10).join(lines)}\n\n"
-        f"Current question index: {asked_index if asked_index is not None else 'none'}\n"
-        f"Current question: {current_question or 'none'}\n"
-        f"Next question: {next_question or 'none'}\n\n"
-        "Rules:\n"
-        "- If the candidate was mid-answer, let them finish.\n"
-        "- If the candidate's answer was brief or unclear, ask one clarifying follow-up.\n"
-        "- Do not repeat any questions already asked.\n"
-        "- Keep responses concise and friendly."
-    )
-
-
-
 def _friendly_error(exc: Exception) -> str:
     message = str(exc)
     lowered = message.lower()
@@ -193,6 +185,32 @@ def _friendly_error(exc: Exception) -> str:
     return message
 
 
+def _turn_signal(server_content: Any) -> str | None:
+    for name in ("interrupted", "turn_complete", "generation_complete"):
+        if getattr(server_content, name, None):
+            return name
+    return None
+
+
+def _resume_state_issue(record, max_age_seconds: int, now: datetime | None = None) -> str | None:
+    if not record.live_resume_handle:
+        return "missing_handle"
+    if record.live_resume_resumable is False:
+        return "not_resumable"
+    if max_age_seconds <= 0:
+        return None
+    try:
+        updated_at = datetime.fromisoformat(record.live_resume_updated_at or "")
+    except ValueError:
+        return "missing_timestamp"
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    age_seconds = ((now or datetime.now(timezone.utc)) - updated_at).total_seconds()
+    if age_seconds > max_age_seconds:
+        return "expired"
+    return None
+
+
 def _parse_sample_rate(mime_type: str | None, fallback: int) -> int:
     if not mime_type:
         return fallback
@@ -217,13 +235,17 @@ class GeminiLiveBridge:
         output_sample_rate: int = 24000,
         system_prompt: str | None = None,
         resume_enabled: bool = False,
-        resume_requested: bool = False
+        resume_requested: bool = False,
+        resume_handoff: bool = False,
+        resume_max_age_s: int = 0,
+        metrics_enabled: bool = False
     ) -> None:
-        if genai is None:
+        fake_client = fake_live_client()
+        if genai is None and fake_client is None:
             raise RuntimeError("google-genai is required for Gemini Live.")
         self._api_key = api_key
-        self._client = genai.Client(api_key=api_key)
-        self._token_client = None
+        self._fake = fake_client is not None
+        self._client = fake_client or genai.Client(api_key=api_key)
         self._model = model
         self._interview_id = interview_id
         self._send_json = send_json
@@ -233,9 +255,13 @@ class GeminiLiveBridge:
         self._system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
         self._resume_enabled = resume_enabled
         self._resume_requested = resume_requested
+        self._resume_handoff = resume_handoff
+        self._resume_max_age_s = resume_max_age_s
 
         self._session_cm = None
         self._session = None
+        self._resume_token: str | None = None
+        self._should_rehydrate = False
         self._audio_queue: asyncio.Queue[LiveAudioChunk] = asyncio.Queue(maxsize=LIVE_AUDIO_QUEUE_MAXSIZE)
         self._tasks: list[asyncio.Task] = []
         self._closed = False
@@ -243,8 +269,27 @@ class GeminiLiveBridge:
         self._coach_buffer = ""
         self._coach_flush_task: asyncio.Task | None = None
         self._coach_lock = asyncio.Lock()
+        self._coach_last_fragment_at: float | None = None
+        self._candidate_buffer = ""
+        self._candidate_timestamp: str | None = None
+        self._candidate_flush_task: asyncio.Task | None = None
+        self._candidate_lock = asyncio.Lock()
+        self._metrics_enabled = metrics_enabled
+        self.latency = LiveLatencyRecorder()
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @property
+    def input_sample_rate(self) -> int:
+        return self._input_sample_rate
 
     async def connect(self) -> None:
+        await self.open()
+        await self.activate()
+
+    async def open(self) -> None:
         logger.info(
             "event=gemini_live_call status=start requested_model=%s interview_id=%s user_id=%s",
             self._model,
@@ -258,26 +303,36 @@ class GeminiLiveBridge:
         resume_token = None
         requested_model = self._model
         if self._resume_enabled and record:
+            resume_issue = None
             if self._resume_requested:
+                # Only a handoff validates the persisted state; on one node a handle stored with
+                # resumable=False (connection dropped mid-generation) is still the latest usable one.
+                if self._resume_handoff:
+                    resume_issue = _resume_state_issue(record, self._resume_max_age_s)
+                elif not record.live_resume_handle:
+                    resume_issue = "missing_handle"
+            if resume_issue:
+                logger.info(
+                    "event=gemini_live_resume status=skipped reason=%s interview_id=%s user_id=%s handoff=%s",
+                    resume_issue,
+                    short_id(self._interview_id),
+                    short_id(self._user_id),
+                    self._resume_handoff
+                )
+            elif self._resume_requested:
                 resume_handle = record.live_resume_handle
-                resume_token = record.live_resume_token
+                # After a handoff the stored token was minted on another node and may be past its
+                # new-session window; the handle is what carries the conversation, so mint locally.
+                resume_token = None if self._resume_handoff else record.live_resume_token
                 if record.live_model:
                     requested_model = record.live_model
             else:
                 store.clear_live_resume(self._interview_id, self._user_id)
 
         if self._resume_enabled and not resume_token:
-            resume_token = self._create_auth_token(requested_model)
-        if self._resume_enabled and resume_token:
-            store.set_live_resume_token(self._interview_id, resume_token, requested_model, self._user_id)
+            resume_token = await self._get_auth_token(requested_model)
 
         resume_attempted = bool(self._resume_requested and resume_handle and resume_token)
-        if self._resume_requested and not resume_handle:
-            logger.info(
-                "event=gemini_live_resume status=skipped reason=missing_handle interview_id=%s user_id=%s",
-                short_id(self._interview_id),
-                short_id(self._user_id)
-            )
         if self._resume_requested and resume_handle and not resume_token:
             logger.info(
                 "event=gemini_live_resume status=skipped reason=missing_token interview_id=%s user_id=%s",
@@ -294,13 +349,15 @@ class GeminiLiveBridge:
         should_rehydrate = not resume_attempted
         if resume_attempted:
             logger.info(
-                "event=gemini_live_resume status=start interview_id=%s user_id=%s",
+                "event=gemini_live_resume status=start interview_id=%s user_id=%s handoff=%s",
                 short_id(self._interview_id),
-                short_id(self._user_id)
+                short_id(self._user_id),
+                self._resume_handoff
             )
         try:
-            self._session_cm = connect_client.aio.live.connect(model=requested_model, config=config)
-            self._session = await self._session_cm.__aenter__()
+            with span("gemini_live_connect", model=requested_model, resume=resume_attempted):
+                self._session_cm = connect_client.aio.live.connect(model=requested_model, config=config)
+                self._session = await self._session_cm.__aenter__()
             if resume_attempted:
                 logger.info(
                     "event=gemini_live_resume status=complete interview_id=%s user_id=%s",
@@ -315,7 +372,8 @@ class GeminiLiveBridge:
                     short_id(self._user_id)
                 )
                 store.clear_live_resume(self._interview_id, self._user_id)
-                resume_token = self._create_auth_token(requested_model)
+                auth_token_cache.invalidate(self._api_key, requested_model, resume_token)
+                resume_token = await self._get_auth_token(requested_model)
                 config = self._build_live_config(input_language, output_language, None)
                 connect_client = self._build_connect_client(resume_token) if resume_token else self._client
                 self._session_cm = connect_client.aio.live.connect(model=requested_model, config=config)
@@ -343,11 +401,22 @@ class GeminiLiveBridge:
                 raise
 
         self._model = requested_model
-        self._tasks.append(asyncio.create_task(self._send_loop()))
-        self._tasks.append(asyncio.create_task(self._receive_loop()))
+        self._resume_token = resume_token
+        self._should_rehydrate = should_rehydrate
+
+    async def activate(self) -> None:
+        if self._resume_enabled and self._resume_token:
+            store.set_live_resume_token(self._interview_id, self._resume_token, self._model, self._user_id)
+        with detached():
+            self._tasks.append(asyncio.create_task(self._send_loop()))
+            self._tasks.append(asyncio.create_task(self._receive_loop()))
 
         await self._send_json({"type": "status", "state": "gemini-connected"})
-        self._rehydrating = await self._send_rehydrate_context() if should_rehydrate else False
+        if self._should_rehydrate:
+            with span("rehydrate"):
+                self._rehydrating = await self._send_rehydrate_context()
+        else:
+            self._rehydrating = False
         logger.info(
             "event=gemini_live_call status=complete requested_model=%s effective_model=%s interview_id=%s user_id=%s",
             self._model,
@@ -411,55 +480,28 @@ class GeminiLiveBridge:
         return None
 
     def _build_connect_client(self, token: str | None):
-        if not token or types is None:
+        if not token or types is None or self._fake:
             return self._client
         return genai.Client(
             api_key=token,
             http_options=types.HttpOptions(api_version="v1alpha")
         )
 
-    def _create_auth_token(self, model: str) -> str | None:
+    async def _get_auth_token(self, model: str) -> str | None:
         if not self._resume_enabled or types is None:
             return None
-        if self._token_client is None:
-            try:
-                self._token_client = genai.Client(
-                    api_key=self._api_key,
-                    http_options=types.HttpOptions(api_version="v1alpha")
-                )
-            except Exception:
-                logger.exception(
-                    "event=gemini_live_token status=error interview_id=%s user_id=%s",
-                    short_id(self._interview_id),
-                    short_id(self._user_id)
-                )
-                return None
-        try:
-            token = self._token_client.auth_tokens.create(
-                config=types.CreateAuthTokenConfig(uses=0)
-            )
-        except Exception:
-            logger.exception(
-                "event=gemini_live_token status=error interview_id=%s user_id=%s",
-                short_id(self._interview_id),
-                short_id(self._user_id)
-            )
-            return None
-        token_name = getattr(token, "name", None)
-        if not token_name:
+        if self._fake:
+            return "fake-live-token"
+        with span("auth_token", model=model):
+            token = await auth_token_cache.get(self._api_key, model)
+        if not token:
             logger.warning(
-                "event=gemini_live_token status=missing_name interview_id=%s user_id=%s",
+                "event=gemini_live_token status=unavailable interview_id=%s user_id=%s model=%s",
                 short_id(self._interview_id),
-                short_id(self._user_id)
+                short_id(self._user_id),
+                model
             )
-            return None
-        logger.info(
-            "event=gemini_live_token status=complete interview_id=%s user_id=%s model=%s",
-            short_id(self._interview_id),
-            short_id(self._user_id),
-            model
-        )
-        return token_name
+        return token
 
     async def send_audio(self, audio_bytes: bytes) -> None:
         if self._closed:
@@ -478,6 +520,10 @@ class GeminiLiveBridge:
         if self._closed or not self._session or not state:
             return
         lowered = state.lower()
+        if lowered == "start":
+            self.latency.activity_start()
+        elif lowered == "end":
+            self.latency.activity_end()
         try:
             if lowered == "start":
                 payload = types.ActivityStart() if types else {}
@@ -492,6 +538,8 @@ class GeminiLiveBridge:
                 short_id(self._user_id),
                 lowered
             )
+        if lowered == "end":
+            await self._flush_candidate_buffer_now()
 
     async def stop(self) -> None:
         if self._closed:
@@ -541,6 +589,7 @@ class GeminiLiveBridge:
                 await self._session_cm.__aexit__(None, None, None)
             except Exception:
                 pass
+        await self._flush_candidate_buffer_now()
         await self._flush_coach_buffer_now()
 
     async def _cancel_coach_flush(self) -> None:
@@ -549,7 +598,7 @@ class GeminiLiveBridge:
         self._coach_flush_task = None
         self._coach_buffer = ""
 
-    async def _flush_coach_buffer_now(self) -> None:
+    async def _flush_coach_buffer_now(self, trigger: str = "close") -> None:
         if not self._coach_buffer:
             await self._cancel_coach_flush()
             return
@@ -560,8 +609,69 @@ class GeminiLiveBridge:
                 self._coach_flush_task.cancel()
             self._coach_flush_task = None
         if text:
+            self._log_coach_flush(trigger, text)
             await self._emit_transcript_final("coach", text)
 
+    def _log_coach_flush(self, trigger: str, text: str) -> None:
+        last_fragment_at = self._coach_last_fragment_at
+        self._coach_last_fragment_at = None
+        latency_ms = int((time.perf_counter() - last_fragment_at) * 1000) if last_fragment_at else 0
+        logger.info(
+            "event=gemini_live_coach_flush status=complete interview_id=%s user_id=%s trigger=%s latency_ms=%s text_len=%s",
+            short_id(self._interview_id),
+            short_id(self._user_id),
+            trigger,
+            latency_ms,
+            len(text)
+        )
+
+    async def _queue_candidate_text(self, text: str) -> None:
+        if not text:
+            return
+        async with self._candidate_lock:
+            if not self._candidate_buffer:
+                self._candidate_timestamp = _timestamp()
+            self._candidate_buffer = _merge_text(self._candidate_buffer, text)
+            timestamp = self._candidate_timestamp
+            if self._candidate_flush_task and not self._candidate_flush_task.done():
+                self._candidate_flush_task.cancel()
+            self._candidate_flush_task = asyncio.create_task(self._flush_candidate_buffer())
+        await self._send_json(
+            {
+                "type": "transcript",
+                "role": "candidate",
+                "text": text,
+                "timestamp": timestamp,
+                "is_final": False
+            }
+        )
+
+    async def _flush_candidate_buffer(self) -> None:
+        try:
+            await asyncio.sleep(CANDIDATE_FLUSH_DELAY)
+        except asyncio.CancelledError:
+            return
+        async with self._candidate_lock:
+            text = self._candidate_buffer
+            timestamp = self._candidate_timestamp
+            self._candidate_buffer = ""
+            self._candidate_timestamp = None
+            self._candidate_flush_task = None
+        if text:
+            await self._emit_transcript_final("candidate", text, timestamp=timestamp)
+
+    async def _flush_candidate_buffer_now(self) -> None:
+        async with self._candidate_lock:
+            text = self._candidate_buffer
+            timestamp = self._candidate_timestamp
+            self._candidate_buffer = ""
+            self._candidate_timestamp = None
+            if self._candidate_flush_task and not self._candidate_flush_task.done():
+                self._candidate_flush_task.cancel()
+            self._candidate_flush_task = None
+        if text:
+            await self._emit_transcript_final("candidate", text, timestamp=timestamp)
+
     async def _send_loop(self) -> None:
         assert self._session is not None
         try:
@@ -570,7 +680,9 @@ class GeminiLiveBridge:
                 if types is None:
                     raise RuntimeError("google-genai types unavailable.")
                 blob = types.Blob(data=chunk.data, mime_type=chunk.mime_type)
+                start = time.perf_counter()
                 await self._session.send_realtime_input(audio=blob)
+                self.latency.upstream_send((time.perf_counter() - start) * 1000)
         except asyncio.CancelledError:
             return
         except Exception as exc:
@@ -618,16 +730,11 @@ class GeminiLiveBridge:
             await self._close_session(skip_task=asyncio.current_task())
 
     async def _send_rehydrate_context(self) -> bool:
-        record = store.get(self._interview_id, self._user_id)
-        if not record or not record.transcript:
-            return False
-        transcript_tail = list(record.transcript[-REHYDRATE_MAX_TURNS:])
-        prompt = _build_rehydrate_prompt(record, transcript_tail)
-        if not prompt or self._session is None:
+        snapshot = store.rehydrate_snapshot(self._interview_id, self._user_id)
+        if snapshot is None or self._session is None:
             return False
-        await self._send_json({"type": "status", "state": "thinking"})
         try:
-            await self._session.send(input=prompt)
+            await self._session.send(input=snapshot.prompt)
         except Exception:
             logger.exception(
                 "event=gemini_live_rehydrate status=error interview_id=%s user_id=%s",
@@ -635,11 +742,12 @@ class GeminiLiveBridge:
                 short_id(self._user_id)
             )
             return False
+        await self._send_json({"type": "status", "state": "thinking"})
         logger.info(
             "event=gemini_live_rehydrate status=complete interview_id=%s user_id=%s turns=%s",
             short_id(self._interview_id),
             short_id(self._user_id),
-            len(transcript_tail)
+            snapshot.turns
         )
         return True
 
@@ -648,6 +756,7 @@ class GeminiLiveBridge:
             return
         async with self._coach_lock:
             self._coach_buffer = _merge_text(self._coach_buffer, text)
+            self._coach_last_fragment_at = time.perf_counter()
             if self._coach_flush_task and not self._coach_flush_task.done():
                 self._coach_flush_task.cancel()
             self._coach_flush_task = asyncio.create_task(self._flush_coach_buffer())
@@ -662,6 +771,7 @@ class GeminiLiveBridge:
             self._coach_buffer = ""
             self._coach_flush_task = None
         if text:
+            self._log_coach_flush("timer", text)
             await self._emit_transcript_final("coach", text)
 
     async def _handle_response(self, response: Any) -> None:
@@ -696,6 +806,8 @@ class GeminiLiveBridge:
             await self._emit_transcript("candidate", input_transcription.text)
 
         model_turn = getattr(server_content, "model_turn", None)
+        if coach_text or (model_turn and getattr(model_turn, "parts", None)):
+            await self._flush_candidate_buffer_now()
         model_text = ""
         if model_turn and getattr(model_turn, "parts", None):
             for part in model_turn.parts:
@@ -716,33 +828,59 @@ class GeminiLiveBridge:
                 if audio_bytes:
                     await self._emit_audio(audio_bytes, getattr(inline_data, "mime_type", None))
 
+        if coach_text or model_text:
+            self.latency.coach_transcript()
         if coach_text:
             await self._emit_transcript("coach", coach_text)
         elif model_text:
             await self._emit_transcript("coach", model_text)
 
+        signal = _turn_signal(server_content)
+        if signal and self._coach_buffer:
+            await self._flush_coach_buffer_now(trigger=signal)
+        if signal in {"turn_complete", "interrupted"}:
+            await self._complete_latency_turn()
+
+    async def _complete_latency_turn(self) -> None:
+        turn = self.latency.turn_complete()
+        if turn is None or not self._metrics_enabled:
+            return
+        await self._send_json(
+            {
+                "type": "metrics",
+                "turn": turn,
+                "session": {"turns": self.latency.turns, **self.latency.summary()}
+            }
+        )
+
     async def _emit_transcript(self, role: str, text: str) -> None:
         if role == "coach":
             await self._queue_coach_text(text)
             return
+        if role == "candidate":
+            await self._queue_candidate_text(text)
+            return
         await self._emit_transcript_final(role, text)
 
-    async def _emit_transcript_final(self, role: str, text: str, *, skip_guard: bool = False) -> None:
+    async def _emit_transcript_final(
+        self,
+        role: str,
+        text: str,
+        *,
+        skip_guard: bool = False,
+        timestamp: str | None = None
+    ) -> None:
         if role == "coach" and not skip_guard:
             record = store.get(self._interview_id, self._user_id)
             if record:
                 current_index = record.asked_question_index
-                repeat_index = _match_repeat_question(
-                    text,
-                    list(record.questions),
-                    current_index
-                )
-                if repeat_index is not None and current_index is not None and repeat_index == current_index:
+                matched_index = _question_matcher_for(record).match(text)
+                if matched_index is not None and current_index is not None and matched_index == current_index:
                     logger.info(
                         "event=question_guard_repeat status=suppressed interview_id=%s user_id=%s index=%s asked_question_index=%s",
                         short_id(self._interview_id),
                         short_id(self._user_id),
-                        repeat_index,
+                        matched_index,
                         current_index
                     )
                     if self._session is not None:
@@ -758,7 +896,6 @@ class GeminiLiveBridge:
                     await self._send_json({"type": "status", "state": "thinking"})
                     await self._emit_transcript_final("coach", text, skip_guard=True)
                     return
-                matched_index = _match_question_index(text, list(record.questions))
                 if matched_index is not None and (current_index is None or matched_index > current_index):
                     try:
                         store.update_question_status(
@@ -787,13 +924,15 @@ class GeminiLiveBridge:
         entry = {
             "role": role,
             "text": text,
-            "timestamp": _timestamp()
+            "timestamp": timestamp or _timestamp()
         }
         store.append_transcript_entry(self._interview_id, entry, self._user_id)
         await self._send_json({"type": "transcript", **entry, "is_final": True})
 
     async def _emit_audio(self, audio_bytes: bytes, mime_type: str | None) -> None:
         sample_rate = _parse_sample_rate(mime_type, self._output_sample_rate)
+        self.latency.coach_audio(len(audio_bytes), sample_rate)
+        ws_audio_out_bytes.inc(len(audio_bytes))
         payload = {
             "type": "audio",
             "encoding": "pcm16",
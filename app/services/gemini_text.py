@@ -5,6 +5,8 @@ from typing import Any
 import time
 
 from ..logging_config import get_logger
+from .metrics import observe_model_call
+from .tracing import span
 
 try:
     from google import genai
@@ -32,6 +34,7 @@ def _friendly_text_error(model: str, exc: Exception) -> str:
     return message
 
 
+@span("gemini_text")
 def _call_gemini(api_key: str, model: str, prompt: str) -> str:
     if genai is None:
         raise RuntimeError("google-genai is required for Gemini text.")
@@ -52,6 +55,7 @@ def _call_gemini(api_key: str, model: str, prompt: str) -> str:
             effective_model,
             duration_ms
         )
+        observe_model_call("gemini", "text", model, "complete", start_time)
         logger.info(
             "event=text_model_call status=complete requested_model=%s effective_model=%s",
             model,
@@ -66,6 +70,7 @@ def _call_gemini(api_key: str, model: str, prompt: str) -> str:
             duration_ms,
             str(exc)
         )
+        observe_model_call("gemini", "text", model, "error", start_time)
         logger.exception("event=text_model_call status=error requested_model=%s", model)
         raise RuntimeError(_friendly_text_error(model, exc)) from exc
 
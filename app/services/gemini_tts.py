@@ -8,6 +8,8 @@ import wave
 import re
 
 from ..logging_config import get_logger
+from .metrics import observe_model_call
+from .tracing import in_context, span
 
 try:
     from google import genai
@@ -292,8 +294,8 @@ def _run_retry_with_parallel_fallback(
             parallel_fallback_on_retry=False
         )
 
-    primary_future = _HEDGE_TTS_EXECUTOR.submit(_retry_primary)
-    fallback_future = _HEDGE_TTS_EXECUTOR.submit(_fallback_chain)
+    primary_future = _HEDGE_TTS_EXECUTOR.submit(in_context("tts_hedge", _retry_primary))
+    fallback_future = _HEDGE_TTS_EXECUTOR.submit(in_context("tts_hedge", _fallback_chain))
     done, _ = wait({primary_future, fallback_future}, return_when=FIRST_COMPLETED)
     first = next(iter(done))
     second = fallback_future if first is primary_future else primary_future
@@ -320,6 +322,7 @@ def _run_retry_with_parallel_fallback(
             raise first_exc
 
 
+@span("gemini_tts")
 def generate_tts_audio(
     *,
     api_key: str,
@@ -376,6 +379,7 @@ def generate_tts_audio(
             effective_model,
             duration_ms
         )
+        observe_model_call("gemini", "tts", model, "complete", start_time)
         logger.info(
             "event=tts_model_call status=complete requested_model=%s effective_model=%s bytes=%s",
             model,
@@ -391,6 +395,7 @@ def generate_tts_audio(
             duration_ms,
             str(exc)
         )
+        observe_model_call("gemini", "tts", model, "error", start_time)
         logger.exception("event=tts_model_call status=error requested_model=%s", model)
         raise RuntimeError(_friendly_tts_error(model, exc)) from exc
 
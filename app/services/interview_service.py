@@ -16,6 +16,7 @@ from .live_context import build_live_system_prompt
 from .mock_data import MOCK_VOICE_REPLY, MOCK_VOICE_FEEDBACK, build_mock_tts_audio
 from .pii_redaction import redact_resume_pii
 from .store import store
+from .tracing import in_context, span
 from .pdf_service import build_study_guide_pdf, build_study_guide_text as build_study_guide_text_output
 
 
@@ -188,7 +189,7 @@ def _generate_tts_with_wait(
         audio_bytes, audio_mime, _ = generate_tts_audio_with_fallbacks(**kwargs)
         return audio_bytes, audio_mime
 
-    future = _TTS_EXECUTOR.submit(generate_tts_audio_with_fallbacks, **kwargs)
+    future = _TTS_EXECUTOR.submit(in_context("tts", generate_tts_audio_with_fallbacks), **kwargs)
     try:
         audio_bytes, audio_mime, _ = future.result(timeout=wait_ms / 1000)
         return audio_bytes, audio_mime
@@ -256,7 +257,7 @@ def _generate_openai_tts_with_wait(
     if wait_ms <= 0:
         return generate_openai_tts_audio(**kwargs)
 
-    future = _TTS_EXECUTOR.submit(generate_openai_tts_audio, **kwargs)
+    future = _TTS_EXECUTOR.submit(in_context("tts", generate_openai_tts_audio), **kwargs)
     try:
         return future.result(timeout=wait_ms / 1000)
     except FutureTimeout:
@@ -558,7 +559,8 @@ def run_voice_turn(
     if adapter.name == "gemini":
         if not getattr(adapter, "api_key", None):
             raise RuntimeError("GEMINI_API_KEY or GOOGLE_API_KEY is required for the Gemini adapter.")
-        system_prompt = build_live_system_prompt(record)
+        with span("prompt_build"):
+            system_prompt = build_live_system_prompt(record)
         coach_text = generate_coach_reply(
             api_key=adapter.api_key,
             model=text_model_override or adapter.settings.text_model,
@@ -601,7 +603,8 @@ def run_voice_turn(
                 tts_provider_override=tts_provider
             )
             if audio_bytes:
-                audio_payload = base64.b64encode(audio_bytes).decode("ascii")
+                with span("base64_encode", bytes=len(audio_bytes)):
+                    audio_payload = base64.b64encode(audio_bytes).decode("ascii")
         except Exception:
             logger.exception(
                 "event=voice_tts status=error interview_id=%s user_id=%s",
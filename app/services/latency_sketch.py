@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable
+
+
+SKETCH_RELATIVE_ACCURACY = 0.02
+LATENCY_WINDOWS = (("1m", 60), ("5m", 300), ("1h", 3600))
+FINE_SLOT_SECONDS = 10
+COARSE_SLOT_SECONDS = 60
+WINDOW_QUANTILES = (("p50_ms", 0.5), ("p90_ms", 0.9), ("p99_ms", 0.99))
+
+_GAMMA = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch; any quantile is within 2% of the true sample.
+
+    Buckets grow geometrically, so a sketch holds a few dozen counters for
+    latencies between 1 ms and a minute no matter how many samples it has seen.
+    """
+
+    __slots__ = ("buckets", "count", "zero_count", "max_ms")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.zero_count = 0
+        self.max_ms: float | None = None
+
+    def add(self, value_ms: float) -> None:
+        self.count += 1
+        if self.max_ms is None or value_ms > self.max_ms:
+            self.max_ms = value_ms
+        if value_ms < 1:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value_ms) / _LOG_GAMMA)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: QuantileSketch) -> None:
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.zero_count += other.zero_count
+        if other.max_ms is not None and (self.max_ms is None or other.max_ms > self.max_ms):
+            self.max_ms = other.max_ms
+
+    def quantile(self, quantile: float) -> float | None:
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = self.zero_count
+        if seen >= rank:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Midpoint of (gamma^(i-1), gamma^i], which keeps the relative error symmetric.
+                value = 2 * _GAMMA ** index / (_GAMMA + 1)
+                return min(value, self.max_ms) if self.max_ms is not None else value
+        return self.max_ms
+
+
+class _SlotRing:
+    """Sketches for consecutive fixed-width time slots, dropping slots older than ``keep``."""
+
+    def __init__(self, slot_seconds: int, keep: int) -> None:
+        self.slot_seconds = slot_seconds
+        self.keep = keep
+        self.slots: dict[int, QuantileSketch] = {}
+
+    def add(self, at: float, value_ms: float) -> None:
+        slot = int(at // self.slot_seconds)
+        sketch = self.slots.get(slot)
+        if sketch is None:
+            sketch = self.slots[slot] = QuantileSketch()
+            self._expire(slot)
+        sketch.add(value_ms)
+
+    def merged(self, now: float, seconds: int) -> QuantileSketch:
+        current = int(now // self.slot_seconds)
+        first = current - seconds // self.slot_seconds + 1
+        merged = QuantileSketch()
+        for slot, sketch in self.slots.items():
+            if first <= slot <= current:
+                merged.merge(sketch)
+        return merged
+
+    def _expire(self, newest: int) -> None:
+        if len(self.slots) <= self.keep:
+            return
+        for slot in [slot for slot in self.slots if slot <= newest - self.keep]:
+            del self.slots[slot]
+
+
+class WindowedLatency:
+    """Rolling 1m/5m/1h latency sketches per (event, model).
+
+    Short windows read 10 s slots and the hour reads 1 min slots, so a window
+    can trail its nominal edge by at most one slot.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._series: dict[tuple[str, str], tuple[_SlotRing, _SlotRing]] = {}
+
+    def add(self, event: str, model: str, value_ms: float, at: float | None = None) -> None:
+        at = self._clock() if at is None else at
+        key = (event, model)
+        rings = self._series.get(key)
+        if rings is None:
+            rings = self._series[key] = (
+                _SlotRing(FINE_SLOT_SECONDS, 300 // FINE_SLOT_SECONDS),
+                _SlotRing(COARSE_SLOT_SECONDS, 3600 // COARSE_SLOT_SECONDS)
+            )
+        fine, coarse = rings
+        fine.add(at, value_ms)
+        coarse.add(at, value_ms)
+
+    def summary(self, now: float | None = None) -> dict[str, list[dict]]:
+        now = self._clock() if now is None else now
+        windows: dict[str, list[dict]] = {}
+        for name, seconds in LATENCY_WINDOWS:
+            rows = []
+            for (event, model), (fine, coarse) in sorted(self._series.items()):
+                ring = fine if seconds <= fine.slot_seconds * fine.keep else coarse
+                sketch = ring.merged(now, seconds)
+                if not sketch.count:
+                    continue
+                row: dict = {"event": event, "model": model, "count": sketch.count}
+                for field, quantile in WINDOW_QUANTILES:
+                    value = sketch.quantile(quantile)
+                    row[field] = round(value, 1) if value is not None else None
+                row["max_ms"] = round(sketch.max_ms, 1) if sketch.max_ms is not None else None
+                rows.append(row)
+            windows[name] = rows
+        return windows
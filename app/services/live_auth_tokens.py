@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Awaitable, Callable
+
+try:
+    from google import genai
+    from google.genai import types
+except ImportError:
+    genai = None
+    types = None
+
+from ..logging_config import get_logger, short_id
+
+
+LIVE_TOKEN_EXPIRE_SECONDS = 30 * 60
+LIVE_TOKEN_NEW_SESSION_SECONDS = 10 * 60
+LIVE_TOKEN_REFRESH_MARGIN_SECONDS = 90
+LIVE_TOKEN_IDLE_SECONDS = 30 * 60
+LIVE_TOKEN_RETRY_SECONDS = 30
+
+logger = get_logger()
+
+
+@dataclass(frozen=True)
+class CachedAuthToken:
+    name: str
+    expires_at: float
+
+
+TokenMinter = Callable[[str, str], Awaitable[CachedAuthToken | None]]
+
+
+async def mint_live_auth_token(api_key: str, model: str) -> CachedAuthToken | None:
+    if genai is None or types is None:
+        return None
+    client = genai.Client(api_key=api_key, http_options=types.HttpOptions(api_version="v1alpha"))
+    now = datetime.now(timezone.utc)
+    config = types.CreateAuthTokenConfig(
+        uses=0,
+        expire_time=now + timedelta(seconds=LIVE_TOKEN_EXPIRE_SECONDS),
+        new_session_expire_time=now + timedelta(seconds=LIVE_TOKEN_NEW_SESSION_SECONDS)
+    )
+    aio_tokens = getattr(client.aio, "auth_tokens", None)
+    if aio_tokens is not None:
+        token = await aio_tokens.create(config=config)
+    else:
+        token = await asyncio.to_thread(client.auth_tokens.create, config=config)
+    token_name = getattr(token, "name", None)
+    if not token_name:
+        return None
+    return CachedAuthToken(
+        name=token_name,
+        expires_at=time.monotonic() + LIVE_TOKEN_NEW_SESSION_SECONDS
+    )
+
+
+def _cancel_requested() -> bool:
+    task = asyncio.current_task()
+    cancelling = getattr(task, "cancelling", None)
+    return bool(cancelling and cancelling())
+
+
+class LiveAuthTokenCache:
+    def __init__(
+        self,
+        minter: TokenMinter = mint_live_auth_token,
+        *,
+        refresh_margin_seconds: float = LIVE_TOKEN_REFRESH_MARGIN_SECONDS,
+        idle_seconds: float = LIVE_TOKEN_IDLE_SECONDS,
+        retry_seconds: float = LIVE_TOKEN_RETRY_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._minter = minter
+        self._refresh_margin = refresh_margin_seconds
+        self._idle_seconds = idle_seconds
+        self._retry_seconds = retry_seconds
+        self._clock = clock
+        self._tokens: dict[tuple[str, str], CachedAuthToken] = {}
+        self._last_used: dict[tuple[str, str], float] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._refreshers: dict[tuple[str, str], asyncio.Task] = {}
+
+    def peek(self, api_key: str, model: str) -> str | None:
+        entry = self._tokens.get((api_key, model))
+        if entry is None or self._clock() >= entry.expires_at - self._refresh_margin:
+            return None
+        return entry.name
+
+    async def get(self, api_key: str, model: str) -> str | None:
+        key = (api_key, model)
+        self._last_used[key] = self._clock()
+        self._ensure_refresher(key)
+        cached = self.peek(api_key, model)
+        if cached:
+            logger.info("event=gemini_live_token status=complete source=cache model=%s", model)
+            return cached
+        return await self._mint(key)
+
+    def invalidate(self, api_key: str, model: str, token: str | None = None) -> None:
+        key = (api_key, model)
+        entry = self._tokens.get(key)
+        if entry is not None and (token is None or entry.name == token):
+            self._tokens.pop(key, None)
+
+    async def close(self) -> None:
+        tasks = list(self._refreshers.values())
+        self._refreshers.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def _mint(self, key: tuple[str, str]) -> str | None:
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        while pending is not None and not pending.done() and pending.get_loop() is loop:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the owner was cancelled: mint again (or join a newer mint) instead of failing.
+                if not pending.cancelled() or _cancel_requested():
+                    raise
+            pending = self._inflight.get(key)
+        future = loop.create_future()
+        self._inflight[key] = future
+        api_key, model = key
+        start = time.perf_counter()
+        token_name = None
+        try:
+            entry = await self._minter(api_key, model)
+            if entry is None:
+                logger.warning("event=gemini_live_token status=missing_name model=%s", model)
+            else:
+                self._tokens[key] = entry
+                token_name = entry.name
+                logger.info(
+                    "event=gemini_live_token status=complete source=mint model=%s key_id=%s duration_ms=%s",
+                    model,
+                    short_id(api_key),
+                    int((time.perf_counter() - start) * 1000)
+                )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception:
+            logger.exception("event=gemini_live_token status=error model=%s key_id=%s", model, short_id(api_key))
+        finally:
+            if self._inflight.get(key) is future:
+                self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(token_name)
+        return token_name
+
+    def _ensure_refresher(self, key: tuple[str, str]) -> None:
+        task = self._refreshers.get(key)
+        loop = asyncio.get_running_loop()
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._refreshers[key] = loop.create_task(self._refresh_loop(key))
+
+    async def _refresh_loop(self, key: tuple[str, str]) -> None:
+        try:
+            while self._clock() - self._last_used.get(key, 0.0) < self._idle_seconds:
+                entry = self._tokens.get(key)
+                if entry is None:
+                    delay = 0.0
+                else:
+                    delay = entry.expires_at - self._refresh_margin - self._clock()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+                await self._mint(key)
+                if self.peek(*key) is None:
+                    await asyncio.sleep(self._retry_seconds)
+        except asyncio.CancelledError:
+            return
+        finally:
+            if self._refreshers.get(key) is asyncio.current_task():
+                self._refreshers.pop(key, None)
+
+
+auth_token_cache = LiveAuthTokenCache()
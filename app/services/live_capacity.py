@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+
+
+LIVE_CAPACITY_CLOSE_CODE = 1013
+LIVE_IDLE_CLOSE_CODE = 4408
+
+
+class LiveCapacity:
+    def __init__(self) -> None:
+        self._active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._reaped = 0
+        self._reaped_idle_seconds = 0.0
+        self._max_sessions = 0
+        self._queue_max = 0
+
+    async def acquire(self, max_sessions: int, queue_max: int = 0, timeout_seconds: float = 0.0) -> bool:
+        self._max_sessions = max_sessions
+        self._queue_max = queue_max
+        if max_sessions <= 0 or (self._active < max_sessions and not self._waiters):
+            self._active += 1
+            self._admitted += 1
+            return True
+        if queue_max <= 0 or timeout_seconds <= 0 or len(self._waiters) >= queue_max:
+            self._rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=timeout_seconds)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # release() already handed us the slot; pass it on instead of leaking it.
+                self.release()
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        if waiter.cancelled():
+            self._rejected += 1
+            self._timed_out += 1
+            return False
+        self._admitted += 1
+        return True
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Hand the slot straight to the oldest waiter so a new arrival cannot jump the queue.
+                waiter.set_result(True)
+                return
+        self._active = max(0, self._active - 1)
+
+    def record_reap(self, idle_seconds: float) -> None:
+        self._reaped += 1
+        self._reaped_idle_seconds += idle_seconds
+
+    def snapshot(self) -> dict[str, int | float]:
+        return {
+            "active": self._active,
+            "queued": sum(1 for waiter in self._waiters if not waiter.done()),
+            "max_sessions": self._max_sessions,
+            "queue_max": self._queue_max,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "reaped": self._reaped,
+            "reaped_idle_seconds": round(self._reaped_idle_seconds, 1)
+        }
+
+    def reset(self) -> None:
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.cancel()
+        self._waiters.clear()
+        self._active = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._reaped = 0
+        self._reaped_idle_seconds = 0.0
+
+
+live_capacity = LiveCapacity()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import signal
+import threading
+import time
+from typing import Any, Callable
+
+from ..logging_config import get_logger
+
+logger = get_logger()
+
+
+LIVE_DRAIN_CLOSE_CODE = 1012
+
+
+class LiveDrain:
+    """Tracks open live sockets so shutdown can hand each one off before the server cuts it."""
+
+    def __init__(self) -> None:
+        self._sessions: set[Any] = set()
+        self._task: asyncio.Task | None = None
+        self.draining = False
+
+    def register(self, session: Any) -> None:
+        self._sessions.add(session)
+
+    def unregister(self, session: Any) -> None:
+        self._sessions.discard(session)
+
+    def begin(self, timeout_seconds: float) -> asyncio.Task:
+        if self._task is None or self._task.get_loop() is not asyncio.get_running_loop():
+            self.draining = True
+            self._task = asyncio.create_task(self._drain(timeout_seconds))
+        return self._task
+
+    async def drain(self, timeout_seconds: float) -> dict[str, int]:
+        return await asyncio.shield(self.begin(timeout_seconds))
+
+    async def _drain(self, timeout_seconds: float) -> dict[str, int]:
+        start = time.perf_counter()
+        sessions = list(self._sessions)
+        tasks = [asyncio.create_task(session.drain()) for session in sessions]
+        pending: set[asyncio.Task] = set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=max(0.0, timeout_seconds))
+            for task in pending:
+                task.cancel()
+        result = {
+            "sessions": len(sessions),
+            "drained": len(tasks) - len(pending),
+            "timed_out": len(pending),
+            "duration_ms": int((time.perf_counter() - start) * 1000)
+        }
+        log = logger.warning if pending else logger.info
+        log(
+            "event=live_drain status=complete sessions=%s drained=%s timed_out=%s duration_ms=%s",
+            result["sessions"],
+            result["drained"],
+            result["timed_out"],
+            result["duration_ms"]
+        )
+        return result
+
+    def install_signal_handler(self, timeout_seconds: float, signum: int = signal.SIGTERM) -> Callable[[], None]:
+        """Run the drain on SIGTERM before passing the signal on to the server's own handler.
+
+        Uvicorn closes every websocket with 1012 as soon as it starts shutting down, which is
+        before the lifespan shutdown runs, so the drain has to get in ahead of it.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return lambda: None
+        loop = asyncio.get_running_loop()
+        previous = signal.getsignal(signum)
+
+        def forward(frame) -> None:
+            if callable(previous):
+                previous(signum, frame)
+                return
+            signal.signal(signum, previous if previous is not None else signal.SIG_DFL)
+            signal.raise_signal(signum)
+
+        def on_signal(frame) -> None:
+            if self._task is not None:
+                # A second signal means the platform will not wait any longer.
+                forward(frame)
+                return
+            logger.info("event=live_drain status=start signal=%s sessions=%s", signum, len(self._sessions))
+            self.begin(timeout_seconds).add_done_callback(lambda _: forward(frame))
+
+        def handler(received: int, frame) -> None:
+            loop.call_soon_threadsafe(on_signal, frame)
+
+        signal.signal(signum, handler)
+
+        def restore() -> None:
+            if signal.getsignal(signum) is handler:
+                signal.signal(signum, previous if previous is not None else signal.SIG_DFL)
+
+        return restore
+
+    def snapshot(self) -> dict[str, int | bool]:
+        return {"draining": self.draining, "sessions": len(self._sessions)}
+
+    def reset(self) -> None:
+        self._sessions.clear()
+        self._task = None
+        self.draining = False
+
+
+live_drain = LiveDrain()
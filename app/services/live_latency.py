@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+import math
+import time
+from typing import Callable
+
+
+LATENCY_BUCKETS_MS = (25, 50, 100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000)
+LIVE_LATENCY_METRICS = ("first_audio", "coach_transcript", "upstream_send", "candidate_audio", "coach_audio")
+
+
+def bucket_quantile(counts: list[int], quantile: float, observed_max: float | None = None) -> float | None:
+    """Estimate a quantile as the upper bound of the bucket that holds it."""
+    total = sum(counts)
+    if not total:
+        return None
+    rank = max(1, math.ceil(quantile * total))
+    seen = 0
+    for index, count in enumerate(counts):
+        seen += count
+        if seen >= rank:
+            if index < len(LATENCY_BUCKETS_MS):
+                bound = float(LATENCY_BUCKETS_MS[index])
+                return min(bound, observed_max) if observed_max is not None else bound
+            return observed_max
+    return observed_max
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram; the last bucket catches everything above the largest bound."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms: float | None = None
+
+    def record(self, value_ms: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if self.max_ms is None or value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def quantile(self, quantile: float) -> float | None:
+        value = bucket_quantile(self.counts, quantile, self.max_ms)
+        return round(value, 1) if value is not None else None
+
+    def summary(self) -> dict[str, float | int | None]:
+        return {
+            "count": self.count,
+            "p50_ms": self.quantile(0.5),
+            "p90_ms": self.quantile(0.9),
+            "max_ms": round(self.max_ms, 1) if self.max_ms is not None else None
+        }
+
+
+class LiveLatencyRecorder:
+    """Per-session live timings, measured from the candidate's activity end where relevant."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.histograms = {name: LatencyHistogram() for name in LIVE_LATENCY_METRICS}
+        self.turns = 0
+        self._activity_started_at: float | None = None
+        self._activity_ended_at: float | None = None
+        self._awaiting = set()
+        self._turn: dict[str, float] = {}
+        self._coach_audio_ms = 0.0
+
+    def activity_start(self) -> None:
+        self._activity_started_at = self._clock()
+
+    def activity_end(self) -> None:
+        now = self._clock()
+        if self._activity_started_at is not None:
+            self._observe("candidate_audio", (now - self._activity_started_at) * 1000)
+            self._activity_started_at = None
+        self._activity_ended_at = now
+        self._awaiting = {"first_audio", "coach_transcript"}
+
+    def upstream_send(self, duration_ms: float) -> None:
+        self.histograms["upstream_send"].record(duration_ms)
+
+    def coach_audio(self, byte_count: int, sample_rate: int) -> None:
+        self._mark("first_audio")
+        if sample_rate > 0:
+            self._coach_audio_ms += byte_count / 2 / sample_rate * 1000
+
+    def coach_transcript(self) -> None:
+        self._mark("coach_transcript")
+
+    def turn_complete(self) -> dict[str, float] | None:
+        if self._coach_audio_ms:
+            self._observe("coach_audio", self._coach_audio_ms)
+        turn, self._turn = self._turn, {}
+        self._coach_audio_ms = 0.0
+        self._awaiting = set()
+        if not turn:
+            return None
+        self.turns += 1
+        return {f"{name}_ms": round(value, 1) for name, value in turn.items()}
+
+    def summary(self) -> dict[str, dict]:
+        return {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+    def log_fields(self) -> str:
+        parts = [f"turns={self.turns}"]
+        for name, histogram in self.histograms.items():
+            summary = histogram.summary()
+            parts.append(
+                f"{name}_count={summary['count']} {name}_p50_ms={summary['p50_ms']} "
+                f"{name}_p90_ms={summary['p90_ms']} {name}_max_ms={summary['max_ms']} "
+                f"{name}_buckets={'-'.join(str(count) for count in histogram.counts)}"
+            )
+        return " ".join(parts)
+
+    def _mark(self, name: str) -> None:
+        if name not in self._awaiting or self._activity_ended_at is None:
+            return
+        self._awaiting.discard(name)
+        self._observe(name, (self._clock() - self._activity_ended_at) * 1000)
+
+    def _observe(self, name: str, value_ms: float) -> None:
+        self.histograms[name].record(value_ms)
+        self._turn[name] = value_ms
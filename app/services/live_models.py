@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable
+
+
+LIVE_MODEL_UNSUPPORTED_TTL_SECONDS = 15 * 60
+LIVE_MODEL_LATENCY_ALPHA = 0.2
+
+
+@dataclass
+class LiveModelStats:
+    connects: int = 0
+    failures: int = 0
+    last_connect_ms: int | None = None
+    avg_connect_ms: float | None = None
+    unsupported_until: float | None = None
+
+
+class LiveModelCapabilities:
+    def __init__(
+        self,
+        unsupported_ttl_seconds: float = LIVE_MODEL_UNSUPPORTED_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._ttl = unsupported_ttl_seconds
+        self._clock = clock
+        self._stats: dict[str, LiveModelStats] = {}
+        self._lock = threading.Lock()
+
+    def is_unsupported(self, model: str) -> bool:
+        with self._lock:
+            stats = self._stats.get(model)
+            if stats is None or stats.unsupported_until is None:
+                return False
+            if self._clock() >= stats.unsupported_until:
+                stats.unsupported_until = None
+                return False
+            return True
+
+    def filter_candidates(self, models: list[str]) -> tuple[list[str], list[str]]:
+        supported = [model for model in models if not self.is_unsupported(model)]
+        skipped = [model for model in models if model not in supported]
+        if not supported:
+            return list(models), []
+        return supported, skipped
+
+    def record_connect(self, model: str, duration_ms: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(model, LiveModelStats())
+            stats.connects += 1
+            stats.last_connect_ms = duration_ms
+            if stats.avg_connect_ms is None:
+                stats.avg_connect_ms = float(duration_ms)
+            else:
+                stats.avg_connect_ms += LIVE_MODEL_LATENCY_ALPHA * (duration_ms - stats.avg_connect_ms)
+            stats.unsupported_until = None
+
+    def record_failure(self, model: str, *, unsupported: bool, ttl_seconds: float | None = None) -> None:
+        ttl = self._ttl if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            stats = self._stats.setdefault(model, LiveModelStats())
+            stats.failures += 1
+            if unsupported and ttl > 0:
+                stats.unsupported_until = self._clock() + ttl
+
+    def snapshot(self) -> dict[str, dict]:
+        now = self._clock()
+        with self._lock:
+            return {
+                model: {
+                    "connects": stats.connects,
+                    "failures": stats.failures,
+                    "last_connect_ms": stats.last_connect_ms,
+                    "avg_connect_ms": round(stats.avg_connect_ms, 1) if stats.avg_connect_ms is not None else None,
+                    "unsupported": bool(stats.unsupported_until and stats.unsupported_until > now)
+                }
+                for model, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+live_model_capabilities = LiveModelCapabilities()
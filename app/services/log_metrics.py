@@ -1,61 +1,161 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from typing import Dict, List
+from collections import Counter, defaultdict, deque
+import time
+from typing import Callable, Dict, List
 
+from .latency_sketch import WindowedLatency
+from .live_latency import LATENCY_BUCKETS_MS, LIVE_LATENCY_METRICS, bucket_quantile
 from .log_parse import parse_log_line
 
 
-def build_log_summary(lines: List[str]) -> Dict[str, object]:
-    event_counts = Counter()
-    status_counts = defaultdict(Counter)
-    disconnect_counts = Counter()
-    client_disconnects = 0
-    server_disconnects = 0
-    gemini_disconnects = 0
-    turn_completion_checks = 0
-    errors = []
-    error_session_ids = set()
+def _merge_latency(latency: Dict[str, dict], parsed: Dict[str, str]) -> None:
+    for metric in LIVE_LATENCY_METRICS:
+        raw_buckets = parsed.get(f"{metric}_buckets")
+        if not raw_buckets:
+            continue
+        try:
+            counts = [int(value) for value in raw_buckets.split("-")]
+        except ValueError:
+            continue
+        if len(counts) != len(LATENCY_BUCKETS_MS) + 1:
+            continue
+        merged = latency.setdefault(metric, {"counts": [0] * len(counts), "max_ms": None})
+        merged["counts"] = [left + right for left, right in zip(merged["counts"], counts)]
+        try:
+            max_ms = float(parsed.get(f"{metric}_max_ms", ""))
+        except ValueError:
+            continue
+        if merged["max_ms"] is None or max_ms > merged["max_ms"]:
+            merged["max_ms"] = max_ms
 
-    for line in lines:
+
+def _summarize_latency(latency: Dict[str, dict], sessions: int) -> Dict[str, object]:
+    summary: Dict[str, object] = {"sessions": sessions}
+    for metric, merged in latency.items():
+        counts = merged["counts"]
+        summary[metric] = {
+            "count": sum(counts),
+            "p50_ms": bucket_quantile(counts, 0.5, merged["max_ms"]),
+            "p90_ms": bucket_quantile(counts, 0.9, merged["max_ms"]),
+            "max_ms": merged["max_ms"]
+        }
+    return summary
+
+
+RECENT_ERROR_LIMIT = 10
+
+
+class _TimestampParser:
+    """Log timestamps to epoch seconds, reusing the last parse within the same second."""
+
+    def __init__(self) -> None:
+        self._second = ""
+        self._epoch = 0.0
+
+    def __call__(self, value: str) -> float | None:
+        second, _, millis = value.partition(",")
+        if second != self._second:
+            try:
+                self._epoch = time.mktime(time.strptime(second, "%Y-%m-%d %H:%M:%S"))
+            except ValueError:
+                return None
+            self._second = second
+        try:
+            return self._epoch + int(millis or 0) / 1000
+        except ValueError:
+            return self._epoch
+
+
+class LogSummaryAggregator:
+    """Running counters over parsed log lines; feed lines with ``add`` and read ``summary``."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._parse_timestamp = _TimestampParser()
+        self.reset()
+
+    def reset(self) -> None:
+        self.lines = 0
+        self._event_counts = Counter()
+        self._status_counts = defaultdict(Counter)
+        self._disconnect_counts = Counter()
+        self._client_disconnects = 0
+        self._server_disconnects = 0
+        self._gemini_disconnects = 0
+        self._turn_completion_checks = 0
+        self._error_count = 0
+        self._recent_errors: deque[dict] = deque(maxlen=RECENT_ERROR_LIMIT)
+        self._error_session_ids = set()
+        self._latency: Dict[str, dict] = {}
+        self._latency_sessions = 0
+        self._windows = WindowedLatency(self._clock)
+
+    def add(self, line: str) -> None:
+        self.lines += 1
         parsed = parse_log_line(line)
         event = parsed.get("event")
         status = parsed.get("status")
         level = parsed.get("level")
         session_id = parsed.get("session_id")
         if event:
-            event_counts[event] += 1
+            self._event_counts[event] += 1
         if event and status:
-            status_counts[event][status] += 1
+            self._status_counts[event][status] += 1
         if event == "voice_turn_completion" and status == "complete":
-            turn_completion_checks += 1
+            self._turn_completion_checks += 1
         if event in {"ws_disconnect", "gemini_live_receive", "client_event"}:
-            disconnect_counts[event] += 1
+            self._disconnect_counts[event] += 1
         if event == "ws_disconnect":
-            server_disconnects += 1
+            self._server_disconnects += 1
         if event == "gemini_live_receive" and status == "ended":
-            gemini_disconnects += 1
+            self._gemini_disconnects += 1
         if event == "client_event":
             event_type = parsed.get("event_type")
             if event_type in {"ws_close", "ws_disconnected", "ws_error"}:
-                client_disconnects += 1
+                self._client_disconnects += 1
+        if event == "live_latency" and status == "summary":
+            self._latency_sessions += 1
+            _merge_latency(self._latency, parsed)
+        duration_ms = parsed.get("duration_ms")
+        if event and duration_ms is not None and status != "error":
+            self._add_duration(event, parsed, duration_ms)
         if level in {"ERROR", "CRITICAL"} or status == "error":
-            errors.append(parsed)
+            self._error_count += 1
+            self._recent_errors.append(parsed)
             if session_id:
-                error_session_ids.add(session_id)
-
-    error_event_count = len(errors)
-
-    return {
-        "event_counts": dict(event_counts),
-        "status_counts": {key: dict(value) for key, value in status_counts.items()},
-        "disconnect_counts": dict(disconnect_counts),
-        "client_disconnects": client_disconnects,
-        "server_disconnects": server_disconnects,
-        "gemini_disconnects": gemini_disconnects,
-        "turn_completion_checks": turn_completion_checks,
-        "error_count": len(errors),
-        "error_event_count": error_event_count,
-        "error_session_count": len(error_session_ids),
-        "recent_errors": errors[-10:]
-    }
+                self._error_session_ids.add(session_id)
+
+    def _add_duration(self, event: str, parsed: Dict[str, str], duration_ms: str) -> None:
+        try:
+            value_ms = float(duration_ms)
+        except (TypeError, ValueError):
+            return
+        model = parsed.get("effective_model") or parsed.get("model") or parsed.get("requested_model") or ""
+        timestamp = parsed.get("timestamp")
+        at = self._parse_timestamp(timestamp) if timestamp else None
+        self._windows.add(event, model, value_ms, at)
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "event_counts": dict(self._event_counts),
+            "status_counts": {key: dict(value) for key, value in self._status_counts.items()},
+            "disconnect_counts": dict(self._disconnect_counts),
+            "client_disconnects": self._client_disconnects,
+            "server_disconnects": self._server_disconnects,
+            "gemini_disconnects": self._gemini_disconnects,
+            "turn_completion_checks": self._turn_completion_checks,
+            "live_latency": _summarize_latency(self._latency, self._latency_sessions) if self._latency_sessions else {},
+            "latency_windows": self._windows.summary(),
+            "error_count": self._error_count,
+            "error_event_count": self._error_count,
+            "error_session_count": len(self._error_session_ids),
+            "recent_errors": list(self._recent_errors)
+        }
+
+
+def build_log_summary(lines: List[str]) -> Dict[str, object]:
+    aggregator = LogSummaryAggregator()
+    for line in lines:
+        aggregator.add(line)
+    return aggregator.summary()
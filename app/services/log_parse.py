@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import re
 from typing import Dict
 
@@ -10,6 +11,14 @@ KV_RE = re.compile(r"(?P<key>[A-Za-z0-9_]+)=(?P<value>[^\s]+)")
 
 
 def parse_log_line(line: str) -> Dict[str, str]:
+    if line.startswith("{"):
+        # JSON-lines mode (LOG_FORMAT=json) already carries the fields as keys.
+        try:
+            fields = json.loads(line)
+        except ValueError:
+            fields = None
+        if isinstance(fields, dict):
+            return fields
     match = LOG_RE.match(line.strip())
     if not match:
         return {"raw": line.strip()}
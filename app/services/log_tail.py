@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+import threading
+from typing import BinaryIO
+
+from ..logging_config import get_logger
+from .log_metrics import LogSummaryAggregator
+
+logger = get_logger()
+
+
+LOG_TAIL_READ_BYTES = 1 << 20
+
+
+class LogTail:
+    """Follows app.log from a byte offset and keeps the summary counters current.
+
+    Only bytes appended since the last poll are read and parsed. A rotated file
+    (new inode) is drained from the old handle before the new one is opened and
+    counting carries on; a truncated file (size below the offset) resets the
+    counters because the lines they described are gone.
+    """
+
+    def __init__(self) -> None:
+        self.path: Path | None = None
+        self.aggregator = LogSummaryAggregator()
+        self._handle: BinaryIO | None = None
+        self._inode: int | None = None
+        self._offset = 0
+        self._partial = b""
+        self._snapshot: dict | None = None
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+        self.rotations = 0
+        self.truncations = 0
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    def follow(self, path: Path) -> None:
+        with self._lock:
+            if self.path == path:
+                return
+            self._close()
+            self.path = path
+            self.aggregator.reset()
+            self._snapshot = None
+
+    def poll(self) -> int:
+        with self._lock:
+            if self.path is None:
+                return 0
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return 0
+            added = 0
+            if self._handle is not None and stat.st_ino != self._inode:
+                added += self._read_available()
+                self._flush_partial()
+                self._close()
+                self.rotations += 1
+            elif self._handle is not None and stat.st_size < self._offset:
+                self._close()
+                self.aggregator.reset()
+                self.truncations += 1
+            if self._handle is None:
+                try:
+                    self._handle = open(self.path, "rb")
+                except FileNotFoundError:
+                    return added
+                self._inode = os.fstat(self._handle.fileno()).st_ino
+                self._offset = 0
+                self._partial = b""
+                self._snapshot = None
+            added += self._read_available()
+            # Rebuilt on every poll, not only on new lines, so the latency windows keep rolling.
+            self._snapshot = self.aggregator.summary()
+            return added
+
+    def snapshot(self) -> dict | None:
+        return self._snapshot
+
+    def start(self, interval_seconds: float) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(interval_seconds))
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run(self, interval_seconds: float) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.poll)
+            except Exception:
+                logger.exception("event=log_tail status=error path=%s offset=%s", self.path, self._offset)
+            await asyncio.sleep(interval_seconds)
+
+    def _read_available(self) -> int:
+        assert self._handle is not None
+        added = 0
+        while True:
+            chunk = self._handle.read(LOG_TAIL_READ_BYTES)
+            if not chunk:
+                return added
+            self._offset += len(chunk)
+            data = self._partial + chunk
+            lines = data.split(b"\n")
+            # A line is only counted once its newline lands; the tail waits for the next read.
+            self._partial = lines.pop()
+            for line in lines:
+                self.aggregator.add(line.decode("utf-8", errors="replace"))
+            added += len(lines)
+
+    def _flush_partial(self) -> None:
+        if self._partial:
+            self.aggregator.add(self._partial.decode("utf-8", errors="replace"))
+            self._partial = b""
+
+    def _close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        self._handle = None
+        self._inode = None
+        self._offset = 0
+        self._partial = b""
+
+
+log_tail = LogTail()
@@ -0,0 +1,316 @@
+"""In-process counters, gauges and histograms rendered in the Prometheus text format.
+
+Recording is a dict lookup and an add on the caller's thread; nothing is
+formatted until ``/metrics`` is scraped. Values that other modules already
+track (live capacity, the log queue) are read by collectors at scrape time
+instead of being mirrored on every change.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+import math
+import time
+from typing import Callable, Iterable
+
+from ..logging_config import log_queue_stats
+from .ga4_telemetry import ga4_dispatcher
+from .live_capacity import live_capacity
+
+
+DURATION_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def labels(self, *values: str):
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def samples(self) -> list[Sample]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        # Children are zeroed in place because callers may hold a bound child from ``labels``.
+        for child in self._children.values():
+            child.reset()
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def reset(self) -> None:
+        self.value = 0.0
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+
+    def samples(self) -> list[Sample]:
+        return [
+            (f"{self.name}_total", dict(zip(self.labelnames, key)), child.value)
+            for key, child in self._children.items()
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._children[()].dec(amount)
+
+    def set(self, value: float) -> None:
+        self._children[()].set(value)
+
+    def samples(self) -> list[Sample]:
+        return [(self.name, dict(zip(self.labelnames, key)), child.value) for key, child in self._children.items()]
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS_SECONDS
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._children[()].observe(value)
+
+    def samples(self) -> list[Sample]:
+        samples: list[Sample] = []
+        for key, child in self._children.items():
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            samples.append((f"{self.name}_sum", labels, child.sum))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[tuple[str, str, str, list[Sample]]]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS_SECONDS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[tuple[str, str, str, list[Sample]]]]) -> None:
+        """Adds a scrape-time callback yielding ``(name, kind, help, samples)`` families."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        families = [
+            (metric.name, metric.kind, metric.documentation, metric.samples()) for metric in self._metrics.values()
+        ]
+        for collector in self._collectors:
+            families.extend(collector())
+        lines: list[str] = []
+        for name, kind, documentation, samples in families:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def _register(self, metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "preptalk_http_requests", "HTTP requests by method, route template and status.", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "preptalk_http_request_duration_seconds", "HTTP request latency by method and route template.", ("method", "route")
+)
+model_call_duration = registry.histogram(
+    "preptalk_model_call_duration_seconds",
+    "Text and TTS model call latency by provider, kind, model and status.",
+    ("provider", "kind", "model", "status")
+)
+store_persist_duration = registry.histogram(
+    "preptalk_store_persist_duration_seconds", "Interview record write latency."
+)
+store_persist_bytes = registry.counter("preptalk_store_persist_bytes", "Bytes written for interview records.")
+ws_sessions = registry.counter("preptalk_ws_sessions", "Live WebSocket connections accepted.")
+ws_active_sessions = registry.gauge("preptalk_ws_active_sessions", "Live WebSocket connections currently open.")
+ws_audio_bytes = registry.counter(
+    "preptalk_ws_audio_bytes", "Live audio bytes by direction (in from the browser, out to it).", ("direction",)
+)
+ws_audio_in_bytes = ws_audio_bytes.labels("in")
+ws_audio_out_bytes = ws_audio_bytes.labels("out")
+
+
+def _runtime_families() -> list[tuple[str, str, str, list[Sample]]]:
+    capacity = live_capacity.snapshot()
+    log_queue = log_queue_stats()
+    ga4 = ga4_dispatcher.stats()
+    return [
+        ("preptalk_live_slots_active", "gauge", "Live model sessions holding a capacity slot.", [
+            ("preptalk_live_slots_active", {}, capacity["active"])
+        ]),
+        ("preptalk_live_slots_queued", "gauge", "Live sessions waiting for a capacity slot.", [
+            ("preptalk_live_slots_queued", {}, capacity["queued"])
+        ]),
+        ("preptalk_live_slots_rejected", "counter", "Live sessions turned away at capacity.", [
+            ("preptalk_live_slots_rejected_total", {}, capacity["rejected"])
+        ]),
+        ("preptalk_log_queue_depth", "gauge", "Log records waiting for the writer thread.", [
+            ("preptalk_log_queue_depth", {}, log_queue["depth"])
+        ]),
+        ("preptalk_log_queue_dropped", "counter", "Log records dropped because the queue was full.", [
+            ("preptalk_log_queue_dropped_total", {}, log_queue["dropped"])
+        ]),
+        ("preptalk_ga4_queue_depth", "gauge", "GA4 events waiting for the next batch.", [
+            ("preptalk_ga4_queue_depth", {}, ga4["depth"])
+        ]),
+        ("preptalk_ga4_events", "counter", "GA4 events by outcome (sent, failed, dropped at a full queue).", [
+            ("preptalk_ga4_events_total", {"outcome": outcome}, ga4[outcome]) for outcome in ("sent", "failed", "dropped")
+        ]),
+    ]
+
+
+registry.register_collector(_runtime_families)
+
+
+def observe_model_call(provider: str, kind: str, model: str, status: str, started_at: float) -> None:
+    model_call_duration.labels(provider, kind, model, status).observe(time.monotonic() - started_at)
+
+
+class HttpMetricsMiddleware:
+    """Counts HTTP requests by matched route template so path parameters do not explode cardinality."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            method = scope.get("method", "")
+            http_requests.labels(method, route, status).inc()
+            http_request_duration.labels(method, route).observe(time.perf_counter() - start)
@@ -0,0 +1,180 @@
+"""Paced transcript and audio stream for the mock live adapter.
+
+Coach turns stream their audio as fixed-size PCM frames on a real-time
+schedule, candidate turns wait out their speaking time, and transcript
+writes go through the store's batched persistence. That keeps mock-mode load
+runs bound by the socket path instead of one disk write per entry.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+from dataclasses import dataclass
+from functools import lru_cache
+import json
+import math
+from pathlib import Path
+import time
+from typing import Any, Awaitable, Callable
+
+from ..logging_config import get_logger, short_id
+from .metrics import ws_audio_out_bytes
+from .store import store
+
+
+MOCK_LIVE_SAMPLE_RATE = 24000
+MOCK_LIVE_WORDS_PER_MINUTE = 160
+MOCK_LIVE_MIN_TURN_MS = 600
+
+logger = get_logger()
+
+
+@dataclass(frozen=True)
+class MockLiveTurn:
+    role: str
+    text: str
+    audio_ms: int
+    timestamp: str = ""
+
+
+def _speaking_ms(text: str) -> int:
+    words = len(text.split())
+    return max(MOCK_LIVE_MIN_TURN_MS, int(words * 60000 / MOCK_LIVE_WORDS_PER_MINUTE))
+
+
+def mock_turns(entries: list[dict]) -> list[MockLiveTurn]:
+    turns = []
+    for entry in entries:
+        text = str(entry.get("text") or "").strip()
+        if not text:
+            continue
+        audio_ms = entry.get("audio_ms")
+        turns.append(
+            MockLiveTurn(
+                role=str(entry.get("role") or "coach"),
+                text=text,
+                audio_ms=max(0, int(audio_ms)) if audio_ms is not None else _speaking_ms(text),
+                timestamp=str(entry.get("timestamp") or "")
+            )
+        )
+    return turns
+
+
+def load_mock_script(path: str) -> list[dict]:
+    payload = json.loads(Path(path).read_text())
+    if isinstance(payload, dict):
+        payload = payload.get("turns", [])
+    if not isinstance(payload, list):
+        raise ValueError("Mock live script must be a list of turns.")
+    return [entry for entry in payload if isinstance(entry, dict)]
+
+
+@lru_cache(maxsize=8)
+def _tone_frame_base64(frame_ms: int, sample_rate: int = MOCK_LIVE_SAMPLE_RATE, frequency: float = 440.0) -> str:
+    sample_count = sample_rate * frame_ms // 1000
+    pcm = bytearray()
+    for i in range(sample_count):
+        value = int(0.2 * 32767 * math.sin(2 * math.pi * frequency * i / sample_rate))
+        pcm.extend(value.to_bytes(2, byteorder="little", signed=True))
+    return base64.b64encode(pcm).decode("ascii")
+
+
+class MockLiveStreamer:
+    def __init__(
+        self,
+        send_json: Callable[[dict[str, Any]], Awaitable[None]],
+        interview_id: str,
+        user_id: str,
+        turns: list[MockLiveTurn],
+        *,
+        frame_ms: int = 20,
+        gap_ms: int = 400,
+        sample_rate: int = MOCK_LIVE_SAMPLE_RATE
+    ) -> None:
+        self._send_json = send_json
+        self._interview_id = interview_id
+        self._user_id = user_id
+        self._turns = turns
+        self._frame_ms = max(1, frame_ms)
+        self._gap_seconds = max(0, gap_ms) / 1000
+        self._sample_rate = sample_rate
+        self.frames_sent = 0
+        self.late_frames = 0
+        self.max_lag_ms = 0.0
+        self.turns_sent = 0
+
+    async def run(self) -> None:
+        start = time.perf_counter()
+        status = "cancelled"
+        try:
+            for index, turn in enumerate(self._turns):
+                if index:
+                    await asyncio.sleep(self._gap_seconds)
+                if turn.role == "coach":
+                    await self._send_transcript(turn)
+                    await self._stream_audio(turn.audio_ms)
+                else:
+                    # Candidate audio comes from the browser in a real session; only its pacing is mirrored here.
+                    await asyncio.sleep(turn.audio_ms / 1000)
+                    await self._send_transcript(turn)
+                store.append_transcript_entry(
+                    self._interview_id,
+                    {"role": turn.role, "text": turn.text, "timestamp": turn.timestamp},
+                    self._user_id,
+                    defer_persist=True
+                )
+                self.turns_sent += 1
+            await self._send_json({"type": "status", "state": "stream-complete"})
+            status = "complete"
+        finally:
+            store.flush(self._interview_id, self._user_id)
+            logger.info(
+                "event=mock_live_stream status=%s interview_id=%s user_id=%s turns=%s frames=%s late_frames=%s "
+                "max_lag_ms=%s duration_ms=%s",
+                status,
+                short_id(self._interview_id),
+                short_id(self._user_id),
+                self.turns_sent,
+                self.frames_sent,
+                self.late_frames,
+                round(self.max_lag_ms, 1),
+                int((time.perf_counter() - start) * 1000)
+            )
+
+    async def _send_transcript(self, turn: MockLiveTurn) -> None:
+        await self._send_json(
+            {
+                "type": "transcript",
+                "role": turn.role,
+                "text": turn.text,
+                "timestamp": turn.timestamp,
+                "is_final": True
+            }
+        )
+
+    async def _stream_audio(self, duration_ms: int) -> None:
+        if duration_ms <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        frame_seconds = self._frame_ms / 1000
+        data = _tone_frame_base64(self._frame_ms, self._sample_rate)
+        frame_bytes = self._sample_rate * self._frame_ms // 1000 * 2
+        started_at = loop.time()
+        for index in range(math.ceil(duration_ms / self._frame_ms)):
+            # Frames are scheduled against the turn start so send time does not accumulate as drift.
+            delay = started_at + index * frame_seconds - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif index:
+                self.late_frames += 1
+                self.max_lag_ms = max(self.max_lag_ms, -delay * 1000)
+            await self._send_json(
+                {
+                    "type": "audio",
+                    "encoding": "pcm16",
+                    "sample_rate": self._sample_rate,
+                    "data": data
+                }
+            )
+            self.frames_sent += 1
+            ws_audio_out_bytes.inc(frame_bytes)
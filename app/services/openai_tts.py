@@ -5,6 +5,8 @@ import time
 import wave
 
 from ..logging_config import get_logger
+from .metrics import observe_model_call
+from .tracing import span
 
 logger = get_logger()
 
@@ -48,6 +50,7 @@ def _normalize_openai_audio(audio_bytes: bytes, audio_format: str | None) -> tup
     return buffer.getvalue(), mime
 
 
+@span("openai_tts")
 def generate_openai_tts_audio(
     *,
     api_key: str,
@@ -84,9 +87,11 @@ def generate_openai_tts_audio(
             duration_ms,
             len(normalized)
         )
+        observe_model_call("openai", "tts", model, "complete", start)
         return normalized, mime
     except Exception:
         duration_ms = int((time.monotonic() - start) * 1000)
+        observe_model_call("openai", "tts", model, "error", start)
         logger.exception(
             "event=openai_tts status=error requested_model=%s duration_ms=%s",
             model,
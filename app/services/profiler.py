@@ -0,0 +1,219 @@
+"""Opt-in cProfile capture for one HTTP request, gated by a profile token.
+
+A request carrying ``X-Profile-Token`` that matches ``APP_PROFILE_TOKENS`` runs
+under ``cProfile`` (plus ``tracemalloc`` when ``X-Profile-Alloc: 1``) and its
+stats are written to ``LOG_DIR/profiles/``. At most one request is profiled at
+a time and at most one per ``PROFILE_MIN_INTERVAL_S``; everything else runs
+untouched, so the hook can stay configured in production.
+
+Handlers run on the event loop, so the profile also samples whatever other
+coroutines ran while this request was awaiting; read it as the loop's work
+during the request, with this request's frames dominant.
+"""
+from __future__ import annotations
+
+import cProfile
+from datetime import datetime
+import hmac
+import io
+import json
+from pathlib import Path
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+
+from ..logging_config import get_logger, short_id
+from ..settings import load_settings
+
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+PROFILE_ALLOC_HEADER = b"x-profile-alloc"
+PROFILE_STATS_LIMIT = 40
+PROFILE_ALLOC_LIMIT = 30
+PROFILE_MAX_BODY_BYTES = 1024 * 1024
+
+logger = get_logger()
+
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class ProfileGate:
+    """One profile at a time, and no more than one per interval."""
+
+    def __init__(self, clock=time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._busy = False
+        self._last_started: float | None = None
+
+    def try_acquire(self, min_interval_seconds: float) -> str | None:
+        with self._lock:
+            if self._busy:
+                return "busy"
+            now = self._clock()
+            if self._last_started is not None and now - self._last_started < min_interval_seconds:
+                return "rate_limited"
+            self._busy = True
+            self._last_started = now
+            return None
+
+    def release(self) -> None:
+        with self._lock:
+            self._busy = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._busy = False
+            self._last_started = None
+
+
+profile_gate = ProfileGate()
+
+
+def _header(scope, name: bytes) -> str | None:
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _token_allowed(token: str, allowed: tuple[str, ...]) -> bool:
+    return any(hmac.compare_digest(token.encode(), candidate.encode()) for candidate in allowed)
+
+
+def _interview_id(scope, body: bytes) -> str | None:
+    interview_id = (scope.get("path_params") or {}).get("interview_id")
+    if interview_id:
+        return str(interview_id)
+    if body and len(body) <= PROFILE_MAX_BODY_BYTES:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return None
+        if isinstance(payload, dict) and payload.get("interview_id"):
+            return str(payload["interview_id"])
+    return None
+
+
+def _write_profile(
+    profile_dir: Path,
+    event: str,
+    interview_id: str | None,
+    profiler: cProfile.Profile,
+    allocations: tracemalloc.Snapshot | None
+) -> Path:
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    stem = _SAFE_NAME.sub("_", f"{stamp}-{event}-{short_id(interview_id) if interview_id else 'none'}")
+    base = profile_dir / stem
+    profiler.dump_stats(str(base.with_suffix(".prof")))
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(PROFILE_STATS_LIMIT)
+    base.with_suffix(".txt").write_text(summary.getvalue())
+    if allocations is not None:
+        top = allocations.statistics("lineno")[:PROFILE_ALLOC_LIMIT]
+        base.with_name(f"{stem}-alloc.txt").write_text("\n".join(str(stat) for stat in top) + "\n")
+    return base.with_suffix(".prof")
+
+
+class ProfilerMiddleware:
+    """Profiles a request when it presents a configured profile token and the gate allows it."""
+
+    def __init__(self, app, gate: ProfileGate = profile_gate) -> None:
+        self.app = app
+        self.gate = gate
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _header(scope, PROFILE_TOKEN_HEADER)
+        if not token:
+            await self.app(scope, receive, send)
+            return
+        settings = load_settings()
+        if not settings.profile_tokens or not _token_allowed(token, settings.profile_tokens):
+            logger.warning("event=request_profile status=denied path=%s", scope.get("path"))
+            await self.app(scope, receive, send)
+            return
+        skipped = self.gate.try_acquire(settings.profile_min_interval_s)
+        if skipped:
+            logger.info("event=request_profile status=skipped reason=%s path=%s", skipped, scope.get("path"))
+            await self.app(scope, receive, self._with_header(send, f"skipped={skipped}"))
+            return
+        try:
+            await self._profile(scope, receive, send, settings)
+        finally:
+            self.gate.release()
+
+    async def _profile(self, scope, receive, send, settings) -> None:
+        # The body is read up front so the interview id can be named in the file, then replayed.
+        messages = []
+        body = b""
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        async def replay():
+            if messages:
+                return messages.pop(0)
+            return await receive()
+
+        with_alloc = _header(scope, PROFILE_ALLOC_HEADER) == "1"
+        started_tracemalloc = with_alloc and not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        status = "error"
+        allocations = None
+        outgoing = []
+
+        async def hold(message) -> None:
+            # The response is held until the profile is written so its headers can name the file.
+            outgoing.append(message)
+
+        profiler.enable()
+        try:
+            await self.app(scope, replay, hold)
+            status = "complete"
+        finally:
+            profiler.disable()
+            if with_alloc:
+                allocations = tracemalloc.take_snapshot()
+                if started_tracemalloc:
+                    tracemalloc.stop()
+            endpoint = scope.get("endpoint")
+            event = getattr(endpoint, "__name__", None) or "unmatched"
+            interview_id = _interview_id(scope, body)
+            path = _write_profile(Path(settings.log_dir) / "profiles", event, interview_id, profiler, allocations)
+            logger.info(
+                "event=request_profile status=%s route_event=%s interview_id=%s file=%s alloc=%s duration_ms=%s",
+                status,
+                event,
+                short_id(interview_id),
+                path.name,
+                with_alloc,
+                int((time.perf_counter() - start) * 1000)
+            )
+        send_with_header = self._with_header(send, path.name)
+        for message in outgoing:
+            await send_with_header(message)
+
+    @staticmethod
+    def _with_header(send, value: str):
+        async def wrapped(message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile", value.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        return wrapped
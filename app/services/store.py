@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import json
 from pathlib import Path
 import re
+import time
 from typing import Optional
 
 from ..logging_config import get_logger, short_id
 from ..settings import load_settings
+from .metrics import store_persist_bytes, store_persist_duration
+from .tracing import span
 
 
 _SAFE_USER_ID = re.compile(r"[^a-zA-Z0-9_-]+")
+REHYDRATE_MAX_TURNS = 8
+REHYDRATE_MAX_TEXT = 240
 logger = get_logger()
 
 
@@ -182,6 +188,50 @@ def _build_live_memory(
     return memory
 
 
+def build_rehydrate_prompt(record, transcript_tail: list[dict]) -> str | None:
+    if not record or not transcript_tail:
+        return None
+    lines = []
+    for entry in transcript_tail:
+        role = entry.get("role", "system")
+        text = _truncate_text(entry.get("text", ""), REHYDRATE_MAX_TEXT)
+        if not text:
+            continue
+        lines.append(f"{role}: {text}")
+    if not lines:
+        return None
+    asked_index = record.asked_question_index
+    current_question = ""
+    next_question = ""
+    if asked_index is not None and 0 <= asked_index < len(record.questions):
+        current_question = record.questions[asked_index]
+        next_index = asked_index + 1
+        if 0 <= next_index < len(record.questions):
+            next_question = record.questions[next_index]
+    last_role = transcript_tail[-1].get("role", "system")
+    return (
+        "We got disconnected. Continue the conversation without repeating prior questions.\n"
+        f"Last speaker: {last_role}\n"
+        "Recent transcript:\n"
+        f"{chr(10).join(lines)}\n\n"
+        f"Current question index: {asked_index if asked_index is not None else 'none'}\n"
+        f"Current question: {current_question or 'none'}\n"
+        f"Next question: {next_question or 'none'}\n\n"
+        "Rules:\n"
+        "- If the candidate was mid-answer, let them finish.\n"
+        "- If the candidate's answer was brief or unclear, ask one clarifying follow-up.\n"
+        "- Do not repeat any questions already asked.\n"
+        "- Keep responses concise and friendly."
+    )
+
+
+@dataclass(frozen=True)
+class RehydrateSnapshot:
+    prompt: str
+    turns: int
+    updated_at: str
+
+
 QUESTION_STATUS_DEFAULT = "not_started"
 QUESTION_STATUS_VALUES = {"not_started", "started", "answered"}
 
@@ -206,8 +256,19 @@ def _touch(record: InterviewRecord) -> None:
 
 
 class InterviewStore:
-    def __init__(self, base_dir: Path | None = None, default_user_id: str = "local") -> None:
+    def __init__(
+        self,
+        base_dir: Path | None = None,
+        default_user_id: str = "local",
+        batch_max_entries: int = 8,
+        batch_max_ms: int = 2000
+    ) -> None:
         self._records: dict[tuple[str, str], InterviewRecord] = {}
+        self._rehydrate_snapshots: dict[tuple[str, str], RehydrateSnapshot] = {}
+        self._dirty: dict[tuple[str, str], tuple[int, float]] = {}
+        self._flush_timers: dict[tuple[str, str], tuple[asyncio.AbstractEventLoop, asyncio.TimerHandle]] = {}
+        self._batch_max_entries = batch_max_entries
+        self._batch_max_seconds = batch_max_ms / 1000
         self._base_dir = Path(base_dir) if base_dir else None
         self._default_user_id = default_user_id
         if self._base_dir is not None:
@@ -228,6 +289,12 @@ class InterviewStore:
         return self._base_dir / normalized / f"{interview_id}.json"
 
     def _persist(self, record: InterviewRecord) -> None:
+        self._invalidate_rehydrate_snapshot(record)
+        key = self._record_key(record.interview_id, record.user_id)
+        self._dirty.pop(key, None)
+        timer = self._flush_timers.pop(key, None)
+        if timer is not None:
+            timer[1].cancel()
         path = self._record_path(record.interview_id, record.user_id)
         if path is None:
             logger.info(
@@ -236,11 +303,15 @@ class InterviewStore:
                 short_id(record.user_id)
             )
             return
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = path.with_suffix('.json.tmp')
-        payload = json.dumps(record.to_dict(), indent=2)
-        tmp_path.write_text(payload)
-        tmp_path.replace(path)
+        start = time.perf_counter()
+        with span("store_persist"):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.json.tmp')
+            payload = json.dumps(record.to_dict(), indent=2)
+            tmp_path.write_text(payload)
+            tmp_path.replace(path)
+        store_persist_duration.observe(time.perf_counter() - start)
+        store_persist_bytes.inc(len(payload))
         logger.info(
             "event=store_persist status=complete interview_id=%s user_id=%s bytes=%s",
             short_id(record.interview_id),
@@ -248,6 +319,55 @@ class InterviewStore:
             len(payload)
         )
 
+    def _persist_deferred(self, record: InterviewRecord) -> None:
+        key = self._record_key(record.interview_id, record.user_id)
+        pending, since = self._dirty.get(key, (0, time.monotonic()))
+        pending += 1
+        if pending >= self._batch_max_entries or time.monotonic() - since >= self._batch_max_seconds:
+            self._persist(record)
+            return
+        self._invalidate_rehydrate_snapshot(record)
+        self._dirty[key] = (pending, since)
+        self._schedule_flush(key, self._batch_max_seconds - (time.monotonic() - since))
+
+    def _schedule_flush(self, key: tuple[str, str], delay: float) -> None:
+        # Enforces the age limit during quiet periods. Without a running loop (sync callers)
+        # it is only checked on the next write, flush() or shutdown.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        timer = self._flush_timers.get(key)
+        if timer is not None and timer[0] is loop:
+            return
+        self._flush_timers[key] = (loop, loop.call_later(max(0.0, delay), self._flush_due, key))
+
+    def _flush_due(self, key: tuple[str, str]) -> None:
+        self._flush_timers.pop(key, None)
+        record = self._records.get(key)
+        if key in self._dirty and record is not None:
+            self._persist(record)
+
+    def flush(self, interview_id: str | None = None, user_id: str | None = None) -> int:
+        if interview_id is None:
+            keys = list(self._dirty)
+        else:
+            keys = [self._record_key(interview_id, user_id)]
+        flushed = 0
+        for key in keys:
+            if key not in self._dirty:
+                continue
+            pending, _ = self._dirty[key]
+            record = self._records.get(key)
+            if record is None:
+                self._dirty.pop(key, None)
+                continue
+            self._persist(record)
+            flushed += pending
+        if flushed:
+            logger.info("event=store_flush status=complete records=%s writes=%s", len(keys), flushed)
+        return flushed
+
     def _ensure_question_statuses(self, record: InterviewRecord) -> bool:
         changed = False
         if not record.question_statuses:
@@ -268,6 +388,26 @@ class InterviewStore:
         if memory != record.live_memory:
             record.live_memory = memory
 
+    def _invalidate_rehydrate_snapshot(self, record: InterviewRecord) -> None:
+        # Writes only drop the cached prompt; the next reconnect rebuilds it once.
+        self._rehydrate_snapshots.pop(self._record_key(record.interview_id, record.user_id), None)
+
+    def rehydrate_snapshot(self, interview_id: str, user_id: str | None = None) -> RehydrateSnapshot | None:
+        key = self._record_key(interview_id, user_id)
+        snapshot = self._rehydrate_snapshots.get(key)
+        if snapshot is not None:
+            return snapshot
+        record = self.get(interview_id, user_id)
+        if not record:
+            return None
+        transcript_tail = record.transcript[-REHYDRATE_MAX_TURNS:]
+        prompt = build_rehydrate_prompt(record, transcript_tail)
+        if prompt is None:
+            return None
+        snapshot = RehydrateSnapshot(prompt=prompt, turns=len(transcript_tail), updated_at=record.updated_at)
+        self._rehydrate_snapshots[key] = snapshot
+        return snapshot
+
     def create(
         self,
         interview_id: str,
@@ -307,6 +447,10 @@ class InterviewStore:
         return record
 
     def get(self, interview_id: str, user_id: str | None = None) -> Optional[InterviewRecord]:
+        with span("store_get"):
+            return self._get(interview_id, user_id)
+
+    def _get(self, interview_id: str, user_id: str | None = None) -> Optional[InterviewRecord]:
         key = self._record_key(interview_id, user_id)
         record = self._records.get(key)
         if record:
@@ -343,6 +487,24 @@ class InterviewStore:
         )
         return None
 
+    def reload(self, interview_id: str, user_id: str | None = None) -> Optional[InterviewRecord]:
+        path = self._record_path(interview_id, user_id)
+        if path is None or not path.exists():
+            return self.get(interview_id, user_id)
+        # Another node may have persisted newer state (resume handle, transcript) than our cached copy.
+        self.flush(interview_id, user_id)
+        cached = self._records.pop(self._record_key(interview_id, user_id), None)
+        self._rehydrate_snapshots.pop(self._record_key(interview_id, user_id), None)
+        record = self.get(interview_id, user_id)
+        logger.info(
+            "event=store_reload status=complete interview_id=%s user_id=%s cached=%s changed=%s",
+            short_id(interview_id),
+            short_id(record.user_id if record else self._normalize_user_id(user_id)),
+            cached is not None,
+            bool(cached is not None and record is not None and cached.updated_at != record.updated_at)
+        )
+        return record
+
     def update_transcript(
         self,
         interview_id: str,
@@ -473,8 +635,10 @@ class InterviewStore:
         self,
         interview_id: str,
         entry: dict,
-        user_id: str | None = None
+        user_id: str | None = None,
+        defer_persist: bool = False
     ) -> None:
+        persist = self._persist_deferred if defer_persist else self._persist
         record = self.get(interview_id, user_id)
         if not record:
             logger.info(
@@ -501,7 +665,7 @@ class InterviewStore:
                 last["timestamp"] = payload.get("timestamp")
             self._refresh_live_memory(record)
             _touch(record)
-            self._persist(record)
+            persist(record)
             logger.info(
                 "event=store_append_transcript status=merged interview_id=%s user_id=%s role=%s text_len=%s",
                 short_id(interview_id),
@@ -513,7 +677,7 @@ class InterviewStore:
         record.transcript.append(payload)
         self._refresh_live_memory(record)
         _touch(record)
-        self._persist(record)
+        persist(record)
         logger.info(
             "event=store_append_transcript status=complete interview_id=%s user_id=%s role=%s text_len=%s",
             short_id(interview_id),
@@ -766,4 +930,9 @@ class InterviewStore:
 
 
 settings = load_settings()
-store = InterviewStore(base_dir=Path(settings.session_store_dir), default_user_id=settings.user_id)
+store = InterviewStore(
+    base_dir=Path(settings.session_store_dir),
+    default_user_id=settings.user_id,
+    batch_max_entries=settings.store_batch_max_entries,
+    batch_max_ms=settings.store_batch_max_ms
+)
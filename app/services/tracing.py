@@ -0,0 +1,255 @@
+"""Per-request spans carried in contextvars.
+
+A trace starts at the HTTP middleware (or the live WebSocket start) and every
+``span`` opened underneath it, in the same task, in ``asyncio.to_thread`` or in
+an executor job wrapped with ``in_context``, attaches to it. Spans
+are summed by name into the ``Server-Timing`` header and, when
+``TRACE_EXPORT=1``, written to ``LOG_DIR/traces.jsonl`` in the OpenTelemetry
+span shape through the same queued writer as the app log.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+import contextvars
+from dataclasses import dataclass, field
+import json
+import logging
+from logging.handlers import QueueListener
+from pathlib import Path
+import random
+import threading
+import time
+from typing import Any, Iterator
+
+from ..logging_config import bounded_queue_handler
+from ..settings import load_settings
+
+
+SERVER_TIMING_MAX_STAGES = 12
+TRACE_SKIP_PREFIXES = ("/static/",)
+_TRACE_LOGGER_NAME = "preptalk.trace"
+
+
+@dataclass
+class Trace:
+    trace_id: str
+    export: bool
+    stages: dict[str, list[float]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_stage(self, name: str, duration_ms: float) -> None:
+        with self._lock:
+            stage = self.stages.setdefault(name, [0, 0.0])
+            stage[0] += 1
+            stage[1] += duration_ms
+
+    def server_timing(self, total_ms: float | None = None) -> str:
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda item: item[1][1], reverse=True)
+        parts = [f"{name};dur={duration:.1f}" for name, (_, duration) in stages[:SERVER_TIMING_MAX_STAGES]]
+        if total_ms is not None:
+            parts.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(parts)
+
+
+@dataclass
+class Span:
+    trace: Trace
+    span_id: str
+    parent_id: str | None
+    name: str
+    attributes: dict[str, Any]
+    start_ns: int = 0
+    error: str | None = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar("preptalk_span", default=None)
+_exporter_lock = threading.Lock()
+_exporter: logging.Logger | None = None
+_export_listener: QueueListener | None = None
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def current_trace_id() -> str | None:
+    current = _current_span.get()
+    return current.trace.trace_id if current else None
+
+
+@contextmanager
+def start_trace(name: str, *, export: bool | None = None, **attributes: Any) -> Iterator[Span]:
+    """Opens a root span with a fresh trace id, replacing any trace already in context.
+
+    Callers on a hot path pass ``export`` from settings they already hold; ``None``
+    reads ``TRACE_EXPORT`` from the environment.
+    """
+    if export is None:
+        export = load_settings().trace_export
+    trace = Trace(trace_id=_new_id(128), export=export)
+    with _open_span(trace, None, name, attributes) as root:
+        yield root
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Times a stage of the current trace; a no-op outside one."""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    with _open_span(parent.trace, parent.span_id, name, attributes) as child:
+        yield child
+
+
+@contextmanager
+def detached() -> Iterator[None]:
+    """Clears the trace for tasks created inside, so long-lived loops do not extend a finished request."""
+    token = _current_span.set(None)
+    try:
+        yield
+    finally:
+        _current_span.reset(token)
+
+
+def record_span(name: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+    """Adds an already-measured interval (e.g. executor queue wait) to the current trace."""
+    parent = _current_span.get()
+    if parent is None:
+        return
+    child = Span(parent.trace, _new_id(64), parent.span_id, name, attributes, start_ns)
+    _finish(child, end_ns)
+
+
+def in_context(stage: str, fn):
+    """Wraps ``fn`` for an executor: it runs in the caller's trace and records its queue wait.
+
+    Wrap at submit time (``executor.submit(in_context("tts", fn), **kwargs)``); the
+    wait is measured from the wrap to the moment a worker starts it.
+    """
+    context = contextvars.copy_context()
+    submitted_ns = time.time_ns()
+
+    def run(*args, **kwargs):
+        return context.run(_run_queued, stage, submitted_ns, fn, args, kwargs)
+
+    return run
+
+
+def _run_queued(stage: str, submitted_ns: int, fn, args, kwargs):
+    record_span(f"{stage}_queue_wait", submitted_ns, time.time_ns())
+    return fn(*args, **kwargs)
+
+
+def _new_id(bits: int) -> str:
+    # Trace ids only need to be unique, not unguessable; this avoids a urandom read per span.
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+@contextmanager
+def _open_span(trace: Trace, parent_id: str | None, name: str, attributes: dict[str, Any]) -> Iterator[Span]:
+    current = Span(trace, _new_id(64), parent_id, name, dict(attributes), time.time_ns())
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.error = type(exc).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        _finish(current, time.time_ns())
+
+
+def _finish(finished: Span, end_ns: int) -> None:
+    duration_ms = (end_ns - finished.start_ns) / 1e6
+    if finished.parent_id is not None:
+        finished.trace.add_stage(finished.name, duration_ms)
+    if not finished.trace.export:
+        return
+    _export_logger().info(
+        json.dumps(
+            {
+                "traceId": finished.trace.trace_id,
+                "spanId": finished.span_id,
+                "parentSpanId": finished.parent_id or "",
+                "name": finished.name,
+                "startTimeUnixNano": finished.start_ns,
+                "endTimeUnixNano": end_ns,
+                "attributes": finished.attributes,
+                "status": {"code": "ERROR", "message": finished.error} if finished.error else {"code": "OK"}
+            },
+            default=str
+        )
+    )
+
+
+def _export_logger() -> logging.Logger:
+    global _exporter, _export_listener
+    if _exporter is not None:
+        return _exporter
+    with _exporter_lock:
+        if _exporter is None:
+            log_dir = Path(load_settings().log_dir)
+            log_dir.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.FileHandler(log_dir / "traces.jsonl", encoding="utf-8")
+            file_handler.setFormatter(logging.Formatter("%(message)s"))
+            queue_handler = bounded_queue_handler()
+            _export_listener = QueueListener(queue_handler.queue, file_handler)
+            _export_listener.start()
+            exporter = logging.getLogger(_TRACE_LOGGER_NAME)
+            exporter.setLevel(logging.INFO)
+            exporter.propagate = False
+            exporter.addHandler(queue_handler)
+            _exporter = exporter
+    return _exporter
+
+
+def flush_trace_export() -> None:
+    """Writes out queued spans and closes traces.jsonl; the next exported span reopens it."""
+    global _exporter, _export_listener
+    with _exporter_lock:
+        exporter, listener = _exporter, _export_listener
+        _exporter = _export_listener = None
+    if exporter is None or listener is None:
+        return
+    listener.stop()
+    for handler in list(exporter.handlers):
+        exporter.removeHandler(handler)
+    for handler in listener.handlers:
+        handler.close()
+
+
+class TracingMiddleware:
+    """Starts a trace per HTTP request and reports its stages in ``Server-Timing``.
+
+    ``TRACE_EXPORT`` is read once, when the middleware stack is built, and static
+    asset requests are passed through untraced.
+    """
+
+    def __init__(self, app, skip_prefixes: tuple[str, ...] = TRACE_SKIP_PREFIXES) -> None:
+        self.app = app
+        self.skip_prefixes = skip_prefixes
+        self.export = load_settings().trace_export
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope.get("path", "").startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        with start_trace("http.request", export=self.export, method=scope.get("method", ""), path=scope.get("path", "")) as root:
+
+            async def send_wrapper(message) -> None:
+                if message["type"] == "http.response.start":
+                    root.set(status=message["status"], route=getattr(scope.get("route"), "path", None))
+                    timing = root.trace.server_timing((time.perf_counter() - start) * 1000)
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timing.encode("latin-1")))
+                    headers.append((b"x-trace-id", root.trace.trace_id.encode("ascii")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
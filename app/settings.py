@@ -10,6 +10,27 @@ class AppSettings:
     adapter: str
     live_model: str
     live_model_fallbacks: tuple[str, ...]
+    live_model_hedge_delay_ms: int
+    live_model_unsupported_ttl_s: int
+    live_max_sessions: int
+    live_queue_max: int
+    live_queue_timeout_ms: int
+    live_heartbeat_interval_ms: int
+    live_idle_timeout_ms: int
+    live_drain_timeout_ms: int
+    live_vad_enabled: bool
+    live_vad_threshold_dbfs: float
+    live_vad_hangover_ms: int
+    live_vad_preroll_ms: int
+    live_fake_enabled: bool
+    live_fake_connect_ms: int
+    live_fake_response_ms: int
+    live_fake_failure_rate: float
+    live_fake_drop_rate: float
+    live_fake_unsupported_models: tuple[str, ...]
+    mock_live_frame_ms: int
+    mock_live_turn_gap_ms: int
+    mock_live_script: str | None
     interview_text_model: str
     text_model: str
     ui_dev_mode: bool
@@ -34,14 +55,24 @@ class AppSettings:
     voice_output_mode: str
     api_base: str
     session_store_dir: str
+    store_batch_max_entries: int
+    store_batch_max_ms: int
     log_dir: str
+    log_summary_poll_ms: int
+    trace_export: bool
+    profile_tokens: tuple[str, ...]
+    profile_min_interval_s: int
     user_id: str
     live_resume_enabled: bool
+    live_resume_handoff: bool
+    live_resume_max_age_s: int
     access_tokens: tuple[str, ...]
     redact_resume_pii: bool
     ga4_measurement_id: str | None
     ga4_api_secret: str | None
     ga4_enabled: bool
+    ga4_queue_size: int
+    ga4_flush_ms: int
     telemetry_consent_required: bool
 
 
@@ -145,6 +176,27 @@ def load_settings() -> AppSettings:
         adapter=adapter,
         live_model=live_model,
         live_model_fallbacks=tuple(live_fallbacks),
+        live_model_hedge_delay_ms=max(0, _env_int("GEMINI_LIVE_HEDGE_DELAY_MS", 0)),
+        live_model_unsupported_ttl_s=max(0, _env_int("GEMINI_LIVE_MODEL_UNSUPPORTED_TTL_S", 900)),
+        live_max_sessions=max(0, _env_int("LIVE_MAX_SESSIONS", 0)),
+        live_queue_max=max(0, _env_int("LIVE_QUEUE_MAX", 0)),
+        live_queue_timeout_ms=max(0, _env_int("LIVE_QUEUE_TIMEOUT_MS", 5000)),
+        live_heartbeat_interval_ms=max(0, _env_int("LIVE_HEARTBEAT_INTERVAL_MS", 15000)),
+        live_idle_timeout_ms=max(0, _env_int("LIVE_IDLE_TIMEOUT_MS", 45000)),
+        live_drain_timeout_ms=max(0, _env_int("LIVE_DRAIN_TIMEOUT_MS", 8000)),
+        live_vad_enabled=_env_flag("LIVE_VAD_ENABLED", "0"),
+        live_vad_threshold_dbfs=min(0.0, _env_float("LIVE_VAD_THRESHOLD_DBFS", -45.0)),
+        live_vad_hangover_ms=max(0, _env_int("LIVE_VAD_HANGOVER_MS", 400)),
+        live_vad_preroll_ms=max(0, _env_int("LIVE_VAD_PREROLL_MS", 200)),
+        live_fake_enabled=_env_flag("GEMINI_LIVE_FAKE", "0"),
+        live_fake_connect_ms=max(0, _env_int("GEMINI_LIVE_FAKE_CONNECT_MS", 80)),
+        live_fake_response_ms=max(0, _env_int("GEMINI_LIVE_FAKE_RESPONSE_MS", 400)),
+        live_fake_failure_rate=min(1.0, max(0.0, _env_float("GEMINI_LIVE_FAKE_FAILURE_RATE", 0.0))),
+        live_fake_drop_rate=min(1.0, max(0.0, _env_float("GEMINI_LIVE_FAKE_DROP_RATE", 0.0))),
+        live_fake_unsupported_models=tuple(_env_list("GEMINI_LIVE_FAKE_UNSUPPORTED_MODELS")),
+        mock_live_frame_ms=max(5, _env_int("MOCK_LIVE_FRAME_MS", 20)),
+        mock_live_turn_gap_ms=max(0, _env_int("MOCK_LIVE_TURN_GAP_MS", 400)),
+        mock_live_script=os.getenv("MOCK_LIVE_SCRIPT") or None,
         interview_text_model=interview_text_model,
         text_model=text_model,
         ui_dev_mode=ui_dev_mode,
@@ -169,13 +221,23 @@ def load_settings() -> AppSettings:
         voice_output_mode=os.getenv("VOICE_OUTPUT_MODE", "auto" if adapter == "gemini" else "browser"),
         api_base=os.getenv("APP_API_BASE", "/api"),
         session_store_dir=os.getenv("SESSION_STORE_DIR", str(session_store)),
+        store_batch_max_entries=max(1, _env_int("STORE_BATCH_MAX_ENTRIES", 8)),
+        store_batch_max_ms=max(0, _env_int("STORE_BATCH_MAX_MS", 2000)),
         log_dir=os.getenv("LOG_DIR", str(repo_root / "logs")),
+        log_summary_poll_ms=max(100, _env_int("LOG_SUMMARY_POLL_MS", 1000)),
+        trace_export=_env_flag("TRACE_EXPORT", "0"),
+        profile_tokens=tuple(_env_list("APP_PROFILE_TOKENS")),
+        profile_min_interval_s=max(1, _env_int("PROFILE_MIN_INTERVAL_S", 60)),
         user_id=os.getenv("APP_USER_ID", "local"),
         live_resume_enabled=_env_flag("GEMINI_LIVE_RESUME", "1"),
+        live_resume_handoff=_env_flag("LIVE_RESUME_HANDOFF", "0"),
+        live_resume_max_age_s=max(0, _env_int("LIVE_RESUME_MAX_AGE_S", 7200)),
         access_tokens=tuple(_env_list("APP_ACCESS_TOKENS")),
         redact_resume_pii=_env_flag("APP_REDACT_RESUME_PII", "1"),
         ga4_measurement_id=ga4_measurement_id,
         ga4_api_secret=ga4_api_secret,
         ga4_enabled=bool(ga4_measurement_id and ga4_api_secret),
+        ga4_queue_size=max(1, _env_int("GA4_QUEUE_SIZE", 5000)),
+        ga4_flush_ms=max(100, _env_int("GA4_FLUSH_MS", 2000)),
         telemetry_consent_required=_env_flag("APP_TELEMETRY_REQUIRE_CONSENT", "0")
     )
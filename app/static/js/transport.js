@@ -26,6 +26,7 @@ export class LiveTransport {
     onTranscript,
     onSession,
     onAudio,
+    onMetrics,
     onError,
     onOpen,
     onClose,
@@ -38,6 +39,7 @@ export class LiveTransport {
     this.onTranscript = onTranscript;
     this.onSession = onSession;
     this.onAudio = onAudio;
+    this.onMetrics = onMetrics;
     this.onError = onError;
     this.onOpen = onOpen;
     this.onClose = onClose;
@@ -128,7 +130,13 @@ export class LiveTransport {
   }
 
   start(interviewId, userId, { resume = false, liveModel } = {}) {
-    const payload = { type: 'start', interview_id: interviewId, user_id: userId };
+    const payload = {
+      type: 'start',
+      interview_id: interviewId,
+      user_id: userId,
+      input_sample_rate: this.sampleRate,
+      input_format: 'pcm16'
+    };
     if (resume) {
       payload.resume = true;
     }
@@ -232,6 +240,10 @@ export class LiveTransport {
 
     if (!payload?.type) return;
     if (payload.type === 'status') {
+      if (payload.state === 'capacity') {
+        // The server is shedding load; reconnecting straight away would only add to it.
+        this.shouldReconnect = false;
+      }
       this.onStatus?.(payload);
     } else if (payload.type === 'transcript') {
       this.onTranscript?.(payload);
@@ -239,6 +251,8 @@ export class LiveTransport {
       this.onSession?.(payload);
     } else if (payload.type === 'audio') {
       this.onAudio?.(payload);
+    } else if (payload.type === 'metrics') {
+      this.onMetrics?.(payload);
     } else if (payload.type === 'error') {
       this.onError?.(payload);
     }
@@ -752,6 +752,40 @@ export function appendTranscriptEntry(state, entry) {
   return { entry: nextEntry, merged: false };
 }
 
+export function applyLiveTranscript(state, payload) {
+  if (!state || !payload) return null;
+  const transcript = Array.isArray(state.transcript) ? state.transcript : [];
+  state.transcript = transcript;
+  const isInterim = payload.is_final === false;
+  const pending = state.liveTranscriptInterim;
+  const last = transcript[transcript.length - 1];
+  let replaced = false;
+  if (pending && pending.entry === last && pending.role === payload.role) {
+    if (isInterim) {
+      return appendTranscriptEntry(state, payload);
+    }
+    // The final commit carries the whole utterance, so drop the interim fragments first.
+    if (pending.base === null) {
+      transcript.pop();
+    } else {
+      last.text = pending.base;
+    }
+    replaced = true;
+  }
+  state.liveTranscriptInterim = null;
+  const base = last && last.role === payload.role && !replaced ? last.text || '' : null;
+  const result = appendTranscriptEntry(state, payload);
+  if (!result) return null;
+  if (isInterim) {
+    state.liveTranscriptInterim = {
+      role: payload.role,
+      entry: result.entry,
+      base: replaced ? pending.base : base
+    };
+  }
+  return { ...result, replaced };
+}
+
 
 function createListPlaceholder(text) {
   const item = document.createElement('li');
@@ -2531,12 +2565,13 @@ function buildControlsPanel(state, ui, config) {
   }
 
   function handleTranscript(payload) {
-    const result = appendTranscriptEntry(state, {
+    const result = applyLiveTranscript(state, {
       role: payload.role,
       text: payload.text,
-      timestamp: payload.timestamp
+      timestamp: payload.timestamp,
+      is_final: payload.is_final
     });
-    if (payload.role === 'candidate' && result?.entry && !result.merged) {
+    if (payload.role === 'candidate' && result?.entry && !result.merged && !result.replaced) {
       sendJourneyEvent(state, 'journey_candidate_spoke', {
         step: 'candidate_spoke',
         status: state.voiceMode,
@@ -3106,6 +3141,21 @@ function buildControlsPanel(state, ui, config) {
           if (payload.state === 'thinking') {
             updateStatusPill(statusPill, { label: 'Thinking', tone: 'info' });
           }
+          if (payload.state === 'capacity') {
+            sendClientEvent(state, 'ws_capacity', { status: payload.state });
+            if (state.sessionActive) {
+              void endLiveSession({ label: 'Server busy', tone: 'warning', allowRestart: true });
+              return;
+            }
+            updateStatusPill(statusPill, { label: 'Server busy', tone: 'warning' });
+          }
+          if (payload.state === 'draining') {
+            // The server is restarting; the socket closes next and the reconnect resumes the session.
+            state.geminiReady = false;
+            stopAudioBuffer(state);
+            updateStatusPill(statusPill, { label: 'Server restarting', tone: 'warning' });
+            sendClientEvent(state, 'ws_draining', { status: payload.state, resumable: Boolean(payload.resume_handle) });
+          }
           if (payload.state === 'gemini-error') {
             state.geminiReady = false;
             stopAudioBuffer(state);
@@ -3136,6 +3186,11 @@ function buildControlsPanel(state, ui, config) {
         },
         onAudio: (payload) => {
           handleLiveAudio(payload);
+        },
+        onMetrics: (payload) => {
+          // Only sent when UI_DEV_MODE is on; kept on state for the debug overlay and console.
+          state.liveMetrics = payload;
+          console.debug('Live turn metrics', payload.turn);
         }
       });
       if (typeof window !== 'undefined' && window.__E2E__) {
@@ -4127,6 +4182,8 @@ export function buildVoiceLayout() {
     questionInsightsPinnedIndex: null,
     questionInsightsActiveIndex: null,
     transcript: [],
+    liveTranscriptInterim: null,
+    liveMetrics: null,
     score: null,
     scorePending: false,
     scoreError: false,
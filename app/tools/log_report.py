@@ -0,0 +1,395 @@
+"""Summarize archived app logs in parallel and write CSV/JSON reports.
+
+Run: python -m app.tools.log_report [LOG_FILES...] [--out DIR] [--workers N]
+
+With no files it reads LOG_DIR/archive/app-*.log plus LOG_DIR/app.log. Each
+file is split into newline-aligned byte ranges that worker processes stream
+line by line, so a multi-GB file is never held in memory. Latencies are kept
+in mergeable quantile sketches; per-session timeline rows are written to disk
+as they are read rather than collected. Per-session summaries are spilled per
+range, sorted by session, and merged while ``sessions.csv`` is written, so
+memory grows with the sessions in one range, not in the whole archive;
+``report.json`` lists only the busiest ``SESSION_REPORT_TOP`` of them.
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from dataclasses import dataclass, field
+import heapq
+from itertools import groupby
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+import sys
+import tempfile
+
+from ..services.latency_sketch import QuantileSketch
+from ..services.log_parse import parse_log_line
+from ..settings import load_settings
+
+
+DEFAULT_CHUNK_BYTES = 128 * 1024 * 1024
+ERROR_CLUSTER_LIMIT = 500
+ERROR_EXAMPLE_CHARS = 300
+TIMELINE_FIELDS = ("session", "timestamp", "level", "event", "status", "duration_ms", "source")
+SESSION_FIELDS = ("session", "first_seen", "last_seen", "first_event", "last_event", "events", "errors")
+SESSION_REPORT_TOP = 100
+CLIENT_DISCONNECT_TYPES = {"ws_close", "ws_disconnected", "ws_error"}
+REPORT_QUANTILES = (("p50_ms", 0.5), ("p90_ms", 0.9), ("p99_ms", 0.99))
+
+_VOLATILE = re.compile(r"\b[0-9a-f]{8,}\b|\d+(?:\.\d+)?", re.IGNORECASE)
+
+
+@dataclass
+class ChunkReport:
+    lines: int = 0
+    unparsed: int = 0
+    latency: dict[tuple[str, str, str], QuantileSketch] = field(default_factory=dict)
+    errors: dict[str, dict] = field(default_factory=dict)
+    disconnects: dict[str, dict[str, int]] = field(default_factory=dict)
+    sessions: dict[str, dict] = field(default_factory=dict)
+
+    def merge(self, other: ChunkReport) -> None:
+        self.lines += other.lines
+        self.unparsed += other.unparsed
+        for key, sketch in other.latency.items():
+            mine = self.latency.get(key)
+            if mine is None:
+                self.latency[key] = sketch
+            else:
+                mine.merge(sketch)
+        for signature, cluster in other.errors.items():
+            _merge_cluster(self.errors, signature, cluster)
+        for day, counts in other.disconnects.items():
+            mine = self.disconnects.setdefault(day, {})
+            for name, value in counts.items():
+                mine[name] = mine.get(name, 0) + value
+        for session, summary in other.sessions.items():
+            mine = self.sessions.get(session)
+            if mine is None:
+                self.sessions[session] = summary
+            else:
+                _merge_session(mine, summary)
+
+
+def _merge_session(mine: dict, summary: dict) -> None:
+    mine["events"] += summary["events"]
+    mine["errors"] += summary["errors"]
+    if summary["first_seen"] < mine["first_seen"]:
+        mine["first_seen"] = summary["first_seen"]
+        mine["first_event"] = summary["first_event"]
+    if summary["last_seen"] >= mine["last_seen"]:
+        mine["last_seen"] = summary["last_seen"]
+        mine["last_event"] = summary["last_event"]
+
+
+def _merge_cluster(clusters: dict[str, dict], signature: str, cluster: dict) -> None:
+    mine = clusters.get(signature)
+    if mine is None:
+        if len(clusters) >= ERROR_CLUSTER_LIMIT and signature != "other":
+            _merge_cluster(clusters, "other", {**cluster, "event": "other", "status": "", "error": ""})
+            return
+        clusters[signature] = dict(cluster)
+        return
+    mine["count"] += cluster["count"]
+    mine["first_seen"] = min(mine["first_seen"], cluster["first_seen"])
+    mine["last_seen"] = max(mine["last_seen"], cluster["last_seen"])
+
+
+def _error_signature(parsed: dict) -> tuple[str, str]:
+    error = _VOLATILE.sub("#", str(parsed.get("error") or parsed.get("reason") or ""))
+    event = parsed.get("event") or "unknown"
+    status = parsed.get("status") or ""
+    return f"{event}|{status}|{error}", error
+
+
+def chunk_ranges(path: Path, chunk_bytes: int) -> list[tuple[str, int, int]]:
+    size = path.stat().st_size
+    if size == 0:
+        return []
+    return [(str(path), start, min(start + chunk_bytes, size)) for start in range(0, size, max(1, chunk_bytes))]
+
+
+def scan_chunk(
+    path: str,
+    start: int,
+    end: int,
+    timeline_path: str | None = None,
+    sessions_path: str | None = None
+) -> ChunkReport:
+    """Reads every line that starts inside [start, end) of ``path``.
+
+    With ``sessions_path`` the session summaries are written there, sorted by
+    session, and left out of the returned report.
+    """
+    report = ChunkReport()
+    source = Path(path).name
+    timeline = open(timeline_path, "w", newline="", encoding="utf-8") if timeline_path else None
+    writer = csv.writer(timeline) if timeline else None
+    try:
+        with open(path, "rb") as handle:
+            if start:
+                # The line straddling ``start`` belongs to the previous range.
+                handle.seek(start - 1)
+                handle.readline()
+            while handle.tell() < end:
+                raw = handle.readline()
+                if not raw:
+                    break
+                _scan_line(report, raw.decode("utf-8", errors="replace").rstrip("\r\n"), writer, source)
+    finally:
+        if timeline:
+            timeline.close()
+    if sessions_path:
+        with open(sessions_path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            for session in sorted(report.sessions):
+                summary = report.sessions[session]
+                writer.writerow((session, *(summary[name] for name in SESSION_FIELDS[1:])))
+        report.sessions = {}
+    return report
+
+
+def _read_sessions(path: str):
+    if not os.path.exists(path):
+        return
+    with open(path, newline="", encoding="utf-8") as handle:
+        for row in csv.reader(handle):
+            summary = dict(zip(SESSION_FIELDS, row))
+            summary["events"] = int(summary["events"])
+            summary["errors"] = int(summary["errors"])
+            yield summary
+
+
+def merge_sessions(spill_paths: list[str], out_path: Path, top: int | None = None) -> tuple[int, list[dict]]:
+    """Merges sorted per-range spills into ``out_path``; returns the session count and the busiest ``top``."""
+    top = SESSION_REPORT_TOP if top is None else top
+    count = 0
+    busiest: list[tuple[int, int, dict]] = []
+    merged_rows = heapq.merge(*(_read_sessions(path) for path in spill_paths), key=lambda row: row["session"])
+    with out_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(SESSION_FIELDS))
+        writer.writeheader()
+        for _, rows in groupby(merged_rows, key=lambda row: row["session"]):
+            summary = next(rows)
+            for row in rows:
+                _merge_session(summary, row)
+            writer.writerow(summary)
+            count += 1
+            # Sessions arrive sorted; -count ranks the earlier one higher on equal event counts.
+            entry = (summary["events"], -count, summary)
+            if len(busiest) < top:
+                heapq.heappush(busiest, entry)
+            elif top and entry[:2] > busiest[0][:2]:
+                heapq.heapreplace(busiest, entry)
+    ranked = sorted(busiest, key=lambda entry: entry[:2], reverse=True)
+    return count, [summary for _, _, summary in ranked]
+
+
+def _scan_line(report: ChunkReport, line: str, writer, source: str) -> None:
+    if not line:
+        return
+    report.lines += 1
+    parsed = parse_log_line(line)
+    timestamp = parsed.get("timestamp")
+    event = parsed.get("event")
+    if not timestamp or not event:
+        report.unparsed += 1
+        return
+    day = timestamp[:10]
+    status = parsed.get("status") or ""
+    level = parsed.get("level") or ""
+    is_error = level in {"ERROR", "CRITICAL"} or status == "error"
+
+    duration_ms = parsed.get("duration_ms")
+    if duration_ms is not None and not is_error:
+        try:
+            value_ms = float(duration_ms)
+        except ValueError:
+            value_ms = None
+        if value_ms is not None:
+            model = parsed.get("effective_model") or parsed.get("model") or parsed.get("requested_model") or ""
+            key = (day, event, model)
+            sketch = report.latency.get(key)
+            if sketch is None:
+                sketch = report.latency[key] = QuantileSketch()
+            sketch.add(value_ms)
+
+    if is_error:
+        signature, error = _error_signature(parsed)
+        _merge_cluster(
+            report.errors,
+            signature,
+            {
+                "event": event,
+                "status": status,
+                "error": error,
+                "count": 1,
+                "first_seen": timestamp,
+                "last_seen": timestamp,
+                "example": line[:ERROR_EXAMPLE_CHARS]
+            }
+        )
+
+    counts = report.disconnects.setdefault(day, {})
+    if event == "ws_connect":
+        counts["ws_connects"] = counts.get("ws_connects", 0) + 1
+    elif event == "ws_disconnect":
+        counts["server_disconnects"] = counts.get("server_disconnects", 0) + 1
+    elif event == "gemini_live_receive" and status == "ended":
+        counts["gemini_disconnects"] = counts.get("gemini_disconnects", 0) + 1
+    elif event == "client_event" and parsed.get("event_type") in CLIENT_DISCONNECT_TYPES:
+        counts["client_disconnects"] = counts.get("client_disconnects", 0) + 1
+
+    session = parsed.get("session_id") or parsed.get("interview_id")
+    if not session or session == "unknown":
+        return
+    if writer is not None:
+        writer.writerow((session, timestamp, level, event, status, duration_ms or "", source))
+    summary = report.sessions.get(session)
+    if summary is None:
+        report.sessions[session] = {
+            "first_seen": timestamp,
+            "last_seen": timestamp,
+            "first_event": event,
+            "last_event": event,
+            "events": 1,
+            "errors": int(is_error)
+        }
+        return
+    summary["events"] += 1
+    summary["errors"] += int(is_error)
+    if timestamp < summary["first_seen"]:
+        summary["first_seen"], summary["first_event"] = timestamp, event
+    if timestamp >= summary["last_seen"]:
+        summary["last_seen"], summary["last_event"] = timestamp, event
+
+
+def _quantiles(sketch: QuantileSketch) -> dict:
+    row = {"count": sketch.count}
+    for name, quantile in REPORT_QUANTILES:
+        value = sketch.quantile(quantile)
+        row[name] = round(value, 1) if value is not None else None
+    row["max_ms"] = round(sketch.max_ms, 1) if sketch.max_ms is not None else None
+    return row
+
+
+def build_report(
+    report: ChunkReport,
+    files: list[str],
+    sessions: list[dict] | None = None,
+    session_count: int | None = None
+) -> dict:
+    by_model: dict[tuple[str, str], QuantileSketch] = {}
+    latency_by_day = []
+    for (day, event, model), sketch in sorted(report.latency.items()):
+        latency_by_day.append({"day": day, "event": event, "model": model, **_quantiles(sketch)})
+        merged = by_model.setdefault((event, model), QuantileSketch())
+        merged.merge(sketch)
+    latency_by_model = [
+        {"event": event, "model": model, **_quantiles(sketch)} for (event, model), sketch in sorted(by_model.items())
+    ]
+    disconnects_by_day = []
+    for day, counts in sorted(report.disconnects.items()):
+        connects = counts.get("ws_connects", 0)
+        row = {"day": day, "ws_connects": connects}
+        for name in ("client_disconnects", "server_disconnects", "gemini_disconnects"):
+            row[name] = counts.get(name, 0)
+            row[name.replace("_disconnects", "_disconnect_rate")] = round(row[name] / connects, 3) if connects else None
+        disconnects_by_day.append(row)
+    errors = sorted(report.errors.values(), key=lambda cluster: cluster["count"], reverse=True)
+    if sessions is None:
+        sessions = [{"session": session, **summary} for session, summary in sorted(report.sessions.items())]
+    return {
+        "files": files,
+        "lines": report.lines,
+        "unparsed_lines": report.unparsed,
+        "latency_by_day": latency_by_day,
+        "latency_by_model": latency_by_model,
+        "disconnects_by_day": disconnects_by_day,
+        "error_clusters": errors,
+        "session_count": len(sessions) if session_count is None else session_count,
+        "sessions": sessions
+    }
+
+
+def _write_csv(path: Path, rows: list[dict]) -> None:
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        if not rows:
+            return
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def default_log_files() -> list[Path]:
+    log_dir = Path(load_settings().log_dir)
+    files = sorted((log_dir / "archive").glob("app-*.log"))
+    if (log_dir / "app.log").exists():
+        files.append(log_dir / "app.log")
+    return files
+
+
+def run(paths: list[Path], out_dir: Path, workers: int, chunk_bytes: int) -> dict:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [task for path in paths for task in chunk_ranges(path, chunk_bytes)]
+    part_dir = Path(tempfile.mkdtemp(prefix="timeline-", dir=out_dir))
+    part_paths = [str(part_dir / f"part-{index:05d}.csv") for index in range(len(tasks))]
+    session_paths = [str(part_dir / f"sessions-{index:05d}.csv") for index in range(len(tasks))]
+    total = ChunkReport()
+    try:
+        if workers <= 1 or len(tasks) <= 1:
+            results = (
+                scan_chunk(*task, part, sessions) for task, part, sessions in zip(tasks, part_paths, session_paths)
+            )
+            for result in results:
+                total.merge(result)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # map keeps input order, so the concatenated timeline follows file order.
+                for result in pool.map(scan_chunk, *zip(*tasks), part_paths, session_paths):
+                    total.merge(result)
+        with (out_dir / "timelines.csv").open("wb") as timeline:
+            timeline.write((",".join(TIMELINE_FIELDS) + "\r\n").encode("utf-8"))
+            for part in part_paths:
+                if os.path.exists(part):
+                    with open(part, "rb") as handle:
+                        shutil.copyfileobj(handle, timeline)
+        session_count, sessions = merge_sessions(session_paths, out_dir / "sessions.csv")
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+
+    report = build_report(total, [str(path) for path in paths], sessions, session_count)
+    _write_csv(out_dir / "latency_by_day.csv", report["latency_by_day"])
+    _write_csv(out_dir / "latency_by_model.csv", report["latency_by_model"])
+    _write_csv(out_dir / "disconnects_by_day.csv", report["disconnects_by_day"])
+    _write_csv(out_dir / "error_clusters.csv", report["error_clusters"])
+    (out_dir / "report.json").write_text(json.dumps(report, indent=2))
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.tools.log_report", description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, help="log files (default: LOG_DIR archive plus app.log)")
+    parser.add_argument("--out", type=Path, default=Path("log-report"), help="output directory (default log-report)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-mb", type=float, default=DEFAULT_CHUNK_BYTES / (1024 * 1024), help="bytes per work unit")
+    args = parser.parse_args(argv)
+    paths = args.files or default_log_files()
+    if not paths:
+        print("No log files found.", file=sys.stderr)
+        return 1
+    report = run(paths, args.out, args.workers, max(1, int(args.chunk_mb * 1024 * 1024)))
+    print(
+        f"files={len(paths)} lines={report['lines']} latency_rows={len(report['latency_by_day'])} "
+        f"error_clusters={len(report['error_clusters'])} sessions={report['session_count']} out={args.out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
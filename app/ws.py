@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 import base64
 import json
-import math
 import time
 from typing import Any
 
@@ -13,17 +12,23 @@ from starlette.websockets import WebSocketDisconnect
 from .access_control import resolve_websocket_access
 from .services import interview_service
 from .services.adapters import get_adapter
+from .services.audio_resample import DEFAULT_INPUT_FORMAT, DEFAULT_INPUT_SAMPLE_RATE, PcmConverter
+from .services.audio_vad import EnergyVad
 from .services.gemini_live import GeminiLiveBridge
+from .services.live_capacity import LIVE_CAPACITY_CLOSE_CODE, LIVE_IDLE_CLOSE_CODE, live_capacity
+from .services.live_drain import LIVE_DRAIN_CLOSE_CODE, live_drain
+from .services.live_models import live_model_capabilities
+from .services.metrics import ws_active_sessions, ws_audio_in_bytes, ws_sessions
 from .services.live_context import build_live_system_prompt
+from .services.mock_live import MockLiveStreamer, load_mock_script, mock_turns
 from .services.store import store
+from .services.tracing import span, start_trace
 from .settings import load_settings
 from .logging_config import get_logger, short_id
 
 logger = get_logger()
 
 
-MOCK_AUDIO_SAMPLE_RATE = 24000
-MOCK_AUDIO_BASE64 = None
 LIVE_MODEL_UNSUPPORTED_MARKERS = (
     "bidigeneratecontent",
     "not supported for bidi",
@@ -49,19 +54,6 @@ def _build_live_model_candidates(primary: str | None, fallbacks: tuple[str, ...]
     return models
 
 
-def _mock_audio_base64(duration_ms: int = 180, frequency: float = 440.0) -> str:
-    global MOCK_AUDIO_BASE64
-    if MOCK_AUDIO_BASE64 is not None:
-        return MOCK_AUDIO_BASE64
-    sample_count = int(MOCK_AUDIO_SAMPLE_RATE * duration_ms / 1000)
-    amplitude = 0.2
-    pcm = bytearray()
-    for i in range(sample_count):
-        value = int(amplitude * 32767 * math.sin(2 * math.pi * frequency * i / MOCK_AUDIO_SAMPLE_RATE))
-        pcm.extend(int(value).to_bytes(2, byteorder='little', signed=True))
-    MOCK_AUDIO_BASE64 = base64.b64encode(pcm).decode('ascii')
-    return MOCK_AUDIO_BASE64
-
 class LiveWebSocketSession:
     def __init__(self, websocket: WebSocket, access_user_id: str | None = None) -> None:
         self.websocket = websocket
@@ -79,9 +71,18 @@ class LiveWebSocketSession:
         self._audio_frames = 0
         self._audio_bytes = 0
         self._live_model_override: str | None = None
+        self._holds_live_slot = False
+        self._vad: EnergyVad | None = None
+        self._input_converter = PcmConverter(DEFAULT_INPUT_SAMPLE_RATE, DEFAULT_INPUT_FORMAT)
+        self._connected_at = time.monotonic()
+        self._last_inbound_at = self._connected_at
+        self._close_code: int | None = None
 
     async def run(self) -> None:
         await self.websocket.accept()
+        live_drain.register(self)
+        ws_sessions.inc()
+        ws_active_sessions.inc()
         await self._send({"type": "status", "state": "connected"})
 
         client = self.websocket.client
@@ -92,19 +93,21 @@ class LiveWebSocketSession:
         try:
             while self._active:
                 try:
-                    message = await self.websocket.receive()
+                    message = await asyncio.wait_for(self.websocket.receive(), timeout=self._receive_timeout())
+                except asyncio.TimeoutError:
+                    if await self._reap_if_idle():
+                        break
+                    await self._send({"type": "status", "state": "heartbeat"})
+                    continue
                 except WebSocketDisconnect:
                     break
+                self._last_inbound_at = time.monotonic()
 
                 if message.get("type") == "websocket.disconnect":
                     break
 
                 if message.get("bytes") is not None:
-                    chunk = message["bytes"]
-                    self._audio_frames += 1
-                    self._audio_bytes += len(chunk)
-                    if self._gemini_bridge:
-                        await self._gemini_bridge.send_audio(chunk)
+                    await self._forward_audio(message["bytes"])
                     continue
 
                 if not message.get("text"):
@@ -121,6 +124,35 @@ class LiveWebSocketSession:
         finally:
             await self._shutdown()
 
+    def _receive_timeout(self) -> float | None:
+        interval = self.settings.live_heartbeat_interval_ms / 1000
+        idle_timeout = self.settings.live_idle_timeout_ms / 1000
+        if idle_timeout <= 0:
+            return interval or None
+        idle_left = max(0.0, self._last_inbound_at + idle_timeout - time.monotonic())
+        return min(interval, idle_left) if interval else idle_left
+
+    async def _reap_if_idle(self) -> bool:
+        idle_timeout = self.settings.live_idle_timeout_ms / 1000
+        now = time.monotonic()
+        idle_seconds = now - self._last_inbound_at
+        if idle_timeout <= 0 or idle_seconds < idle_timeout:
+            return False
+        had_bridge = self._gemini_bridge is not None
+        live_capacity.record_reap(idle_seconds)
+        logger.warning(
+            "event=ws_idle_reap status=closed user_id=%s interview_id=%s session_id=%s idle_ms=%s connected_ms=%s bridge=%s",
+            short_id(self._user_id),
+            short_id(self._interview_id),
+            short_id(self._session_id),
+            int(idle_seconds * 1000),
+            int((now - self._connected_at) * 1000),
+            had_bridge
+        )
+        self._active = False
+        self._close_code = LIVE_IDLE_CLOSE_CODE
+        return True
+
     async def _handle_payload(self, payload: dict[str, Any]) -> None:
         message_type = payload.get("type")
         if message_type == "start":
@@ -134,9 +166,7 @@ class LiveWebSocketSession:
                 except (ValueError, TypeError):
                     await self._send({"type": "error", "message": "Invalid audio payload."})
                     return
-                self._audio_frames += 1
-                self._audio_bytes += len(audio_bytes)
-                await self._gemini_bridge.send_audio(audio_bytes)
+                await self._forward_audio(audio_bytes)
             return
         elif message_type == "barge_in":
             if self._gemini_bridge:
@@ -157,6 +187,29 @@ class LiveWebSocketSession:
             )
             await self._send({"type": "error", "message": "Unknown message type."})
 
+    async def _forward_audio(self, chunk: bytes) -> None:
+        self._audio_frames += 1
+        self._audio_bytes += len(chunk)
+        ws_audio_in_bytes.inc(len(chunk))
+        bridge = self._gemini_bridge
+        if not bridge:
+            return
+        chunk = self._input_converter.convert(chunk)
+        if not chunk:
+            return
+        if not self.settings.live_vad_enabled:
+            await bridge.send_audio(chunk)
+            return
+        if self._vad is None:
+            self._vad = EnergyVad(
+                bridge.input_sample_rate,
+                threshold_dbfs=self.settings.live_vad_threshold_dbfs,
+                hangover_ms=self.settings.live_vad_hangover_ms,
+                preroll_ms=self.settings.live_vad_preroll_ms
+            )
+        for frame in self._vad.process(chunk):
+            await bridge.send_audio(frame)
+
     async def _handle_start(self, payload: dict[str, Any]) -> None:
         interview_id = payload.get("interview_id")
         user_id = self._access_user_id or payload.get("user_id") or self.settings.user_id
@@ -171,8 +224,19 @@ class LiveWebSocketSession:
         else:
             live_model = None
         self._live_model_override = live_model
+        try:
+            input_converter = PcmConverter(
+                int(payload.get("input_sample_rate") or DEFAULT_INPUT_SAMPLE_RATE),
+                str(payload.get("input_format") or DEFAULT_INPUT_FORMAT).strip().lower()
+            )
+        except (TypeError, ValueError):
+            await self._send({"type": "error", "message": "Unsupported input audio format."})
+            return
 
-        record = store.get(interview_id, self._user_id)
+        if resume_requested and self.settings.live_resume_handoff:
+            record = store.reload(interview_id, self._user_id)
+        else:
+            record = store.get(interview_id, self._user_id)
         if not record:
             logger.warning(
                 "event=ws_start status=not_found user_id=%s interview_id=%s",
@@ -182,9 +246,27 @@ class LiveWebSocketSession:
             await self._send({"type": "error", "message": "Interview not found."})
             return
 
+        if live_drain.draining:
+            await self._send(
+                {
+                    "type": "status",
+                    "state": "draining",
+                    "interview_id": interview_id,
+                    "resume_handle": record.live_resume_handle,
+                    "message": "Server is restarting. Reconnecting shortly."
+                }
+            )
+            self._active = False
+            self._close_code = LIVE_DRAIN_CLOSE_CODE
+            return
+
+        if not await self._acquire_live_slot(interview_id):
+            return
+
         try:
             live_payload = interview_service.start_live_session(interview_id, self._user_id)
         except RuntimeError as exc:
+            self._release_live_slot()
             await self._send({"type": "error", "message": str(exc)})
             return
 
@@ -195,36 +277,106 @@ class LiveWebSocketSession:
                 "session_id": live_payload["session_id"],
                 "adapter": self.adapter.name,
                 "live_model": self._live_model_override or self.settings.live_model,
-                "mode": live_payload["mode"]
+                "mode": live_payload["mode"],
+                "input_sample_rate": input_converter.source_rate,
+                "input_format": input_converter.source_format
             }
         )
 
         self._interview_id = interview_id
+        self._input_converter = input_converter
         self._session_id = live_payload.get("session_id")
         self._session_started_at = time.perf_counter()
         self._audio_frames = 0
         self._audio_bytes = 0
 
         logger.info(
-            "event=ws_start status=complete user_id=%s interview_id=%s session_id=%s adapter=%s mode=%s resume=%s",
+            "event=ws_start status=complete user_id=%s interview_id=%s session_id=%s adapter=%s mode=%s resume=%s "
+            "input_rate=%s input_format=%s upstream_rate=%s",
             short_id(self._user_id),
             short_id(interview_id),
             short_id(self._session_id),
             self.adapter.name,
             live_payload.get("mode"),
-            resume_requested
+            resume_requested,
+            input_converter.source_rate,
+            input_converter.source_format,
+            input_converter.target_rate
         )
 
         if self.adapter.name == "gemini":
-            await self._start_gemini_session(interview_id, record, resume_requested)
+            with start_trace(
+                "ws.live_start",
+                export=self.settings.trace_export,
+                interview_id=short_id(interview_id),
+                resume=resume_requested
+            ) as root:
+                await self._start_gemini_session(interview_id, record, resume_requested)
+            logger.info(
+                "event=ws_live_start status=traced user_id=%s interview_id=%s trace_id=%s stages=%s",
+                short_id(self._user_id),
+                short_id(interview_id),
+                root.trace.trace_id,
+                root.trace.server_timing().replace(" ", "")
+            )
 
         mock_transcript = live_payload.get("mock_transcript")
         if mock_transcript:
             if self._stream_task and not self._stream_task.done():
                 self._stream_task.cancel()
-            self._stream_task = asyncio.create_task(
-                self._stream_mock_transcript(interview_id, self._user_id, mock_transcript)
+            if self.settings.mock_live_script:
+                mock_transcript = load_mock_script(self.settings.mock_live_script)
+            streamer = MockLiveStreamer(
+                self._send,
+                interview_id,
+                self._user_id,
+                mock_turns(mock_transcript),
+                frame_ms=self.settings.mock_live_frame_ms,
+                gap_ms=self.settings.mock_live_turn_gap_ms
             )
+            self._stream_task = asyncio.create_task(streamer.run())
+
+    async def _acquire_live_slot(self, interview_id: str) -> bool:
+        if self._holds_live_slot:
+            return True
+        start = time.perf_counter()
+        admitted = await live_capacity.acquire(
+            self.settings.live_max_sessions,
+            self.settings.live_queue_max,
+            self.settings.live_queue_timeout_ms / 1000
+        )
+        capacity = live_capacity.snapshot()
+        if admitted:
+            self._holds_live_slot = True
+            if self.settings.live_max_sessions:
+                logger.info(
+                    "event=live_capacity status=admitted user_id=%s interview_id=%s active=%s queued=%s wait_ms=%s",
+                    short_id(self._user_id),
+                    short_id(interview_id),
+                    capacity["active"],
+                    capacity["queued"],
+                    int((time.perf_counter() - start) * 1000)
+                )
+            return True
+        logger.warning(
+            "event=live_capacity status=rejected user_id=%s interview_id=%s active=%s queued=%s rejected=%s wait_ms=%s",
+            short_id(self._user_id),
+            short_id(interview_id),
+            capacity["active"],
+            capacity["queued"],
+            capacity["rejected"],
+            int((time.perf_counter() - start) * 1000)
+        )
+        await self._send({"type": "status", "state": "capacity", "message": "Live sessions are at capacity. Try again shortly."})
+        self._active = False
+        self._close_code = LIVE_CAPACITY_CLOSE_CODE
+        return False
+
+    def _release_live_slot(self) -> None:
+        if not self._holds_live_slot:
+            return
+        self._holds_live_slot = False
+        live_capacity.release()
 
     async def _start_gemini_session(self, interview_id: str, record, resume_requested: bool) -> None:
         if self._gemini_bridge is not None:
@@ -233,6 +385,7 @@ class LiveWebSocketSession:
         api_key = getattr(self.adapter, "api_key", None)
         if not api_key:
             logger.warning("event=gemini_live_connect status=missing_key user_id=%s interview_id=%s", self._user_id, interview_id)
+            self._release_live_slot()
             await self._send({"type": "error", "message": "GEMINI_API_KEY or GOOGLE_API_KEY is required."})
             return
 
@@ -248,49 +401,121 @@ class LiveWebSocketSession:
             requested_model
         )
 
-        system_prompt = build_live_system_prompt(record)
-        for index, model in enumerate(candidate_models):
-            self._gemini_bridge = GeminiLiveBridge(
-                api_key=api_key,
-                model=model,
-                interview_id=interview_id,
-                user_id=self._user_id,
-                send_json=self._send,
-                system_prompt=system_prompt,
-                resume_enabled=self.settings.live_resume_enabled,
-                resume_requested=resume_requested
+        candidate_models, skipped_models = live_model_capabilities.filter_candidates(candidate_models)
+        for model in skipped_models:
+            logger.info(
+                "event=gemini_live_connect status=skipped reason=cached_unsupported user_id=%s interview_id=%s model=%s",
+                short_id(self._user_id),
+                short_id(interview_id),
+                model
             )
-            try:
-                await self._gemini_bridge.connect()
-                if model != requested_model:
-                    self._live_model_override = model
-                    logger.warning(
-                        "event=gemini_live_connect status=fallback user_id=%s interview_id=%s requested_model=%s effective_model=%s",
+
+        with span("prompt_build"):
+            system_prompt = build_live_system_prompt(record)
+        hedge_delay = 0.0 if resume_requested else self.settings.live_model_hedge_delay_ms / 1000
+        try:
+            bridge = await self._open_live_bridge(
+                candidate_models,
+                requested_model,
+                interview_id,
+                api_key,
+                system_prompt,
+                resume_requested,
+                hedge_delay
+            )
+        except Exception as exc:
+            logger.error(
+                "event=gemini_live_connect status=error user_id=%s interview_id=%s requested_model=%s attempted_models=%s",
+                short_id(self._user_id),
+                short_id(interview_id),
+                requested_model,
+                ",".join(candidate_models)
+            )
+            # No live session was opened, so free the slot now rather than at disconnect.
+            self._release_live_slot()
+            await self._send({"type": "error", "message": str(exc)})
+            return
+
+        model = bridge.model
+        self._gemini_bridge = bridge
+        if model != requested_model:
+            self._live_model_override = model
+            logger.warning(
+                "event=gemini_live_connect status=fallback user_id=%s interview_id=%s requested_model=%s effective_model=%s",
+                short_id(self._user_id),
+                short_id(interview_id),
+                requested_model,
+                model
+            )
+            await self._send(
+                {
+                    "type": "status",
+                    "state": "live-model-fallback",
+                    "requested_model": requested_model,
+                    "effective_model": model
+                }
+            )
+        await bridge.activate()
+        logger.info(
+            "event=gemini_live_connect status=complete user_id=%s interview_id=%s requested_model=%s effective_model=%s",
+            short_id(self._user_id),
+            short_id(interview_id),
+            requested_model,
+            model
+        )
+
+    async def _open_live_bridge(
+        self,
+        candidate_models: list[str],
+        requested_model: str,
+        interview_id: str,
+        api_key: str,
+        system_prompt: str,
+        resume_requested: bool,
+        hedge_delay: float
+    ) -> GeminiLiveBridge:
+        queue = list(candidate_models)
+        attempts: dict[asyncio.Task, str] = {}
+        fatal_error: Exception | None = None
+        last_error: Exception | None = None
+
+        def launch() -> None:
+            model = queue.pop(0)
+            task = asyncio.create_task(
+                self._open_live_model(model, interview_id, api_key, system_prompt, resume_requested)
+            )
+            attempts[task] = model
+
+        launch()
+        try:
+            while attempts:
+                timeout = hedge_delay if hedge_delay > 0 and queue and fatal_error is None else None
+                done, _ = await asyncio.wait(attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    logger.info(
+                        "event=gemini_live_connect status=hedge user_id=%s interview_id=%s requested_model=%s pending_models=%s next_model=%s",
                         short_id(self._user_id),
                         short_id(interview_id),
                         requested_model,
-                        model
-                    )
-                    await self._send(
-                        {
-                            "type": "status",
-                            "state": "live-model-fallback",
-                            "requested_model": requested_model,
-                            "effective_model": model
-                        }
+                        ",".join(attempts.values()),
+                        queue[0]
                     )
-                logger.info(
-                    "event=gemini_live_connect status=complete user_id=%s interview_id=%s requested_model=%s effective_model=%s",
-                    short_id(self._user_id),
-                    short_id(interview_id),
-                    requested_model,
-                    model
-                )
-                return
-            except Exception as exc:
-                await self._stop_gemini_session()
-                should_retry = _is_live_model_unsupported_error(exc)
-                if should_retry and index < len(candidate_models) - 1:
+                    launch()
+                    continue
+                winner: GeminiLiveBridge | None = None
+                for task in done:
+                    model = attempts.pop(task)
+                    exc = task.exception()
+                    if exc is None:
+                        if winner is None:
+                            winner = task.result()
+                        else:
+                            await task.result().stop()
+                        continue
+                    last_error = exc
+                    if not _is_live_model_unsupported_error(exc):
+                        fatal_error = fatal_error or exc
+                        continue
                     logger.warning(
                         "event=gemini_live_connect status=fallback user_id=%s interview_id=%s requested_model=%s attempted_model=%s",
                         short_id(self._user_id),
@@ -298,52 +523,104 @@ class LiveWebSocketSession:
                         requested_model,
                         model
                     )
-                    continue
+                    if queue and fatal_error is None and not attempts:
+                        launch()
+                if winner is not None:
+                    return winner
+            raise fatal_error or last_error or RuntimeError("No live model candidates available.")
+        finally:
+            await self._discard_live_attempts(list(attempts))
+
+    async def _open_live_model(
+        self,
+        model: str,
+        interview_id: str,
+        api_key: str,
+        system_prompt: str,
+        resume_requested: bool
+    ) -> GeminiLiveBridge:
+        bridge = GeminiLiveBridge(
+            api_key=api_key,
+            model=model,
+            interview_id=interview_id,
+            user_id=self._user_id,
+            send_json=self._send,
+            input_sample_rate=self._input_converter.target_rate,
+            metrics_enabled=self.settings.ui_dev_mode,
+            system_prompt=system_prompt,
+            resume_enabled=self.settings.live_resume_enabled,
+            resume_requested=resume_requested,
+            resume_handoff=self.settings.live_resume_handoff,
+            resume_max_age_s=self.settings.live_resume_max_age_s
+        )
+        start = time.perf_counter()
+        try:
+            await bridge.open()
+        except BaseException as exc:
+            await bridge.stop()
+            duration_ms = int((time.perf_counter() - start) * 1000)
+            if isinstance(exc, Exception):
+                unsupported = _is_live_model_unsupported_error(exc)
+                live_model_capabilities.record_failure(
+                    model,
+                    unsupported=unsupported,
+                    ttl_seconds=self.settings.live_model_unsupported_ttl_s
+                )
                 logger.exception(
-                    "event=gemini_live_connect status=error user_id=%s interview_id=%s requested_model=%s attempted_model=%s",
+                    "event=gemini_live_model_connect status=error user_id=%s interview_id=%s model=%s unsupported=%s duration_ms=%s",
                     short_id(self._user_id),
                     short_id(interview_id),
-                    requested_model,
-                    model
+                    model,
+                    unsupported,
+                    duration_ms
                 )
-                await self._send({"type": "error", "message": str(exc)})
-                return
+            raise
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        live_model_capabilities.record_connect(bridge.model, duration_ms)
+        logger.info(
+            "event=gemini_live_model_connect status=complete user_id=%s interview_id=%s model=%s duration_ms=%s",
+            short_id(self._user_id),
+            short_id(interview_id),
+            bridge.model,
+            duration_ms
+        )
+        return bridge
+
+    async def _discard_live_attempts(self, tasks: list[asyncio.Task]) -> None:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                bridge = await task
+            except BaseException:
+                continue
+            await bridge.stop()
 
     async def _stop_gemini_session(self) -> None:
         if self._gemini_bridge is None:
             return
-        await self._gemini_bridge.stop()
-        self._gemini_bridge = None
-
-    async def _stream_mock_transcript(self, interview_id: str, user_id: str, transcript: list[dict]) -> None:
-        try:
-            for entry in transcript:
-                if not self._active:
-                    break
-                await asyncio.sleep(0.12)
-                store.append_transcript_entry(interview_id, entry, user_id)
-                await self._send(
-                    {
-                        "type": "transcript",
-                        "role": entry.get("role", "system"),
-                        "text": entry.get("text", ""),
-                        "timestamp": entry.get("timestamp", ""),
-                        "is_final": True
-                    }
-                )
-
-                await self._send(
-                    {
-                        "type": "audio",
-                        "encoding": "pcm16",
-                        "sample_rate": MOCK_AUDIO_SAMPLE_RATE,
-                        "data": _mock_audio_base64()
-                    }
-                )
-
-            await self._send({"type": "status", "state": "stream-complete"})
-        except asyncio.CancelledError:
-            return
+        bridge, self._gemini_bridge = self._gemini_bridge, None
+        await bridge.stop()
+        logger.info(
+            "event=live_latency status=summary user_id=%s interview_id=%s session_id=%s model=%s %s",
+            short_id(self._user_id),
+            short_id(self._interview_id),
+            short_id(self._session_id),
+            bridge.model,
+            bridge.latency.log_fields()
+        )
+        vad, self._vad = self._vad, None
+        if vad is not None:
+            logger.info(
+                "event=live_vad status=summary user_id=%s interview_id=%s frames_in=%s frames_forwarded=%s bytes_in=%s bytes_forwarded=%s suppressed_pct=%s",
+                short_id(self._user_id),
+                short_id(self._interview_id),
+                vad.frames_in,
+                vad.frames_forwarded,
+                vad.bytes_in,
+                vad.bytes_forwarded,
+                vad.suppressed_pct
+            )
 
     async def _handle_stop(self) -> None:
         self._active = False
@@ -362,8 +639,48 @@ class LiveWebSocketSession:
         if self._stream_task and not self._stream_task.done():
             self._stream_task.cancel()
         await self._stop_gemini_session()
+        self._release_live_slot()
         await self._send({"type": "status", "state": "stopped"})
 
+    async def drain(self) -> None:
+        if not self._active:
+            return
+        self._active = False
+        self._close_code = LIVE_DRAIN_CLOSE_CODE
+        start = time.perf_counter()
+        if self._stream_task and not self._stream_task.done():
+            self._stream_task.cancel()
+        had_bridge = self._gemini_bridge is not None
+        # Stopping the bridge flushes the coach and candidate buffers to the client and the store.
+        await self._stop_gemini_session()
+        self._release_live_slot()
+        resume_handle = None
+        if self._interview_id:
+            record = store.get(self._interview_id, self._user_id)
+            resume_handle = record.live_resume_handle if record else None
+        await self._send(
+            {
+                "type": "status",
+                "state": "draining",
+                "interview_id": self._interview_id,
+                "resume_handle": resume_handle,
+                "message": "Server is restarting. Reconnecting shortly."
+            }
+        )
+        logger.info(
+            "event=ws_drain status=complete user_id=%s interview_id=%s session_id=%s bridge=%s resumable=%s duration_ms=%s",
+            short_id(self._user_id),
+            short_id(self._interview_id),
+            short_id(self._session_id),
+            had_bridge,
+            bool(resume_handle),
+            int((time.perf_counter() - start) * 1000)
+        )
+        try:
+            await self.websocket.close(code=LIVE_DRAIN_CLOSE_CODE)
+        except RuntimeError:
+            pass
+
     async def _send(self, payload: dict[str, Any]) -> None:
         async with self._send_lock:
             try:
@@ -373,6 +690,8 @@ class LiveWebSocketSession:
 
     async def _shutdown(self) -> None:
         self._active = False
+        live_drain.unregister(self)
+        ws_active_sessions.dec()
         logger.info(
             "event=ws_disconnect status=closed user_id=%s interview_id=%s session_id=%s",
             short_id(self._user_id),
@@ -382,8 +701,12 @@ class LiveWebSocketSession:
         if self._stream_task and not self._stream_task.done():
             self._stream_task.cancel()
         await self._stop_gemini_session()
+        self._release_live_slot()
         try:
-            await self.websocket.close()
+            if self._close_code is not None:
+                await self.websocket.close(code=self._close_code)
+            else:
+                await self.websocket.close()
         except RuntimeError:
             pass
 
@@ -0,0 +1,57 @@
+"""Measure per-frame cost of converting client capture audio for Gemini Live.
+
+Run from the repo root: python scripts/bench_audio_resample.py [--frames N]
+"""
+from __future__ import annotations
+
+import argparse
+from array import array
+import math
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services import audio_resample  # noqa: E402
+from app.services.audio_resample import LIVE_INPUT_FORMATS, LIVE_INPUT_SAMPLE_RATES, PcmConverter  # noqa: E402
+
+FRAME_MS = 40
+
+
+def _frame(rate: int, fmt: str) -> bytes:
+    count = rate * FRAME_MS // 1000
+    values = [0.4 * math.sin(2 * math.pi * 220 * i / rate) for i in range(count)]
+    if fmt == "float32":
+        return array("f", values).tobytes()
+    return array("h", (int(value * 32767) for value in values)).tobytes()
+
+
+def _bench(rate: int, fmt: str, frames: int) -> tuple[float, int, int]:
+    converter = PcmConverter(rate, fmt)
+    frame = _frame(rate, fmt)
+    start = time.perf_counter()
+    for _ in range(frames):
+        output = converter.convert(frame)
+    elapsed = time.perf_counter() - start
+    return elapsed / frames * 1e6, len(frame), len(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+    backends = [("numpy", audio_resample.np)] if audio_resample.np is not None else []
+    backends.append(("array", None))
+    print(f"{'backend':<8}{'input':>16}{'upstream':>10}{'in B/frame':>12}{'out B/frame':>13}{'us/frame':>10}")
+    for name, module in backends:
+        audio_resample.np = module
+        for rate in LIVE_INPUT_SAMPLE_RATES:
+            for fmt in LIVE_INPUT_FORMATS:
+                per_frame_us, in_bytes, out_bytes = _bench(rate, fmt, args.frames)
+                upstream = PcmConverter(rate, fmt).target_rate
+                print(f"{name:<8}{f'{rate} {fmt}':>16}{upstream:>10}{in_bytes:>12}{out_bytes:>13}{per_frame_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare log parse throughput for the text and JSON-lines app.log formats.
+
+Run from the repo root: python scripts/bench_log_parse.py [--lines N]
+
+Builds the same synthetic log in both formats through the app's own
+formatters, then times parse_log_line alone and the full build_log_summary
+pass over each.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.logging_config import _JsonFormatter  # noqa: E402
+from app.services.log_metrics import build_log_summary  # noqa: E402
+from app.services.log_parse import parse_log_line  # noqa: E402
+
+MESSAGES = [
+    ("event=store_get status=hit interview_id=%s user_id=%s duration_ms=%s", logging.INFO),
+    ("event=transcript_append status=ok interview_id=%s user_id=%s entries=%s", logging.INFO),
+    ("event=ws_disconnect status=closed session_id=%s user_id=%s code=%s", logging.INFO),
+    ("event=gemini_live_receive status=ended session_id=%s model=%s turns=%s", logging.INFO),
+    ("event=client_event event_type=ws_close status=received session_id=%s user_id=%s value=%s", logging.INFO),
+    ("event=gemini_live_activity status=error session_id=%s user_id=%s attempt=%s", logging.ERROR),
+]
+
+
+def _lines(count: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(7)
+    text_formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+    json_formatter = _JsonFormatter()
+    text_lines, json_lines = [], []
+    for index in range(count):
+        message, level = MESSAGES[rng.randrange(len(MESSAGES))]
+        record = logging.LogRecord(
+            "preptalk", level, __file__, 1, message, (f"{index:05x}"[-5:], "a1b2c", rng.randrange(200)), None
+        )
+        text_lines.append(text_formatter.format(record))
+        json_lines.append(json_formatter.format(record))
+    return text_lines, json_lines
+
+
+def _rate(seconds: float, count: int) -> str:
+    return f"{count / seconds / 1e6:>8.2f}M/s {seconds:>7.2f}s"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    args = parser.parse_args()
+    text_lines, json_lines = _lines(args.lines)
+
+    print(f"{'format':<8}{'parse_log_line':>26}{'build_log_summary':>26}")
+    for name, lines in (("text", text_lines), ("json", json_lines)):
+        start = time.perf_counter()
+        for line in lines:
+            parse_log_line(line)
+        parse_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        build_log_summary(lines)
+        summary_seconds = time.perf_counter() - start
+        print(f"{name:<8}{_rate(parse_seconds, len(lines)):>26}{_rate(summary_seconds, len(lines)):>26}")
+
+
+if __name__ == "__main__":
+    main()
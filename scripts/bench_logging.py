@@ -0,0 +1,105 @@
+"""Measure per-call logger overhead for inline file/stream handlers against the queue handler.
+
+Run from the repo root: python scripts/bench_logging.py [--calls N] [--threads N]
+
+Both setups write the same file format to a temp LOG_DIR and the console
+stream to /dev/null, so the numbers are what a request handler pays per
+logger.info call, not terminal rendering.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import os
+from pathlib import Path
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.logging_config import ArchiveRotatingFileHandler, _BoundedQueueHandler  # noqa: E402
+from logging.handlers import QueueListener  # noqa: E402
+
+FORMAT = "%(asctime)s %(levelname)s %(message)s"
+
+
+def _pick(values: list[float], quantile: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(quantile * len(ordered)) - 1)]
+
+
+def _outputs(log_dir: Path) -> list[logging.Handler]:
+    archive_dir = log_dir / "archive"
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    file_handler = ArchiveRotatingFileHandler(log_dir / "app.log", archive_dir, max_bytes=10 * 1024 * 1024)
+    stream_handler = logging.StreamHandler(open(os.devnull, "w"))
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(logging.Formatter(FORMAT))
+    return [file_handler, stream_handler]
+
+
+def _calls(logger: logging.Logger, calls: int, timings: list[float]) -> None:
+    for index in range(calls):
+        start = time.perf_counter()
+        logger.info(
+            "event=store_persist status=ok interview_id=%s user_id=%s entries=%s duration_ms=%s",
+            "a1b2c",
+            "d3e4f",
+            index,
+            3
+        )
+        timings.append((time.perf_counter() - start) * 1e6)
+
+
+def _run(mode: str, calls: int, threads: int, queue_size: int) -> tuple[list[float], int]:
+    log_dir = Path(tempfile.mkdtemp(prefix=f"bench-logging-{mode}-"))
+    logger = logging.getLogger(f"bench.{mode}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    outputs = _outputs(log_dir)
+    listener = None
+    queue_handler = None
+    if mode == "queue":
+        queue_handler = _BoundedQueueHandler(queue.Queue(maxsize=queue_size))
+        listener = QueueListener(queue_handler.queue, *outputs, respect_handler_level=True)
+        logger.addHandler(queue_handler)
+        listener.start()
+    else:
+        for handler in outputs:
+            logger.addHandler(handler)
+
+    timings: list[float] = []
+    workers = [threading.Thread(target=_calls, args=(logger, calls // threads, timings)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if listener is not None:
+        listener.stop()
+    for handler in outputs:
+        handler.close()
+    return timings, queue_handler.dropped if queue_handler else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--threads", type=int, default=4, help="threads logging at once")
+    parser.add_argument("--queue-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'calls':>8}{'p50 us':>10}{'p99 us':>10}{'max us':>10}{'dropped':>9}")
+    for mode in ("inline", "queue"):
+        timings, dropped = _run(mode, args.calls, args.threads, args.queue_size)
+        print(
+            f"{mode:<8}{len(timings):>8}{_pick(timings, 0.5):>10.1f}{_pick(timings, 0.99):>10.1f}"
+            f"{max(timings):>10.1f}{dropped:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Measure reconnect-to-first-coach-audio with the cached rehydrate snapshot against the old rebuild path.
+
+Run from the repo root: python scripts/bench_rehydrate.py [--entries N] [--reconnects N] [--burst N]
+
+Uses the fake Gemini Live client with zero connect and response latency, so the
+timings are the server's own reconnect overhead rather than model think time.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import math
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("SESSION_STORE_DIR", tempfile.mkdtemp(prefix="bench-rehydrate-"))
+
+from app.services import gemini_live  # noqa: E402
+from app.services.fake_live import FakeLiveClient, FakeLiveConfig  # noqa: E402
+from app.services.gemini_live import GeminiLiveBridge  # noqa: E402
+from app.services.store import REHYDRATE_MAX_TURNS, build_rehydrate_prompt, store  # noqa: E402
+
+INTERVIEW_ID = "bench-rehydrate"
+USER_ID = "local"
+
+
+def _pick(values: list[float], quantile: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(quantile * len(ordered)) - 1)]
+
+
+async def _legacy_send_rehydrate_context(self) -> bool:
+    record = store.get(self._interview_id, self._user_id)
+    if not record or not record.transcript:
+        return False
+    transcript_tail = list(record.transcript[-REHYDRATE_MAX_TURNS:])
+    prompt = build_rehydrate_prompt(record, transcript_tail)
+    if not prompt or self._session is None:
+        return False
+    await self._send_json({"type": "status", "state": "thinking"})
+    await self._session.send(input=prompt)
+    return True
+
+
+def _seed(entries: int) -> None:
+    store.create(
+        interview_id=INTERVIEW_ID,
+        adapter="gemini",
+        role_title="Staff Engineer",
+        questions=[f"Question {index}?" for index in range(8)],
+        focus_areas=["Impact"],
+        user_id=USER_ID
+    )
+    for index in range(entries):
+        role = "coach" if index % 2 == 0 else "candidate"
+        text = f"Turn {index}: " + "a fairly long answer about the project and the result " * 6
+        store.append_transcript_entry(INTERVIEW_ID, {"role": role, "text": text, "timestamp": str(index)}, USER_ID)
+    store.update_asked_question_index(INTERVIEW_ID, 3, USER_ID)
+
+
+def _bench_prompt(iterations: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        record = store.get(INTERVIEW_ID, USER_ID)
+        build_rehydrate_prompt(record, list(record.transcript[-REHYDRATE_MAX_TURNS:]))
+    legacy_us = (time.perf_counter() - start) / iterations * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        store.rehydrate_snapshot(INTERVIEW_ID, USER_ID)
+    snapshot_us = (time.perf_counter() - start) / iterations * 1e6
+    return legacy_us, snapshot_us
+
+
+async def _reconnect(client: FakeLiveClient) -> float:
+    first_audio = asyncio.get_running_loop().create_future()
+
+    async def send_json(payload: dict) -> None:
+        if payload.get("type") == "audio" and not first_audio.done():
+            first_audio.set_result(time.perf_counter())
+
+    start = time.perf_counter()
+    bridge = GeminiLiveBridge(
+        api_key="bench-key",
+        model="bench-model",
+        interview_id=INTERVIEW_ID,
+        user_id=USER_ID,
+        send_json=send_json
+    )
+    await bridge.connect()
+    audio_at = await first_audio
+    await bridge.stop()
+    return (audio_at - start) * 1000
+
+
+async def _bench_reconnects(reconnects: int, burst: int) -> list[float]:
+    client = FakeLiveClient(FakeLiveConfig(connect_ms=0, response_ms=0, reply_audio_ms=100, chunk_ms=100))
+    gemini_live.fake_live_client = lambda: client
+    timings: list[float] = []
+    for _ in range(max(1, reconnects // burst)):
+        timings.extend(await asyncio.gather(*(_reconnect(client) for _ in range(burst))))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=400, help="transcript entries in the seeded interview")
+    parser.add_argument("--reconnects", type=int, default=200)
+    parser.add_argument("--burst", type=int, default=10, help="reconnects started together")
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    logging.getLogger("preptalk").setLevel(logging.WARNING)
+    _seed(args.entries)
+
+    legacy_us, snapshot_us = _bench_prompt(args.iterations)
+    print(f"prompt prep: rebuild {legacy_us:.1f} us, snapshot {snapshot_us:.2f} us")
+
+    print(f"{'path':<10}{'reconnects':>12}{'p50 ms':>10}{'p90 ms':>10}{'max ms':>10}")
+    current = GeminiLiveBridge._send_rehydrate_context
+    for name, method in (("rebuild", _legacy_send_rehydrate_context), ("snapshot", current)):
+        GeminiLiveBridge._send_rehydrate_context = method
+        timings = asyncio.run(_bench_reconnects(args.reconnects, args.burst))
+        print(f"{name:<10}{len(timings):>12}{_pick(timings, 0.5):>10.2f}{_pick(timings, 0.9):>10.2f}{max(timings):>10.2f}")
+    GeminiLiveBridge._send_rehydrate_context = current
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Compare server CPU per client event for /api/telemetry against /api/telemetry/batch.
+
+Run from the repo root: python scripts/bench_telemetry.py [--events N] [--batch-size N]
+
+Requests are driven straight through the ASGI app (all middleware included)
+in one event loop, so no HTTP client or socket work is counted. CPU is
+process time, which also covers the log writer thread; each run waits for the
+log queue to drain before stopping the clock. GA4 forwarding is enabled, so
+enqueueing is in the measured path.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="bench-telemetry-"))
+os.environ.setdefault("GA4_MEASUREMENT_ID", "G-BENCH")
+os.environ.setdefault("GA4_API_SECRET", "bench")
+
+from app.logging_config import log_queue_stats  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.ga4_telemetry import ga4_dispatcher  # noqa: E402
+
+
+def _event(index: int) -> dict:
+    return {
+        "event": "journey_step_completed",
+        "category": "journey",
+        "step": "question_answered",
+        "interview_id": "interview-bench",
+        "session_id": "session-bench",
+        "value": index,
+        "anonymous_id": "anon-bench",
+        "properties": {"adapter": "gemini", "voice_mode": "live", "question_index": index % 8}
+    }
+
+
+async def _post(path: str, body: bytes, headers: list[tuple[bytes, bytes]]) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json"), *headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    sent = False
+    status = 0
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def _wait_for_log_queue() -> None:
+    while log_queue_stats()["depth"]:
+        time.sleep(0.001)
+
+
+async def _run(mode: str, events: int, batch_size: int) -> float:
+    ga4_dispatcher.reset()
+    ga4_dispatcher.max_queue = events + 1
+    start = time.process_time()
+    if mode == "single":
+        for index in range(events):
+            status = await _post("/api/telemetry", json.dumps(_event(index)).encode(), [])
+            assert status == 200, status
+    else:
+        gzip_header = [(b"content-encoding", b"gzip")] if mode == "batch_gzip" else []
+        for offset in range(0, events, batch_size):
+            body = json.dumps([_event(index) for index in range(offset, min(events, offset + batch_size))]).encode()
+            if gzip_header:
+                body = gzip.compress(body)
+            status = await _post("/api/telemetry/batch", body, gzip_header)
+            assert status == 200, status
+    _wait_for_log_queue()
+    elapsed = time.process_time() - start
+    assert ga4_dispatcher.stats()["enqueued"] == events
+    ga4_dispatcher.reset()
+    return elapsed / events * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(_run("single", 200, args.batch_size))
+    for mode in ("single", "batch", "batch_gzip"):
+        best = min(asyncio.run(_run(mode, args.events, args.batch_size)) for _ in range(args.repeat))
+        print(f"{mode:<11} events={args.events} batch_size={args.batch_size} cpu_us_per_event={best:.1f}")
+
+
+if __name__ == "__main__":
+    main()
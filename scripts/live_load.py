@@ -0,0 +1,298 @@
+"""Drive N concurrent /ws/live sessions against an in-process server backed by the fake Gemini Live client.
+
+Run from the repo root, for example:
+
+    python scripts/live_load.py --sessions 50 --turns 3
+    python scripts/live_load.py --adapter mock --sessions 200 --mock-frame-ms 20
+
+The server runs on its own event loop thread so its loop lag can be probed
+separately from the client load. Nothing leaves the machine: GEMINI_LIVE_FAKE
+is forced on and the session store and logs go to a temporary directory.
+With --adapter mock each session plays the paced mock live script instead,
+and the report adds the audio frame inter-arrival gaps seen by the clients.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from array import array
+import json
+import math
+import os
+from pathlib import Path
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+FRAME_MS = 40
+INPUT_RATE = 24000
+
+
+def _quantiles(values: list[float]) -> dict[str, float | None]:
+    if not values:
+        return {"count": 0, "p50_ms": None, "p90_ms": None, "max_ms": None}
+    ordered = sorted(values)
+
+    def pick(quantile: float) -> float:
+        return round(ordered[max(0, math.ceil(quantile * len(ordered)) - 1)], 1)
+
+    return {"count": len(ordered), "p50_ms": pick(0.5), "p90_ms": pick(0.9), "max_ms": round(ordered[-1], 1)}
+
+
+def _speech_frame() -> bytes:
+    count = INPUT_RATE * FRAME_MS // 1000
+    return array("h", (int(8000 * math.sin(2 * math.pi * 220 * i / INPUT_RATE)) for i in range(count))).tobytes()
+
+
+class ServerThread(threading.Thread):
+    def __init__(self, app, lag_interval_ms: int) -> None:
+        super().__init__(daemon=True)
+        import uvicorn
+
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+        self.lag_interval = lag_interval_ms / 1000
+        self.lags_ms: list[float] = []
+        self.port: int | None = None
+
+    def run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        probe = asyncio.create_task(self._probe_lag())
+        try:
+            await self.server.serve()
+        finally:
+            probe.cancel()
+
+    async def _probe_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            self.lags_ms.append(max(0.0, (loop.time() - expected) * 1000))
+
+    def wait_started(self, timeout: float = 10.0) -> int:
+        deadline = time.monotonic() + timeout
+        while not self.server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Server did not start.")
+            time.sleep(0.02)
+        self.port = self.server.servers[0].sockets[0].getsockname()[1]
+        return self.port
+
+
+async def _run_session(url: str, interview_id: str, args, results: dict) -> None:
+    import websockets
+
+    frame = _speech_frame()
+    frames_per_turn = max(1, args.speech_ms // FRAME_MS)
+    start = time.perf_counter()
+    try:
+        async with websockets.connect(url, max_size=None) as websocket:
+            messages: asyncio.Queue = asyncio.Queue()
+
+            async def reader() -> None:
+                async for raw in websocket:
+                    if isinstance(raw, str):
+                        messages.put_nowait((time.perf_counter(), json.loads(raw)))
+
+            reader_task = asyncio.create_task(reader())
+
+            async def wait_for(predicate, timeout: float) -> float:
+                deadline = time.perf_counter() + timeout
+                while True:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    received_at, payload = await asyncio.wait_for(messages.get(), remaining)
+                    if payload.get("type") == "error" or payload.get("state") in {"capacity", "gemini-error", "gemini-disconnected"}:
+                        raise RuntimeError(payload.get("message") or payload.get("state"))
+                    if predicate(payload):
+                        return received_at
+
+            await websocket.send(json.dumps({"type": "start", "interview_id": interview_id, "input_sample_rate": INPUT_RATE}))
+            if args.adapter == "mock":
+                await _run_mock_session(wait_for, start, args, results)
+                await websocket.send(json.dumps({"type": "stop"}))
+                reader_task.cancel()
+                results["completed"] += 1
+                return
+            connected_at = await wait_for(lambda payload: payload.get("state") == "gemini-connected", args.timeout)
+            results["connect_ms"].append((connected_at - start) * 1000)
+
+            for _ in range(args.turns):
+                await websocket.send(json.dumps({"type": "activity", "state": "start"}))
+                for _ in range(frames_per_turn):
+                    await websocket.send(frame)
+                    await asyncio.sleep(FRAME_MS / 1000)
+                await websocket.send(json.dumps({"type": "activity", "state": "end"}))
+                ended_at = time.perf_counter()
+                first_audio_at = await wait_for(lambda payload: payload.get("type") == "audio", args.timeout)
+                results["first_audio_ms"].append((first_audio_at - ended_at) * 1000)
+                await wait_for(
+                    lambda payload: payload.get("type") == "transcript" and payload.get("role") == "coach" and payload.get("is_final"),
+                    args.timeout
+                )
+                results["turns"] += 1
+
+            await websocket.send(json.dumps({"type": "stop"}))
+            reader_task.cancel()
+        results["completed"] += 1
+    except Exception as exc:
+        results["failed"] += 1
+        key = f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
+        results["errors"][key] = results["errors"].get(key, 0) + 1
+
+
+async def _run_mock_session(wait_for, start: float, args, results: dict) -> None:
+    connected_at = await wait_for(lambda payload: payload.get("type") == "session", args.timeout)
+    results["connect_ms"].append((connected_at - start) * 1000)
+    last_frame_at = None
+    first_audio = True
+    while True:
+        kinds = {}
+
+        def capture(payload: dict) -> bool:
+            kinds["type"] = payload.get("type")
+            return payload.get("type") in {"audio", "transcript"} or payload.get("state") == "stream-complete"
+
+        received_at = await wait_for(capture, args.timeout)
+        if kinds["type"] == "audio":
+            if first_audio:
+                results["first_audio_ms"].append((received_at - connected_at) * 1000)
+                first_audio = False
+            if last_frame_at is not None:
+                results["frame_gap_ms"].append((received_at - last_frame_at) * 1000)
+            last_frame_at = received_at
+            results["frames"] += 1
+        elif kinds["type"] == "transcript":
+            # A new turn starts; the pause between turns is not a frame gap.
+            last_frame_at = None
+            results["turns"] += 1
+        else:
+            return
+
+
+async def _drive(url: str, interview_ids: list[str], args) -> dict:
+    results = {
+        "completed": 0,
+        "failed": 0,
+        "turns": 0,
+        "frames": 0,
+        "connect_ms": [],
+        "first_audio_ms": [],
+        "frame_gap_ms": [],
+        "errors": {}
+    }
+    tasks = []
+    for index, interview_id in enumerate(interview_ids):
+        tasks.append(asyncio.create_task(_run_session(url, interview_id, args, results)))
+        if args.ramp_ms:
+            await asyncio.sleep(args.ramp_ms / 1000 / max(1, len(interview_ids)))
+    await asyncio.gather(*tasks)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adapter", choices=("gemini", "mock"), default="gemini")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=2)
+    parser.add_argument("--speech-ms", type=int, default=1200)
+    parser.add_argument("--ramp-ms", type=int, default=1000, help="spread session starts over this window")
+    parser.add_argument("--response-ms", type=int, default=400, help="fake model think time after activity end")
+    parser.add_argument("--connect-ms", type=int, default=80)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--mock-script", help="JSON turn script for --adapter mock (MOCK_LIVE_SCRIPT)")
+    parser.add_argument("--mock-frame-ms", type=int, default=20)
+    parser.add_argument("--mock-gap-ms", type=int, default=400)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="live-load-")
+    os.environ.update(
+        {
+            "INTERVIEW_ADAPTER": args.adapter,
+            "MOCK_LIVE_FRAME_MS": str(args.mock_frame_ms),
+            "MOCK_LIVE_TURN_GAP_MS": str(args.mock_gap_ms),
+            "GEMINI_API_KEY": os.environ.get("GEMINI_API_KEY") or "fake-key",
+            "GEMINI_LIVE_FAKE": "1",
+            "GEMINI_LIVE_FAKE_CONNECT_MS": str(args.connect_ms),
+            "GEMINI_LIVE_FAKE_RESPONSE_MS": str(args.response_ms),
+            "GEMINI_LIVE_FAKE_FAILURE_RATE": str(args.failure_rate),
+            "GEMINI_LIVE_FAKE_DROP_RATE": str(args.drop_rate),
+            "SESSION_STORE_DIR": os.path.join(workdir, "sessions"),
+            "LOG_DIR": os.path.join(workdir, "logs")
+        }
+    )
+    if args.mock_script:
+        os.environ["MOCK_LIVE_SCRIPT"] = os.path.abspath(args.mock_script)
+    import logging
+
+    from app.logging_config import log_output_handlers
+    from app.main import app
+    from app.services.store import store
+
+    # Per-event app logs still go to LOG_DIR; keep the console for the report.
+    for handler in log_output_handlers():
+        if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
+            handler.setLevel(logging.WARNING)
+
+    interview_ids = []
+    for index in range(args.sessions):
+        record = store.create(
+            interview_id=f"load-{index}",
+            adapter=args.adapter,
+            role_title="Load Test Engineer",
+            questions=["Tell me about a project you led.", "How did you measure success?"],
+            focus_areas=["Impact"],
+            user_id=os.environ.get("APP_USER_ID", "local")
+        )
+        interview_ids.append(record.interview_id)
+
+    server = ServerThread(app, lag_interval_ms=50)
+    server.start()
+    port = server.wait_started()
+    baseline_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    results = asyncio.run(_drive(f"ws://127.0.0.1:{port}/ws/live", interview_ids, args))
+    elapsed = time.perf_counter() - started
+    server.server.should_exit = True
+    server.join(timeout=10)
+    print(f"logs: {os.environ['LOG_DIR']}")
+
+    lags = server.lags_ms
+    report = {
+        "sessions": args.sessions,
+        "completed": results["completed"],
+        "failed": results["failed"],
+        "turns": results["turns"],
+        "elapsed_s": round(elapsed, 2),
+        "connect": _quantiles(results["connect_ms"]),
+        "first_audio": _quantiles(results["first_audio_ms"]),
+        "frames": results["frames"],
+        "frame_gap": _quantiles(results["frame_gap_ms"]),
+        "server_loop_lag": {
+            **_quantiles(lags),
+            "mean_ms": round(statistics.fmean(lags), 2) if lags else None
+        },
+        "rss_peak_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "rss_growth_mb": round((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss_kb) / 1024, 1),
+        "errors": results["errors"]
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for key, value in report.items():
+        print(f"{key:>16}: {value}")
+
+
+if __name__ == "__main__":
+    main()
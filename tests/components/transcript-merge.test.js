@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { appendTranscriptEntry } from '../../app/static/js/ui.js';
+import { appendTranscriptEntry, applyLiveTranscript } from '../../app/static/js/ui.js';
 
 describe('transcript merge', () => {
   it('merges same-role entries even when timestamps change', () => {
@@ -31,4 +31,35 @@ describe('transcript merge', () => {
       { role: 'candidate', text: 'Hi there', timestamp: '19:01:41' }
     ]);
   });
+
+  it('replaces interim live fragments with the committed utterance', () => {
+    const state = { transcript: [] };
+    applyLiveTranscript(state, { role: 'coach', text: 'Tell me about yourself.', timestamp: '19:01:40' });
+    applyLiveTranscript(state, { role: 'candidate', text: 'I lead', timestamp: '19:01:41', is_final: false });
+    applyLiveTranscript(state, { role: 'candidate', text: 'a team', timestamp: '19:01:41', is_final: false });
+    expect(state.transcript[1].text).toBe('I lead a team');
+
+    const result = applyLiveTranscript(state, {
+      role: 'candidate',
+      text: 'I lead a team',
+      timestamp: '19:01:41',
+      is_final: true
+    });
+
+    expect(result.replaced).toBe(true);
+    expect(state.transcript).toEqual([
+      { role: 'coach', text: 'Tell me about yourself.', timestamp: '19:01:40' },
+      { role: 'candidate', text: 'I lead a team', timestamp: '19:01:41' }
+    ]);
+  });
+
+  it('keeps earlier committed text when a later utterance is finalized', () => {
+    const state = { transcript: [{ role: 'candidate', text: 'First part.', timestamp: '19:01:41' }] };
+    applyLiveTranscript(state, { role: 'candidate', text: 'Second', timestamp: '19:01:45', is_final: false });
+    applyLiveTranscript(state, { role: 'candidate', text: 'Second part.', timestamp: '19:01:45', is_final: true });
+
+    expect(state.transcript).toEqual([
+      { role: 'candidate', text: 'First part. Second part.', timestamp: '19:01:41' }
+    ]);
+  });
 });
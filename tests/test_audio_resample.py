@@ -0,0 +1,77 @@
+import math
+from array import array
+
+import pytest
+
+from app.services import audio_resample
+from app.services.audio_resample import PcmConverter, select_model_input_rate
+
+
+def _sine(rate, duration_ms, frequency=440.0, amplitude=0.5):
+    count = rate * duration_ms // 1000
+    return [amplitude * math.sin(2 * math.pi * frequency * i / rate) for i in range(count)]
+
+
+def _pcm16(values):
+    return array("h", (int(round(value * 32767)) for value in values)).tobytes()
+
+
+def _float32(values):
+    return array("f", values).tobytes()
+
+
+def _decode(pcm):
+    samples = array("h")
+    samples.frombytes(pcm)
+    return samples
+
+
+def test_model_input_rate_keeps_native_rates_and_downsamples_48k():
+    assert select_model_input_rate(16000) == 16000
+    assert select_model_input_rate(24000) == 24000
+    assert select_model_input_rate(48000) == 16000
+
+
+def test_pcm16_at_accepted_rate_passes_through():
+    converter = PcmConverter(16000)
+    chunk = _pcm16(_sine(16000, 20))
+
+    assert converter.passthrough
+    assert converter.convert(chunk) is chunk
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_48k_float32_is_downsampled_to_16k_pcm16_across_odd_frames(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(audio_resample, "np", None)
+    source = _float32(_sine(48000, 100))
+    converter = PcmConverter(48000, "float32")
+
+    output = b"".join(converter.convert(source[start:start + 1234]) for start in range(0, len(source), 1234))
+
+    assert converter.target_rate == 16000
+    samples = _decode(output)
+    assert len(samples) == 1600
+    expected = _decode(_pcm16(_sine(16000, 100)))
+    # A 3-sample block average delays the signal by one source sample and barely attenuates 440 Hz.
+    drift = max(abs(a - b) for a, b in zip(samples, expected))
+    assert drift < 32767 * 0.05
+
+
+def test_numpy_and_array_paths_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    source = _pcm16(_sine(48000, 40, frequency=1000))
+    vectorized = PcmConverter(48000).convert(source)
+    monkeypatch.setattr(audio_resample, "np", None)
+    fallback = PcmConverter(48000).convert(source)
+
+    assert max(abs(a - b) for a, b in zip(_decode(vectorized), _decode(fallback))) <= 1
+
+
+def test_unsupported_input_is_rejected():
+    with pytest.raises(ValueError):
+        PcmConverter(44100)
+    with pytest.raises(ValueError):
+        PcmConverter(16000, "mulaw")
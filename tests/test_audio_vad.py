@@ -0,0 +1,145 @@
+import asyncio
+from array import array
+from dataclasses import replace
+import math
+import random
+from types import SimpleNamespace
+import wave
+
+from app import ws
+from app.services import audio_vad
+from app.services.audio_resample import PcmConverter
+from app.services.audio_vad import EnergyVad, frame_energy
+from app.services.live_latency import LiveLatencyRecorder
+from app.settings import load_settings
+
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+
+
+def _tone(duration_ms, amplitude=0.3, frequency=220.0):
+    count = SAMPLE_RATE * duration_ms // 1000
+    return [int(amplitude * 32767 * math.sin(2 * math.pi * frequency * i / SAMPLE_RATE)) for i in range(count)]
+
+
+def _noise(duration_ms, amplitude=0.002, seed=7):
+    rng = random.Random(seed)
+    count = SAMPLE_RATE * duration_ms // 1000
+    return [int(rng.uniform(-amplitude, amplitude) * 32767) for _ in range(count)]
+
+
+def _write_wav(path, samples):
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(SAMPLE_RATE)
+        handle.writeframes(array("h", samples).tobytes())
+    return path
+
+
+def _wav_frames(path):
+    with wave.open(str(path), "rb") as handle:
+        frame_samples = handle.getframerate() * FRAME_MS // 1000
+        while True:
+            frame = handle.readframes(frame_samples)
+            if not frame:
+                return
+            yield frame
+
+
+def _run_vad(path, **kwargs):
+    vad = EnergyVad(SAMPLE_RATE, **kwargs)
+    forwarded = []
+    for frame in _wav_frames(path):
+        forwarded.extend(vad.process(frame))
+    return vad, forwarded
+
+
+def test_frame_energy_separates_tone_from_silence():
+    tone_rms, tone_zcr = frame_energy(array("h", _tone(FRAME_MS)).tobytes())
+    silence_rms, _ = frame_energy(bytes(640))
+
+    assert 0.2 < tone_rms < 0.22
+    assert tone_zcr < 0.05
+    assert silence_rms == 0.0
+
+
+def test_vad_suppresses_silence_and_keeps_speech_with_padding(tmp_path):
+    fixture = _write_wav(
+        tmp_path / "answer.wav",
+        _noise(1000) + _tone(600) + _noise(1400, seed=8) + _tone(400) + _noise(600, seed=9)
+    )
+
+    vad, forwarded = _run_vad(fixture, hangover_ms=200, preroll_ms=100)
+
+    frame_bytes = SAMPLE_RATE * 2 * FRAME_MS // 1000
+    speech_frames = (600 + 400) // FRAME_MS
+    padding_frames = 2 * (200 + 100) // FRAME_MS
+    assert vad.frames_in == 4000 // FRAME_MS
+    assert len(forwarded) == speech_frames + padding_frames
+    assert vad.bytes_forwarded == len(forwarded) * frame_bytes
+    assert vad.suppressed_pct == 60.0
+
+
+def test_vad_rejects_hiss_above_threshold(tmp_path):
+    fixture = _write_wav(tmp_path / "hiss.wav", _noise(1000, amplitude=0.02))
+
+    vad, forwarded = _run_vad(fixture)
+
+    assert forwarded == []
+    assert vad.suppressed_pct == 100.0
+
+
+def test_vad_pure_python_energy_matches(monkeypatch):
+    frame = array("h", _tone(FRAME_MS, amplitude=0.1) + _noise(FRAME_MS)).tobytes()
+    expected = frame_energy(frame)
+    monkeypatch.setattr(audio_vad, "np", None)
+
+    rms, zcr = frame_energy(frame)
+
+    assert math.isclose(rms, expected[0], rel_tol=1e-5)
+    assert zcr == expected[1]
+
+
+def test_websocket_session_gates_audio_through_vad():
+    sent = []
+
+    class Bridge:
+        input_sample_rate = SAMPLE_RATE
+        model = "model-a"
+        latency = LiveLatencyRecorder()
+
+        async def send_audio(self, chunk):
+            sent.append(chunk)
+
+        async def stop(self):
+            return None
+
+    session = ws.LiveWebSocketSession.__new__(ws.LiveWebSocketSession)
+    session.settings = replace(load_settings(), live_vad_enabled=True, live_vad_preroll_ms=0, live_vad_hangover_ms=0)
+    session.adapter = SimpleNamespace(name="gemini")
+    session._gemini_bridge = Bridge()
+    session._vad = None
+    session._input_converter = PcmConverter(SAMPLE_RATE)
+    session._audio_frames = 0
+    session._audio_bytes = 0
+    session._user_id = "user"
+    session._interview_id = "abc"
+    session._session_id = None
+    silence = bytes(640)
+    speech = array("h", _tone(FRAME_MS)).tobytes()
+
+    async def run():
+        for chunk in (silence, speech, silence):
+            await session._forward_audio(chunk)
+        suppressed = session._vad.suppressed_pct
+        await session._stop_gemini_session()
+        return suppressed
+
+    suppressed = asyncio.run(run())
+
+    assert sent == [speech]
+    assert session._audio_frames == 3
+    assert suppressed == 66.7
+    assert session._vad is None
@@ -0,0 +1,97 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app import ws
+from app.main import app
+from app.services import gemini_live, interview_service
+from app.services.fake_live import FakeLiveClient, FakeLiveConfig
+from app.services.store import InterviewStore
+
+
+def _fast_config(**overrides):
+    return FakeLiveConfig(connect_ms=0, response_ms=0, reply_audio_ms=200, chunk_ms=100, **overrides)
+
+
+def test_fake_live_session_replies_after_activity_end():
+    client = FakeLiveClient(_fast_config())
+
+    async def run():
+        async with client.aio.live.connect(model="model-a", config={"session_resumption": {}}) as session:
+            await session.send_realtime_input(activity_start={})
+            await session.send_realtime_input(audio=SimpleNamespace(data=bytes(960)))
+            await session.send_realtime_input(activity_end={})
+            events = []
+            async for response in session.receive():
+                events.append(response.server_content)
+                if response.server_content.session_resumption_update:
+                    break
+            return session, events
+
+    session, events = asyncio.run(run())
+
+    assert session.audio_bytes == 960
+    assert events[0].input_transcription.text == "Candidate answer with 960 bytes of audio."
+    assert sum(1 for event in events if event.model_turn) == 2
+    assert events[-2].turn_complete
+    assert events[-1].session_resumption_update.resumable
+
+
+def test_fake_live_rejects_unsupported_model():
+    client = FakeLiveClient(_fast_config(unsupported_models=("model-a",)))
+
+    async def run():
+        async with client.aio.live.connect(model="model-a"):
+            pass
+
+    try:
+        asyncio.run(run())
+    except RuntimeError as exc:
+        assert "bidiGenerateContent" in str(exc)
+    else:
+        raise AssertionError("expected unsupported model error")
+
+
+def test_websocket_live_turn_against_fake_client(monkeypatch, tmp_path):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "gemini")
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    monkeypatch.setenv("GEMINI_LIVE_FAKE", "1")
+    monkeypatch.setenv("GEMINI_LIVE_FAKE_CONNECT_MS", "0")
+    monkeypatch.setenv("GEMINI_LIVE_FAKE_RESPONSE_MS", "0")
+    monkeypatch.setenv("GEMINI_LIVE_RESUME", "0")
+    monkeypatch.setattr(gemini_live, "CANDIDATE_FLUSH_DELAY", 0.01)
+    store = InterviewStore(tmp_path)
+    for module in (ws, gemini_live, interview_service):
+        monkeypatch.setattr(module, "store", store)
+    record = store.create(
+        interview_id="fake-live-ws",
+        adapter="gemini",
+        role_title="Engineer",
+        questions=["Tell me about yourself."],
+        focus_areas=[],
+        user_id=os.environ.get("APP_USER_ID", "local")
+    )
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/live") as websocket:
+        websocket.receive_json()
+        websocket.send_json({"type": "start", "interview_id": record.interview_id})
+        states = []
+        while "gemini-connected" not in states:
+            payload = websocket.receive_json()
+            states.append(payload.get("state"))
+
+        websocket.send_json({"type": "activity", "state": "start"})
+        websocket.send_bytes(bytes(1920))
+        websocket.send_json({"type": "activity", "state": "end"})
+
+        seen = []
+        while not any(item.get("role") == "coach" and item.get("is_final") for item in seen):
+            seen.append(websocket.receive_json())
+        websocket.send_json({"type": "stop"})
+
+    assert any(item["type"] == "audio" for item in seen)
+    candidate = next(item for item in seen if item.get("role") == "candidate" and item.get("is_final"))
+    assert candidate["text"] == "Candidate answer with 1920 bytes of audio."
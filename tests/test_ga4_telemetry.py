@@ -0,0 +1,156 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+from app.services.ga4_telemetry import Ga4Dispatcher, build_ga4_event
+
+
+@pytest.fixture
+def collector():
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append({"path": self.path, "payload": json.loads(body), "port": self.client_address[1]})
+            status = 500 if received[-1]["payload"]["client_id"] == "broken" else 204
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/mp/collect", received
+    server.shutdown()
+    server.server_close()
+
+
+def _enqueue(dispatcher, client_id, name="journey_step", **params):
+    return dispatcher.enqueue(
+        measurement_id="G-TEST",
+        api_secret="secret",
+        client_id=client_id,
+        user_id=None,
+        event_name=name,
+        params=params
+    )
+
+
+def test_build_ga4_event_normalizes_names_and_drops_none():
+    event = build_ga4_event("9 Journey-Step", {"Step Name": "intro", "skip": None, "items": [1]})
+
+    assert event["name"] == "evt_9_journey_step"
+    assert event["params"]["step_name"] == "intro"
+    assert event["params"]["items"] == "[1]"
+    assert "skip" not in event["params"]
+
+
+def test_flush_batches_per_client_over_one_connection(collector):
+    url, received = collector
+    dispatcher = Ga4Dispatcher(collect_url=url)
+    for index in range(30):
+        assert _enqueue(dispatcher, "anon-a", index=index)
+    _enqueue(dispatcher, "anon-b")
+
+    assert asyncio.run(dispatcher.flush()) == 31
+
+    batches = sorted((request["payload"]["client_id"], len(request["payload"]["events"])) for request in received)
+    assert batches == [("anon-a", 5), ("anon-a", 25), ("anon-b", 1)]
+    assert received[0]["path"].endswith("measurement_id=G-TEST&api_secret=secret")
+    assert len({request["port"] for request in received}) == 1
+    assert dispatcher.stats() == {"depth": 0, "enqueued": 31, "sent": 31, "failed": 0, "dropped": 0, "batches": 3}
+
+
+def test_full_queue_drops_and_failed_batches_are_counted(collector):
+    url, received = collector
+    dispatcher = Ga4Dispatcher(collect_url=url, max_queue=2)
+
+    assert _enqueue(dispatcher, "anon-a", name="stale")
+    assert _enqueue(dispatcher, "broken")
+    # Not started: nothing drains the queue, so the oldest event is evicted.
+    assert _enqueue(dispatcher, "anon-a", name="fresh")
+    asyncio.run(dispatcher.flush())
+
+    stats = dispatcher.stats()
+    assert (stats["sent"], stats["failed"], stats["dropped"]) == (1, 1, 1)
+    names = [event["name"] for request in received for event in request["payload"]["events"]]
+    assert sorted(names) == ["fresh", "journey_step"]
+
+
+def test_running_dispatcher_drops_new_events_when_full(collector):
+    url, _received = collector
+    dispatcher = Ga4Dispatcher(collect_url=url)
+
+    async def scenario():
+        dispatcher.start(60, max_queue=1)
+        accepted = [_enqueue(dispatcher, "anon-a", name=name) for name in ("first", "second")]
+        depth = dispatcher.stats()["depth"]
+        await dispatcher.stop()
+        return accepted, depth
+
+    accepted, depth = asyncio.run(scenario())
+
+    assert accepted == [True, False]
+    assert depth == 1
+    assert dispatcher.stats()["dropped"] == 1
+    assert dispatcher.stats()["sent"] == 1
+
+
+def test_background_loop_flushes_on_interval_and_on_stop(collector):
+    url, received = collector
+    dispatcher = Ga4Dispatcher(collect_url=url)
+
+    async def scenario():
+        dispatcher.start(0.05)
+        _enqueue(dispatcher, "anon-a", name="first")
+        deadline = time.monotonic() + 2
+        while not received and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        assert dispatcher.running
+        _enqueue(dispatcher, "anon-a", name="second")
+        await dispatcher.stop()
+
+    asyncio.run(scenario())
+
+    names = [event["name"] for request in received for event in request["payload"]["events"]]
+    assert names == ["first", "second"]
+    assert not dispatcher.running
+
+
+def test_stop_delivers_a_batch_that_is_already_in_flight():
+    dispatcher = Ga4Dispatcher(collect_url="http://collector.invalid/mp/collect")
+    delivered = []
+
+    async def scenario():
+        in_flight = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_post(_client, _url, payload, _user_id):
+            in_flight.set()
+            await release.wait()
+            delivered.extend(event["name"] for event in payload["events"])
+            return True
+
+        dispatcher._post = slow_post
+        dispatcher.start(0.01)
+        _enqueue(dispatcher, "anon-a", name="in_flight")
+        await asyncio.wait_for(in_flight.wait(), timeout=2)
+        stopping = asyncio.create_task(dispatcher.stop())
+        await asyncio.sleep(0.02)
+        release.set()
+        await stopping
+
+    asyncio.run(scenario())
+
+    assert delivered == ["in_flight"]
+    assert not dispatcher.running
@@ -0,0 +1,40 @@
+import math
+import random
+
+from app.services.latency_sketch import SKETCH_RELATIVE_ACCURACY, QuantileSketch, WindowedLatency
+
+
+def test_quantile_sketch_stays_within_relative_accuracy():
+    rng = random.Random(3)
+    samples = [rng.lognormvariate(5, 1) for _ in range(20000)]
+    sketch = QuantileSketch()
+    for value in samples:
+        sketch.add(value)
+
+    ordered = sorted(samples)
+    for quantile in (0.5, 0.9, 0.99):
+        exact = ordered[math.ceil(quantile * len(ordered)) - 1]
+        assert abs(sketch.quantile(quantile) - exact) <= exact * SKETCH_RELATIVE_ACCURACY
+    assert len(sketch.buckets) < 400
+
+
+def test_windowed_latency_rolls_samples_out_of_short_windows():
+    windows = WindowedLatency(clock=lambda: 0.0)
+    start = 1_000_000.0
+    for value in (100, 200, 300):
+        windows.add("voice_turn", "model-a", value, at=start)
+    windows.add("voice_turn", "model-b", 900, at=start + 250)
+
+    recent = windows.summary(now=start + 30)
+    assert [row["count"] for row in recent["1m"]] == [3]
+    assert abs(recent["1m"][0]["p50_ms"] - 200) <= 200 * SKETCH_RELATIVE_ACCURACY
+    assert recent["1m"][0]["max_ms"] == 300
+
+    later = windows.summary(now=start + 250)
+    assert [(row["model"], row["count"]) for row in later["1m"]] == [("model-b", 1)]
+    assert [(row["model"], row["count"]) for row in later["5m"]] == [("model-a", 3), ("model-b", 1)]
+
+    next_hour = windows.summary(now=start + 3000)
+    assert later["1h"] == next_hour["1h"]
+    assert next_hour["5m"] == []
+    assert windows.summary(now=start + 4000)["1h"] == []
@@ -0,0 +1,142 @@
+import asyncio
+
+from app.services.live_auth_tokens import CachedAuthToken, LiveAuthTokenCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_auth_token_cache_reuses_token_until_refresh_margin():
+    clock = FakeClock()
+    minted = []
+
+    async def minter(api_key, model):
+        minted.append((api_key, model))
+        return CachedAuthToken(name=f"token-{len(minted)}", expires_at=clock() + 600)
+
+    cache = LiveAuthTokenCache(minter, refresh_margin_seconds=60, clock=clock)
+
+    async def run():
+        first = await cache.get("key", "model-a")
+        second = await cache.get("key", "model-a")
+        other = await cache.get("key", "model-b")
+        clock.now += 545
+        refreshed = await cache.get("key", "model-a")
+        await cache.close()
+        return first, second, other, refreshed
+
+    first, second, other, refreshed = asyncio.run(run())
+
+    assert first == second == "token-1"
+    assert other == "token-2"
+    assert refreshed == "token-3"
+
+
+def test_auth_token_cache_deduplicates_concurrent_mints():
+    clock = FakeClock()
+    calls = []
+
+    async def minter(api_key, model):
+        calls.append(model)
+        await asyncio.sleep(0.01)
+        return CachedAuthToken(name="token", expires_at=clock() + 600)
+
+    cache = LiveAuthTokenCache(minter, clock=clock)
+
+    async def run():
+        results = await asyncio.gather(*(cache.get("key", "model") for _ in range(5)))
+        await cache.close()
+        return results
+
+    assert asyncio.run(run()) == ["token"] * 5
+    assert calls == ["model"]
+
+
+def test_auth_token_refresher_keeps_warm_token():
+    minted = []
+
+    def clock():
+        return asyncio.get_running_loop().time()
+
+    async def minter(api_key, model):
+        minted.append(model)
+        return CachedAuthToken(name=f"token-{len(minted)}", expires_at=clock() + 0.05)
+
+    cache = LiveAuthTokenCache(minter, refresh_margin_seconds=0, clock=clock)
+
+    async def run():
+        await cache.get("key", "model")
+        # Off the 0.05 s expiry grid, so the check never lands on the instant a token lapses.
+        await asyncio.sleep(0.225)
+        warm = cache.peek("key", "model")
+        await cache.close()
+        return warm
+
+    warm = asyncio.run(run())
+
+    assert len(minted) >= 2
+    assert warm is not None
+
+
+def test_auth_token_cache_invalidates_failed_token():
+    clock = FakeClock()
+    minted = []
+
+    async def minter(api_key, model):
+        minted.append(model)
+        return CachedAuthToken(name=f"token-{len(minted)}", expires_at=clock() + 600)
+
+    cache = LiveAuthTokenCache(minter, clock=clock)
+
+    async def run():
+        first = await cache.get("key", "model")
+        cache.invalidate("key", "model", "stale-token")
+        kept = cache.peek("key", "model")
+        cache.invalidate("key", "model", first)
+        second = await cache.get("key", "model")
+        await cache.close()
+        return first, kept, second
+
+    first, kept, second = asyncio.run(run())
+
+    assert kept == first
+    assert second == "token-2"
+
+
+def test_auth_token_waiter_mints_again_when_owner_is_cancelled():
+    clock = FakeClock()
+    calls = []
+
+    async def minter(api_key, model):
+        calls.append(model)
+        await asyncio.sleep(0.05 if len(calls) == 1 else 0)
+        return CachedAuthToken(name=f"token-{len(calls)}", expires_at=clock() + 600)
+
+    cache = LiveAuthTokenCache(minter, clock=clock)
+
+    async def run():
+        owner = asyncio.create_task(cache.get("key", "model"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get("key", "model"))
+        await asyncio.sleep(0)
+        owner.cancel()
+        try:
+            await owner
+        except asyncio.CancelledError:
+            owner_cancelled = True
+        else:
+            owner_cancelled = False
+        result = await waiter
+        await cache.close()
+        return owner_cancelled, result
+
+    owner_cancelled, result = asyncio.run(run())
+
+    assert owner_cancelled
+    assert result is not None
+    assert result.startswith("token-")
@@ -0,0 +1,82 @@
+import asyncio
+
+from app.services.live_capacity import LiveCapacity
+
+
+def test_live_capacity_rejects_when_full_without_queue():
+    capacity = LiveCapacity()
+
+    async def run():
+        first = await capacity.acquire(1)
+        second = await capacity.acquire(1)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert (first, second) == (True, False)
+    assert capacity.snapshot()["active"] == 1
+    assert capacity.snapshot()["rejected"] == 1
+
+
+def test_live_capacity_hands_released_slot_to_queued_waiter():
+    capacity = LiveCapacity()
+
+    async def run():
+        await capacity.acquire(1)
+        waiter = asyncio.create_task(capacity.acquire(1, queue_max=1, timeout_seconds=1))
+        await asyncio.sleep(0)
+        queued = capacity.snapshot()["queued"]
+        overflow = await capacity.acquire(1, queue_max=1, timeout_seconds=1)
+        capacity.release()
+        return queued, overflow, await waiter
+
+    queued, overflow, admitted = asyncio.run(run())
+
+    assert queued == 1
+    assert overflow is False
+    assert admitted is True
+    snapshot = capacity.snapshot()
+    assert snapshot["active"] == 1
+    assert snapshot["queued"] == 0
+    assert snapshot["admitted"] == 2
+
+
+def test_live_capacity_queue_times_out():
+    capacity = LiveCapacity()
+
+    async def run():
+        await capacity.acquire(1)
+        admitted = await capacity.acquire(1, queue_max=2, timeout_seconds=0.01)
+        capacity.release()
+        return admitted
+
+    assert asyncio.run(run()) is False
+    snapshot = capacity.snapshot()
+    assert snapshot["timed_out"] == 1
+    assert snapshot["active"] == 0
+    assert snapshot["queued"] == 0
+
+
+
+def test_live_capacity_passes_on_slot_when_admitted_waiter_is_cancelled():
+    capacity = LiveCapacity()
+
+    async def run():
+        await capacity.acquire(1)
+        cancelled = asyncio.create_task(capacity.acquire(1, queue_max=2, timeout_seconds=1))
+        await asyncio.sleep(0)
+        next_waiter = asyncio.create_task(capacity.acquire(1, queue_max=2, timeout_seconds=1))
+        await asyncio.sleep(0)
+        # The slot is handed to the first waiter, which is cancelled before it resumes.
+        capacity.release()
+        cancelled.cancel()
+        try:
+            await cancelled
+        except asyncio.CancelledError:
+            pass
+        return await next_waiter
+
+    assert asyncio.run(run()) is True
+    snapshot = capacity.snapshot()
+    assert snapshot["active"] == 1
+    assert snapshot["queued"] == 0
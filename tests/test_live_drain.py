@@ -0,0 +1,126 @@
+import asyncio
+from dataclasses import replace
+import os
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app import ws
+from app.main import app
+from app.services.live_capacity import LiveCapacity
+from app.services.live_drain import LIVE_DRAIN_CLOSE_CODE, LiveDrain
+from app.services.live_latency import LiveLatencyRecorder
+from app.services.store import InterviewStore
+from app.settings import load_settings
+
+
+def test_live_drain_waits_for_sessions_until_deadline():
+    drain = LiveDrain()
+    drained = []
+
+    class Session:
+        def __init__(self, name, delay):
+            self.name = name
+            self.delay = delay
+
+        async def drain(self):
+            await asyncio.sleep(self.delay)
+            drained.append(self.name)
+
+    drain.register(Session("quick", 0.01))
+    drain.register(Session("stuck", 5))
+
+    async def run():
+        first = asyncio.create_task(drain.drain(0.1))
+        second = await drain.drain(0.1)
+        return await first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert first["sessions"] == 2
+    assert first["drained"] == 1
+    assert first["timed_out"] == 1
+    assert drained == ["quick"]
+    assert drain.draining is True
+
+
+def test_session_drain_flushes_bridge_then_hands_over_resume_handle(monkeypatch):
+    events = []
+
+    class Bridge:
+        model = "model-a"
+        latency = LiveLatencyRecorder()
+
+        async def stop(self):
+            events.append("bridge_stop")
+
+    class Socket:
+        async def send_json(self, payload):
+            events.append(payload)
+
+        async def close(self, code=1000):
+            events.append(("close", code))
+
+    monkeypatch.setattr(ws, "live_capacity", LiveCapacity())
+    monkeypatch.setattr(
+        ws.store,
+        "get",
+        lambda interview_id, user_id: SimpleNamespace(live_resume_handle="handle-7")
+    )
+    session = ws.LiveWebSocketSession.__new__(ws.LiveWebSocketSession)
+    session.websocket = Socket()
+    session.settings = replace(load_settings(), live_vad_enabled=False)
+    session._send_lock = asyncio.Lock()
+    session._stream_task = None
+    session._gemini_bridge = Bridge()
+    session._vad = None
+    session._active = True
+    session._holds_live_slot = False
+    session._close_code = None
+    session._user_id = "user"
+    session._interview_id = "abc"
+    session._session_id = "s1"
+
+    asyncio.run(session.drain())
+
+    assert events[0] == "bridge_stop"
+    assert events[1]["state"] == "draining"
+    assert events[1]["resume_handle"] == "handle-7"
+    assert events[2] == ("close", LIVE_DRAIN_CLOSE_CODE)
+    assert session._gemini_bridge is None
+    assert session._active is False
+
+
+def test_websocket_start_is_refused_while_draining(monkeypatch, tmp_path):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "mock")
+    os.environ.pop("GEMINI_API_KEY", None)
+    draining = LiveDrain()
+    draining.draining = True
+    monkeypatch.setattr(ws, "live_drain", draining)
+    monkeypatch.setattr(ws, "live_capacity", LiveCapacity())
+    monkeypatch.setattr(ws, "store", InterviewStore(tmp_path))
+
+    client = TestClient(app)
+    interview_id = ws.store.create(
+        interview_id="drain-test",
+        adapter="mock",
+        role_title="Engineer",
+        questions=["Tell me about a project."],
+        focus_areas=[],
+        user_id=load_settings().user_id
+    ).interview_id
+
+    with client.websocket_connect("/ws/live") as websocket:
+        websocket.receive_json()
+        websocket.send_json({"type": "start", "interview_id": interview_id})
+        status = websocket.receive_json()
+        assert status["state"] == "draining"
+        assert status["interview_id"] == interview_id
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            websocket.receive_json()
+
+    assert excinfo.value.code == LIVE_DRAIN_CLOSE_CODE
+    assert ws.live_capacity.snapshot()["admitted"] == 0
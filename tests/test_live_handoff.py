@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+import time
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app import ws
+from app.main import app
+from app.services import gemini_live, interview_service
+from app.services.fake_live import FakeLiveClient, FakeLiveConfig
+from app.services.gemini_live import _resume_state_issue
+from app.services.store import InterviewStore
+
+
+def _use_node(monkeypatch, node_store):
+    for module in (ws, gemini_live, interview_service):
+        monkeypatch.setattr(module, "store", node_store)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def test_resume_state_issue_validates_handle():
+    now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    fresh = (now - timedelta(minutes=5)).isoformat()
+    stale = (now - timedelta(hours=3)).isoformat()
+
+    def record(**fields):
+        values = {"live_resume_handle": "h1", "live_resume_resumable": True, "live_resume_updated_at": fresh}
+        values.update(fields)
+        return SimpleNamespace(**values)
+
+    assert _resume_state_issue(record(), 7200, now) is None
+    assert _resume_state_issue(record(live_resume_handle=None), 7200, now) == "missing_handle"
+    assert _resume_state_issue(record(live_resume_resumable=False), 7200, now) == "not_resumable"
+    assert _resume_state_issue(record(live_resume_updated_at=stale), 7200, now) == "expired"
+    assert _resume_state_issue(record(live_resume_updated_at=stale), 0, now) is None
+
+
+def test_resume_hands_off_to_second_node_over_shared_store(monkeypatch, tmp_path):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "gemini")
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    monkeypatch.setenv("GEMINI_LIVE_RESUME", "1")
+    monkeypatch.setenv("LIVE_RESUME_HANDOFF", "1")
+    monkeypatch.setattr(gemini_live, "CANDIDATE_FLUSH_DELAY", 0.01)
+    fake = FakeLiveClient(FakeLiveConfig(connect_ms=0, response_ms=0, reply_audio_ms=200, chunk_ms=100))
+    monkeypatch.setattr(gemini_live, "fake_live_client", lambda: fake)
+
+    node_a = InterviewStore(tmp_path, default_user_id="local")
+    node_b = InterviewStore(tmp_path, default_user_id="local")
+    record = node_a.create(
+        interview_id="handoff",
+        adapter="gemini",
+        role_title="Engineer",
+        questions=["Tell me about a project you led."],
+        focus_areas=[],
+        user_id="local"
+    )
+    # Node B served this interview earlier, so its cached copy predates node A's session.
+    assert node_b.get(record.interview_id, "local").live_resume_handle is None
+
+    _use_node(monkeypatch, node_a)
+    client = TestClient(app)
+    with client.websocket_connect("/ws/live") as websocket:
+        websocket.receive_json()
+        websocket.send_json({"type": "start", "interview_id": record.interview_id, "user_id": "local"})
+        while websocket.receive_json().get("state") != "gemini-connected":
+            pass
+        websocket.send_json({"type": "activity", "state": "start"})
+        websocket.send_bytes(bytes(1920))
+        websocket.send_json({"type": "activity", "state": "end"})
+        _wait_for(lambda: node_a.get(record.interview_id, "local").live_resume_handle)
+        websocket.send_json({"type": "stop"})
+    handle = node_a.get(record.interview_id, "local").live_resume_handle
+    transcript = list(node_a.get(record.interview_id, "local").transcript)
+    assert transcript
+
+    _use_node(monkeypatch, node_b)
+    with client.websocket_connect("/ws/live") as websocket:
+        websocket.receive_json()
+        websocket.send_json(
+            {"type": "start", "interview_id": record.interview_id, "user_id": "local", "resume": True}
+        )
+        states = []
+        while "gemini-connected" not in states:
+            states.append(websocket.receive_json().get("state"))
+        websocket.send_json({"type": "stop"})
+
+    resumed = fake.sessions[-1]
+    assert resumed.resume_handle == handle
+    assert resumed.text_inputs == 0
+    assert "thinking" not in states
+    assert node_b.get(record.interview_id, "local").transcript == transcript
+
+
+def test_single_node_resume_ignores_handoff_checks(monkeypatch, tmp_path):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "gemini")
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    monkeypatch.setenv("GEMINI_LIVE_RESUME", "1")
+    monkeypatch.setenv("LIVE_RESUME_HANDOFF", "0")
+    fake = FakeLiveClient(FakeLiveConfig(connect_ms=0, response_ms=0, reply_audio_ms=200, chunk_ms=100))
+    monkeypatch.setattr(gemini_live, "fake_live_client", lambda: fake)
+
+    node = InterviewStore(tmp_path, default_user_id="local")
+    record = node.create(
+        interview_id="single-node",
+        adapter="gemini",
+        role_title="Engineer",
+        questions=["Tell me about a project you led."],
+        focus_areas=[],
+        user_id="local"
+    )
+    # The connection dropped mid-generation long ago: the last handle was stored as not resumable.
+    node.set_live_resume_handle(record.interview_id, "h-last", False, user_id="local")
+    node.get(record.interview_id, "local").live_resume_updated_at = "2020-01-01T00:00:00+00:00"
+
+    _use_node(monkeypatch, node)
+    client = TestClient(app)
+    with client.websocket_connect("/ws/live") as websocket:
+        websocket.receive_json()
+        websocket.send_json(
+            {"type": "start", "interview_id": record.interview_id, "user_id": "local", "resume": True}
+        )
+        while websocket.receive_json().get("state") != "gemini-connected":
+            pass
+        websocket.send_json({"type": "stop"})
+
+    assert fake.sessions[-1].resume_handle == "h-last"
+    assert fake.sessions[-1].text_inputs == 0
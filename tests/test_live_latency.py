@@ -0,0 +1,120 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services import gemini_live
+from app.services.live_latency import LatencyHistogram, LiveLatencyRecorder
+from app.services.log_metrics import build_log_summary
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_latency_histogram_quantiles_use_bucket_bounds():
+    histogram = LatencyHistogram()
+    for value in (20, 40, 80, 90, 450, 12000):
+        histogram.record(value)
+
+    assert histogram.quantile(0.5) == 100
+    assert histogram.quantile(0.9) == 12000
+    assert histogram.summary()["count"] == 6
+
+
+def test_recorder_measures_turn_from_activity_end():
+    clock = FakeClock()
+    recorder = LiveLatencyRecorder(clock=clock)
+
+    recorder.activity_start()
+    clock.now += 2.5
+    recorder.activity_end()
+    clock.now += 0.4
+    recorder.coach_transcript()
+    clock.now += 0.2
+    recorder.coach_audio(48000, 24000)
+    recorder.coach_audio(48000, 24000)
+    turn = recorder.turn_complete()
+
+    assert turn == {
+        "candidate_audio_ms": 2500.0,
+        "coach_transcript_ms": 400.0,
+        "first_audio_ms": 600.0,
+        "coach_audio_ms": 2000.0
+    }
+    assert recorder.turns == 1
+    assert recorder.turn_complete() is None
+    assert "first_audio_count=1" in recorder.log_fields()
+
+
+def test_bridge_sends_metrics_message_on_turn_complete_in_dev_mode():
+    events = []
+
+    async def send_json(payload):
+        events.append(payload)
+
+    bridge = gemini_live.GeminiLiveBridge.__new__(gemini_live.GeminiLiveBridge)
+    bridge._send_json = send_json
+    bridge._output_sample_rate = 24000
+    bridge._resume_enabled = False
+    bridge._coach_buffer = ""
+    bridge._candidate_buffer = ""
+    bridge._candidate_timestamp = None
+    bridge._candidate_flush_task = None
+    bridge._candidate_lock = asyncio.Lock()
+    bridge._metrics_enabled = True
+    bridge.latency = LiveLatencyRecorder()
+    bridge.latency.activity_end()
+
+    audio_part = SimpleNamespace(text=None, inline_data=SimpleNamespace(data=bytes(4800), mime_type="audio/pcm;rate=24000"))
+
+    async def run():
+        await bridge._handle_response(
+            SimpleNamespace(
+                server_content=SimpleNamespace(
+                    input_transcription=None,
+                    output_transcription=None,
+                    model_turn=SimpleNamespace(parts=[audio_part])
+                )
+            )
+        )
+        await bridge._handle_response(
+            SimpleNamespace(
+                server_content=SimpleNamespace(
+                    input_transcription=None,
+                    output_transcription=None,
+                    model_turn=None,
+                    turn_complete=True
+                )
+            )
+        )
+
+    asyncio.run(run())
+
+    metrics = [payload for payload in events if payload["type"] == "metrics"]
+    assert len(metrics) == 1
+    assert metrics[0]["turn"]["coach_audio_ms"] == 100.0
+    assert "first_audio_ms" in metrics[0]["turn"]
+    assert metrics[0]["session"]["turns"] == 1
+
+
+def test_log_summary_aggregates_latency_lines():
+    first = LiveLatencyRecorder()
+    second = LiveLatencyRecorder()
+    for recorder, values in ((first, (120, 180)), (second, (900, 2600))):
+        for value in values:
+            recorder.histograms["first_audio"].record(value)
+    lines = [
+        f"2026-01-13 15:06:23,094 INFO event=live_latency status=summary session_id=a {first.log_fields()}",
+        f"2026-01-13 15:06:24,094 INFO event=live_latency status=summary session_id=b {second.log_fields()}"
+    ]
+
+    summary = build_log_summary(lines)["live_latency"]
+
+    assert summary["sessions"] == 2
+    assert summary["first_audio"]["count"] == 4
+    assert summary["first_audio"]["p50_ms"] == 200
+    assert summary["first_audio"]["max_ms"] == 2600
+    assert summary["upstream_send"]["count"] == 0
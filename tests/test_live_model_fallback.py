@@ -0,0 +1,119 @@
+import asyncio
+from dataclasses import replace
+from types import SimpleNamespace
+
+from app import ws
+from app.services.audio_resample import PcmConverter
+from app.services.live_latency import LiveLatencyRecorder
+from app.services.live_models import LiveModelCapabilities
+from app.services.store import InterviewRecord
+from app.settings import load_settings
+
+
+class FakeBridge:
+    behaviours = {}
+    opened = []
+    stopped = []
+
+    def __init__(self, *, model, **kwargs):
+        self.model = model
+        self.latency = LiveLatencyRecorder()
+
+    async def open(self):
+        FakeBridge.opened.append(self.model)
+        delay, error = FakeBridge.behaviours.get(self.model, (0, None))
+        await asyncio.sleep(delay)
+        if error:
+            raise RuntimeError(error)
+
+    async def activate(self):
+        return None
+
+    async def stop(self):
+        FakeBridge.stopped.append(self.model)
+
+
+def _session(monkeypatch, **settings_overrides):
+    FakeBridge.behaviours = {}
+    FakeBridge.opened = []
+    FakeBridge.stopped = []
+    capabilities = LiveModelCapabilities()
+    monkeypatch.setattr(ws, "GeminiLiveBridge", FakeBridge)
+    monkeypatch.setattr(ws, "live_model_capabilities", capabilities)
+    monkeypatch.setattr(ws, "build_live_system_prompt", lambda record: "prompt")
+
+    events = []
+
+    async def send(payload):
+        events.append(payload)
+
+    session = ws.LiveWebSocketSession.__new__(ws.LiveWebSocketSession)
+    session.adapter = SimpleNamespace(name="gemini", api_key="key")
+    session.settings = replace(
+        load_settings(),
+        live_model="model-a",
+        live_model_fallbacks=("model-b", "model-c"),
+        live_resume_enabled=False,
+        **settings_overrides
+    )
+    session._send = send
+    session._gemini_bridge = None
+    session._holds_live_slot = False
+    session._live_model_override = None
+    session._input_converter = PcmConverter(24000)
+    session._user_id = "user"
+    return session, capabilities, events
+
+
+def _record():
+    return InterviewRecord(
+        interview_id="abc",
+        user_id="user",
+        adapter="gemini",
+        role_title="Role",
+        questions=["Q1"],
+        focus_areas=[]
+    )
+
+
+def test_unsupported_live_model_is_skipped_on_next_session(monkeypatch):
+    session, capabilities, events = _session(monkeypatch)
+    FakeBridge.behaviours = {"model-a": (0, "model-a is not supported for bidi")}
+
+    asyncio.run(session._start_gemini_session("abc", _record(), False))
+
+    assert session._gemini_bridge.model == "model-b"
+    assert FakeBridge.opened == ["model-a", "model-b"]
+    assert capabilities.is_unsupported("model-a")
+    assert any(event.get("state") == "live-model-fallback" for event in events)
+
+    FakeBridge.opened = []
+    session._gemini_bridge = None
+    asyncio.run(session._start_gemini_session("abc", _record(), False))
+
+    assert FakeBridge.opened == ["model-b"]
+    assert capabilities.snapshot()["model-b"]["connects"] == 2
+
+
+def test_hedged_connect_keeps_first_model_to_connect(monkeypatch):
+    session, capabilities, events = _session(monkeypatch, live_model_hedge_delay_ms=20)
+    FakeBridge.behaviours = {"model-a": (1.0, None), "model-b": (0, None)}
+
+    asyncio.run(session._start_gemini_session("abc", _record(), False))
+
+    assert session._gemini_bridge.model == "model-b"
+    assert FakeBridge.opened == ["model-a", "model-b"]
+    assert "model-a" in FakeBridge.stopped
+    assert "model-a" not in capabilities.snapshot()
+
+
+def test_non_model_error_does_not_fall_back(monkeypatch):
+    session, capabilities, events = _session(monkeypatch)
+    FakeBridge.behaviours = {"model-a": (0, "quota exceeded")}
+
+    asyncio.run(session._start_gemini_session("abc", _record(), False))
+
+    assert session._gemini_bridge is None
+    assert FakeBridge.opened == ["model-a"]
+    assert events[-1] == {"type": "error", "message": "quota exceeded"}
+    assert not capabilities.is_unsupported("model-a")
@@ -0,0 +1,173 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services import gemini_live
+from app.services.live_latency import LiveLatencyRecorder
+from app.services.store import InterviewStore
+
+
+class DummySession:
+    def __init__(self):
+        self.realtime = []
+
+    async def send_realtime_input(self, **kwargs):
+        self.realtime.append(kwargs)
+
+
+def _build_bridge(store, record, events):
+    async def send_json(payload):
+        events.append(payload)
+
+    bridge = gemini_live.GeminiLiveBridge.__new__(gemini_live.GeminiLiveBridge)
+    bridge._interview_id = record.interview_id
+    bridge._user_id = record.user_id
+    bridge._session = DummySession()
+    bridge._closed = False
+    bridge._rehydrating = False
+    bridge._resume_enabled = False
+    bridge._send_json = send_json
+    bridge._output_sample_rate = 24000
+    bridge._coach_buffer = ""
+    bridge._coach_flush_task = None
+    bridge._coach_lock = asyncio.Lock()
+    bridge._coach_last_fragment_at = None
+    bridge._candidate_buffer = ""
+    bridge._candidate_timestamp = None
+    bridge._candidate_flush_task = None
+    bridge._candidate_lock = asyncio.Lock()
+    bridge._metrics_enabled = False
+    bridge.latency = LiveLatencyRecorder()
+    return bridge
+
+
+def _input_response(text):
+    return SimpleNamespace(
+        server_content=SimpleNamespace(
+            input_transcription=SimpleNamespace(text=text),
+            output_transcription=None,
+            model_turn=None
+        )
+    )
+
+
+def _create_record(tmp_path, monkeypatch):
+    store = InterviewStore(base_dir=tmp_path, default_user_id='tester')
+    record = store.create(
+        interview_id='buffer123',
+        adapter='gemini',
+        role_title='Engineer',
+        questions=['Tell me about yourself.'],
+        focus_areas=['Communication'],
+        user_id='candidate-1'
+    )
+    monkeypatch.setattr(gemini_live, 'store', store)
+    return store, record
+
+
+def test_candidate_fragments_stream_interim_and_commit_on_activity_end(tmp_path, monkeypatch):
+    store, record = _create_record(tmp_path, monkeypatch)
+    persisted = []
+    original_persist = store._persist
+
+    def counting_persist(item):
+        persisted.append(item.interview_id)
+        original_persist(item)
+
+    monkeypatch.setattr(store, '_persist', counting_persist)
+    events = []
+    bridge = _build_bridge(store, record, events)
+
+    async def run():
+        for fragment in ['I led', 'a migration', 'last year.']:
+            await bridge._handle_response(_input_response(fragment))
+        await bridge.send_activity('end')
+
+    asyncio.run(run())
+
+    transcripts = [payload for payload in events if payload.get('type') == 'transcript']
+    assert [payload['is_final'] for payload in transcripts] == [False, False, False, True]
+    assert transcripts[-1]['text'] == 'I led a migration last year.'
+    assert len(persisted) == 1
+    updated = store.get(record.interview_id, user_id=record.user_id)
+    assert updated.transcript[-1] == {
+        'role': 'candidate',
+        'text': 'I led a migration last year.',
+        'timestamp': transcripts[0]['timestamp']
+    }
+
+
+def test_candidate_buffer_commits_before_coach_text(tmp_path, monkeypatch):
+    store, record = _create_record(tmp_path, monkeypatch)
+    monkeypatch.setattr(gemini_live, 'COACH_FLUSH_DELAY', 0.01)
+    events = []
+    bridge = _build_bridge(store, record, events)
+
+    async def run():
+        await bridge._handle_response(_input_response('My answer'))
+        await bridge._handle_response(
+            SimpleNamespace(
+                server_content=SimpleNamespace(
+                    input_transcription=None,
+                    output_transcription=SimpleNamespace(text='Thanks for sharing.'),
+                    model_turn=None
+                )
+            )
+        )
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    updated = store.get(record.interview_id, user_id=record.user_id)
+    assert [entry['role'] for entry in updated.transcript] == ['candidate', 'coach']
+    assert updated.transcript[0]['text'] == 'My answer'
+
+
+def test_candidate_buffer_commits_after_pause(tmp_path, monkeypatch):
+    store, record = _create_record(tmp_path, monkeypatch)
+    monkeypatch.setattr(gemini_live, 'CANDIDATE_FLUSH_DELAY', 0.01)
+    events = []
+    bridge = _build_bridge(store, record, events)
+
+    async def run():
+        await bridge._handle_response(_input_response('Still thinking'))
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    finals = [payload for payload in events if payload.get('is_final')]
+    assert len(finals) == 1
+    assert finals[0]['text'] == 'Still thinking'
+
+
+def test_coach_buffer_flushes_on_turn_complete_without_waiting_for_timer(tmp_path, monkeypatch):
+    store, record = _create_record(tmp_path, monkeypatch)
+    monkeypatch.setattr(gemini_live, 'COACH_FLUSH_DELAY', 30)
+    events = []
+    bridge = _build_bridge(store, record, events)
+
+    async def run():
+        await bridge._handle_response(
+            SimpleNamespace(
+                server_content=SimpleNamespace(
+                    input_transcription=None,
+                    output_transcription=SimpleNamespace(text='What drew you to this role?'),
+                    model_turn=None
+                )
+            )
+        )
+        await bridge._handle_response(
+            SimpleNamespace(
+                server_content=SimpleNamespace(
+                    input_transcription=None,
+                    output_transcription=None,
+                    model_turn=None,
+                    turn_complete=True
+                )
+            )
+        )
+        assert bridge._coach_flush_task is None
+
+    asyncio.run(run())
+
+    finals = [payload for payload in events if payload.get('type') == 'transcript' and payload.get('is_final')]
+    assert [payload['text'] for payload in finals] == ['What drew you to this role?']
@@ -1,7 +1,10 @@
+import gzip
+import json
+
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock
 
 from app.main import app
+from app.services.ga4_telemetry import ga4_dispatcher
 
 
 def test_log_summary_endpoint_returns_counts(tmp_path, monkeypatch):
@@ -23,6 +26,12 @@ def test_log_summary_endpoint_returns_counts(tmp_path, monkeypatch):
     assert payload["server_disconnects"] == 1
     assert payload["gemini_disconnects"] == 1
 
+    with log_path.open("a") as handle:
+        handle.write("2026-01-13 15:06:24,000 INFO event=ws_disconnect status=closed\n")
+    payload = client.get("/api/logs/summary").json()
+    assert payload["event_counts"]["ws_disconnect"] == 2
+    assert payload["server_disconnects"] == 2
+
 
 def test_client_telemetry_endpoint():
     client = TestClient(app)
@@ -56,8 +65,7 @@ def test_client_telemetry_accepts_journey_fields():
 def test_client_telemetry_forwards_to_ga4_when_enabled(monkeypatch):
     monkeypatch.setenv("GA4_MEASUREMENT_ID", "G-TEST123")
     monkeypatch.setenv("GA4_API_SECRET", "secret")
-    ga4_mock = AsyncMock(return_value=None)
-    monkeypatch.setattr("app.api.send_ga4_event", ga4_mock)
+    ga4_dispatcher.reset()
 
     client = TestClient(app)
     response = client.post(
@@ -82,8 +90,12 @@ def test_client_telemetry_forwards_to_ga4_when_enabled(monkeypatch):
 
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
-    ga4_mock.assert_awaited_once()
-    params = ga4_mock.await_args.kwargs["params"]
+    assert ga4_dispatcher.stats()["depth"] == 1
+    (key, event), = ga4_dispatcher._pending
+    ga4_dispatcher.reset()
+    assert key == ("G-TEST123", "secret", "anon-xyz", None)
+    assert event["name"] == "journey_session_started"
+    params = event["params"]
     assert params["prop_adapter"] == "gemini"
     assert params["prop_voice_mode"] == "turn"
     assert params["prop_voice_output_mode"] == "auto"
@@ -91,3 +103,53 @@ def test_client_telemetry_forwards_to_ga4_when_enabled(monkeypatch):
     assert params["prop_tts_provider"] == "openai"
     assert params["prop_text_model"] == "gemini-3-pro"
     assert params["prop_tts_model"] == "gpt-4o-mini-tts"
+
+
+def test_client_telemetry_batch_reports_per_item_status():
+    client = TestClient(app)
+    response = client.post(
+        "/api/telemetry/batch",
+        json=[
+            {"event": "journey_step", "category": "journey", "step": "intro"},
+            {"category": "journey"},
+            "not-an-event",
+            {"event": "ws_close", "session_id": "s1"}
+        ]
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert (payload["accepted"], payload["rejected"]) == (2, 2)
+    assert [item["status"] for item in payload["results"]] == ["ok", "invalid", "invalid", "ok"]
+    assert payload["results"][1]["error"].startswith("event:")
+
+
+def test_client_telemetry_batch_accepts_gzip_and_enqueues_ga4(monkeypatch):
+    monkeypatch.setenv("GA4_MEASUREMENT_ID", "G-TEST123")
+    monkeypatch.setenv("GA4_API_SECRET", "secret")
+    ga4_dispatcher.reset()
+    events = [{"event": f"journey_{index}", "anonymous_id": "anon-xyz"} for index in range(3)]
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/telemetry/batch",
+        content=gzip.compress(json.dumps(events).encode()),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["accepted"] == 3
+    assert ga4_dispatcher.stats()["depth"] == 3
+    ga4_dispatcher.reset()
+
+
+def test_client_telemetry_batch_rejects_bad_bodies():
+    client = TestClient(app)
+
+    assert client.post("/api/telemetry/batch", json={"event": "x"}).status_code == 400
+    assert client.post("/api/telemetry/batch", json=[{"event": "x"}] * 201).status_code == 413
+    bomb = gzip.compress(b"[" + b" " * (2 * 1024 * 1024) + b"]")
+    response = client.post("/api/telemetry/batch", content=bomb, headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 413
+    response = client.post("/api/telemetry/batch", content=b"garbage", headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 400
@@ -21,3 +21,41 @@ def test_build_log_summary_counts_events():
     assert summary["error_count"] == 1
     assert summary["error_event_count"] == 1
     assert summary["error_session_count"] == 1
+
+
+def test_build_log_summary_matches_for_json_lines():
+    import json
+
+    from app.services.log_parse import parse_log_line
+
+    lines = [
+        "2026-01-13 15:06:23,094 INFO event=ws_disconnect status=closed session_id=server-1",
+        "2026-01-13 15:06:23,097 INFO event=client_event event_type=ws_close status=received",
+        "2026-01-13 15:06:23,099 ERROR event=gemini_live_activity status=error session_id=error-1",
+    ]
+    json_lines = [json.dumps(parse_log_line(line)) for line in lines]
+
+    assert build_log_summary(json_lines) == build_log_summary(lines)
+    assert build_log_summary(json_lines[:1] + lines[1:]) == build_log_summary(lines)
+
+
+def test_log_summary_reports_windowed_latency_per_event_and_model():
+    import time
+
+    from app.services.log_metrics import LogSummaryAggregator
+
+    now = time.time()
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now - 5)) + ",000"
+    aggregator = LogSummaryAggregator(clock=lambda: now)
+    for duration in (100, 120, 400):
+        aggregator.add(
+            f"{stamp} INFO event=peas_eval status=complete category=gemini_text requested_model=a "
+            f"effective_model=b duration_ms={duration}"
+        )
+    aggregator.add(f"{stamp} INFO event=openai_tts status=error requested_model=c duration_ms=9000")
+
+    rows = aggregator.summary()["latency_windows"]["1m"]
+    assert [(row["event"], row["model"], row["count"]) for row in rows] == [("peas_eval", "b", 3)]
+    assert abs(rows[0]["p50_ms"] - 120) <= 120 * 0.02
+    assert abs(rows[0]["p99_ms"] - 400) <= 400 * 0.02
+    assert rows[0]["max_ms"] == 400
@@ -8,3 +8,29 @@ def test_parse_log_line_extracts_fields():
     assert parsed["event"] == "ws_disconnect"
     assert parsed["status"] == "closed"
     assert parsed["user_id"] == "abc"
+
+
+def test_parse_log_line_reads_json_lines():
+    line = (
+        '{"timestamp": "2026-01-13 15:06:23,094", "level": "INFO", '
+        '"message": "event=ws_disconnect status=closed user_id=abc", '
+        '"event": "ws_disconnect", "status": "closed", "user_id": "abc"}'
+    )
+    parsed = parse_log_line(line)
+    assert parsed["level"] == "INFO"
+    assert parsed["event"] == "ws_disconnect"
+    assert parsed["status"] == "closed"
+    assert parsed["user_id"] == "abc"
+
+
+def test_json_formatter_matches_text_parse():
+    import logging
+
+    from app.logging_config import _JsonFormatter
+
+    record = logging.LogRecord(
+        "preptalk", logging.WARNING, __file__, 1, "event=%s status=%s duration_ms=%s", ("store_get", "miss", 4), None
+    )
+    text = logging.Formatter("%(asctime)s %(levelname)s %(message)s").format(record)
+
+    assert parse_log_line(_JsonFormatter().format(record)) == parse_log_line(text)
@@ -0,0 +1,87 @@
+import csv
+import json
+
+from app.tools import log_report
+
+
+def _lines(day: str) -> list[str]:
+    return [
+        f"{day} 10:00:00,000 INFO event=ws_connect status=accepted client=1.2.3.4:5",
+        f"{day} 10:00:01,000 INFO event=ws_start status=complete interview_id=i1 session_id=s1 adapter=gemini",
+        f"{day} 10:00:02,000 INFO event=peas_eval status=complete category=gemini_text requested_model=a "
+        "effective_model=m1 duration_ms=120",
+        f"{day} 10:00:03,000 INFO event=peas_eval status=complete category=gemini_text requested_model=a "
+        "effective_model=m1 duration_ms=480",
+        f"{day} 10:00:04,000 ERROR event=peas_eval status=error category=gemini_text requested_model=a "
+        "duration_ms=9000 error=quota_429_for_key_17",
+        f"{day} 10:00:05,000 INFO event=client_event event_type=ws_close status=received session_id=s1",
+        f"{day} 10:00:06,000 INFO event=ws_disconnect status=closed user_id=u1 interview_id=i1 session_id=s1",
+        "Traceback (most recent call last):",
+    ]
+
+
+def test_log_report_merges_chunks_across_files(tmp_path):
+    first = tmp_path / "app-1.log"
+    second = tmp_path / "app-2.log"
+    first.write_text("\n".join(_lines("2026-03-01")) + "\n")
+    second.write_text("\n".join(_lines("2026-03-02")).replace("error=quota_429_for_key_17", "error=quota_429_for_key_99") + "\n")
+    out_dir = tmp_path / "report"
+
+    # Tiny chunks force many newline-aligned ranges per file through the pool.
+    report = log_report.run([first, second], out_dir, workers=2, chunk_bytes=97)
+
+    assert report["lines"] == 16
+    assert report["unparsed_lines"] == 2
+    by_model = {(row["event"], row["model"]): row for row in report["latency_by_model"]}
+    assert by_model[("peas_eval", "m1")]["count"] == 4
+    assert [row["day"] for row in report["latency_by_day"]] == ["2026-03-01", "2026-03-02"]
+    assert len(report["error_clusters"]) == 1
+    assert report["error_clusters"][0]["count"] == 2
+    assert report["disconnects_by_day"][0]["client_disconnect_rate"] == 1.0
+    assert report["sessions"][0]["session"] == "s1"
+    assert report["sessions"][0]["events"] == 6
+    assert report["sessions"][0]["first_seen"].startswith("2026-03-01 10:00:01")
+    assert report["sessions"][0]["last_seen"].startswith("2026-03-02 10:00:06")
+
+    with (out_dir / "timelines.csv").open() as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == 6
+    assert {row["session"] for row in rows} == {"s1"}
+    assert [row["timestamp"] for row in rows] == sorted(row["timestamp"] for row in rows)
+    assert json.loads((out_dir / "report.json").read_text())["lines"] == 16
+    assert (out_dir / "latency_by_day.csv").read_text().startswith("day,event,model,count,p50_ms")
+
+
+def test_chunk_ranges_cover_each_line_once(tmp_path):
+    path = tmp_path / "app.log"
+    lines = [f"2026-03-01 10:00:{index % 60:02d},000 INFO event=e{index} status=ok" for index in range(200)]
+    path.write_text("\n".join(lines) + "\n")
+
+    for chunk_bytes in (1, 50, 64, 1000, 10**6):
+        total = log_report.ChunkReport()
+        for task in log_report.chunk_ranges(path, chunk_bytes):
+            total.merge(log_report.scan_chunk(*task))
+        assert total.lines == 200
+
+
+def test_session_summaries_spill_and_report_only_the_busiest(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_report, "SESSION_REPORT_TOP", 2)
+    path = tmp_path / "app.log"
+    lines = []
+    for index in range(40):
+        session = f"s{index:02d}"
+        for second in range(1 + (index % 5)):
+            lines.append(f"2026-03-01 10:{index:02d}:{second:02d},000 INFO event=ws_audio status=ok session_id={session}")
+    path.write_text("\n".join(lines) + "\n")
+    out_dir = tmp_path / "report"
+
+    report = log_report.run([path], out_dir, workers=1, chunk_bytes=300)
+
+    assert report["session_count"] == 40
+    assert [(row["session"], row["events"]) for row in report["sessions"]] == [("s04", 5), ("s09", 5)]
+    with (out_dir / "sessions.csv").open() as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["session"] for row in rows] == [f"s{index:02d}" for index in range(40)]
+    assert sum(int(row["events"]) for row in rows) == len(lines)
+    assert rows[4]["first_seen"].startswith("2026-03-01 10:04:00")
+    assert rows[4]["last_seen"].startswith("2026-03-01 10:04:04")
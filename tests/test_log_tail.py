@@ -0,0 +1,63 @@
+import os
+
+from app.services.log_tail import LogTail
+
+
+def _line(event: str, status: str = "ok") -> str:
+    return f"2026-01-13 15:06:23,094 INFO event={event} status={status}\n"
+
+
+def test_log_tail_reads_only_new_complete_lines(tmp_path):
+    log_path = tmp_path / "app.log"
+    log_path.write_text(_line("ws_disconnect", "closed") + _line("ws_connect"))
+    tail = LogTail()
+    tail.follow(log_path)
+
+    assert tail.poll() == 2
+    offset = tail.offset
+    with log_path.open("a") as handle:
+        handle.write(_line("ws_connect") + "2026-01-13 15:06:24,000 INFO event=ws_disc")
+
+    assert tail.poll() == 1
+    assert tail.offset > offset
+    assert tail.snapshot()["event_counts"] == {"ws_disconnect": 1, "ws_connect": 2}
+
+    with log_path.open("a") as handle:
+        handle.write("onnect status=closed\n")
+
+    assert tail.poll() == 1
+    summary = tail.snapshot()
+    assert summary["event_counts"]["ws_disconnect"] == 2
+    assert summary["server_disconnects"] == 2
+    assert tail.poll() == 0
+
+
+def test_log_tail_resets_after_truncation(tmp_path):
+    log_path = tmp_path / "app.log"
+    log_path.write_text(_line("ws_connect") * 3)
+    tail = LogTail()
+    tail.follow(log_path)
+    tail.poll()
+
+    log_path.write_text(_line("ws_disconnect", "closed"))
+    tail.poll()
+
+    assert tail.truncations == 1
+    assert tail.snapshot()["event_counts"] == {"ws_disconnect": 1}
+
+
+def test_log_tail_keeps_counting_across_rotation(tmp_path):
+    log_path = tmp_path / "app.log"
+    log_path.write_text(_line("ws_connect"))
+    tail = LogTail()
+    tail.follow(log_path)
+    tail.poll()
+
+    with log_path.open("a") as handle:
+        handle.write(_line("ws_connect"))
+    os.rename(log_path, tmp_path / "app.log.1")
+    log_path.write_text(_line("ws_disconnect", "closed"))
+    tail.poll()
+
+    assert tail.rotations == 1
+    assert tail.snapshot()["event_counts"] == {"ws_connect": 2, "ws_disconnect": 1}
@@ -1,5 +1,88 @@
+import io
+import json
+import logging
+from logging.handlers import QueueListener
+import queue
+
 from app import logging_config
 
 
 def test_logger_name_is_preptalk():
     assert logging_config._LOGGER_NAME == "preptalk"
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("preptalk", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_rotating_handler_moves_full_log_into_archive(tmp_path):
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    log_file = tmp_path / "app.log"
+    handler = logging_config.ArchiveRotatingFileHandler(log_file, archive_dir, max_bytes=64)
+    try:
+        for index in range(6):
+            handler.emit(_record(f"event=test status=ok index={index} padding=xxxxxxxxxxxx"))
+    finally:
+        handler.close()
+
+    archived = sorted(archive_dir.glob("app-*.log"))
+    assert handler.rollovers == len(archived) >= 2
+    lines = [line for path in archived + [log_file] for line in path.read_text().splitlines()]
+    assert len(lines) == 6
+
+
+def test_rotating_handler_rotates_on_interval(tmp_path, monkeypatch):
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    now = [1000.0]
+    monkeypatch.setattr(logging_config.time, "time", lambda: now[0])
+    handler = logging_config.ArchiveRotatingFileHandler(tmp_path / "app.log", archive_dir, interval_seconds=60)
+    try:
+        handler.emit(_record("event=first"))
+        now[0] += 61
+        handler.emit(_record("event=second"))
+    finally:
+        handler.close()
+
+    assert handler.rollovers == 1
+    assert (tmp_path / "app.log").read_text().strip() == "event=second"
+
+
+def test_bounded_queue_handler_counts_overflow_instead_of_blocking():
+    handler = logging_config._BoundedQueueHandler(queue.Queue(maxsize=2))
+
+    for index in range(5):
+        handler.emit(_record(f"event=test index={index}"))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_json_format_keeps_traceback_out_of_fields_through_the_queue():
+    stream = io.StringIO()
+    output = logging.StreamHandler(stream)
+    output.setFormatter(logging_config._JsonFormatter())
+    handler = logging_config._BoundedQueueHandler(queue.Queue(maxsize=10))
+    listener = QueueListener(handler.queue, output)
+    logger = logging.getLogger("preptalk.test_json_queue")
+    logger.propagate = False
+    logger.addHandler(handler)
+    listener.start()
+    try:
+        try:
+            raise RuntimeError("upstream said status=429 event=quota message=boom")
+        except RuntimeError:
+            logger.exception("event=gemini_live_call status=error session_id=%s", "abc")
+    finally:
+        listener.stop()
+        logger.removeHandler(handler)
+
+    fields = json.loads(stream.getvalue())
+    assert fields["event"] == "gemini_live_call"
+    assert fields["status"] == "error"
+    assert fields["session_id"] == "abc"
+    assert fields["message"] == "event=gemini_live_call status=error session_id=abc"
+    assert fields["level"] == "ERROR"
+    assert "status=429 event=quota" in fields["exc_text"]
+    assert fields["exc_text"].startswith("Traceback")
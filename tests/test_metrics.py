@@ -0,0 +1,56 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.metrics import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    calls = registry.counter("demo_calls", "Calls.", ("route",))
+    latency = registry.histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0))
+    active = registry.gauge("demo_active", "Active.")
+    bound = calls.labels('/a"b')
+    bound.inc()
+    bound.inc(2)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(3)
+    active.set(4)
+    registry.register_collector(lambda: [("demo_depth", "gauge", "Depth.", [("demo_depth", {}, 7)])])
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE demo_calls counter" in lines
+    assert 'demo_calls_total{route="/a\\"b"} 3' in lines
+    assert 'demo_seconds_bucket{le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{le="1"} 2' in lines
+    assert 'demo_seconds_bucket{le="+Inf"} 3' in lines
+    assert "demo_seconds_count 3" in lines
+    assert "demo_seconds_sum 3.55" in lines
+    assert "demo_active 4" in lines
+    assert "demo_depth 7" in lines
+
+    registry.reset()
+    bound.inc()
+    assert 'demo_calls_total{route="/a\\"b"} 1' in registry.render().splitlines()
+
+
+def test_metrics_endpoint_reports_routes_by_template():
+    client = TestClient(app)
+    client.get("/api/interviews/does-not-exist")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/api/interviews/{interview_id}"' in response.text
+    assert "does-not-exist" not in response.text
+    assert "preptalk_log_queue_dropped_total" in response.text
+
+
+def test_metrics_endpoint_requires_access_token_when_configured(monkeypatch):
+    monkeypatch.setenv("APP_ACCESS_TOKENS", "token-1")
+    client = TestClient(app)
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics?access_token=token-1").status_code == 200
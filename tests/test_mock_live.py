@@ -0,0 +1,58 @@
+import asyncio
+import base64
+import time
+
+from app.services import mock_live
+from app.services.mock_live import MockLiveStreamer, mock_turns
+from app.services.store import InterviewStore
+
+
+def test_mock_turns_estimate_speaking_time():
+    turns = mock_turns(
+        [
+            {"role": "coach", "text": " ".join(["word"] * 40)},
+            {"role": "candidate", "text": "Short.", "audio_ms": 250},
+            {"role": "coach", "text": "  "}
+        ]
+    )
+
+    assert [turn.role for turn in turns] == ["coach", "candidate"]
+    assert turns[0].audio_ms == 15000
+    assert turns[1].audio_ms == 250
+
+
+def test_mock_streamer_paces_frames_and_batches_writes(monkeypatch, tmp_path):
+    store = InterviewStore(base_dir=tmp_path, batch_max_entries=100, batch_max_ms=60000)
+    store.create(interview_id="mock1", adapter="mock", role_title="Role", questions=["Q1"], focus_areas=[])
+    monkeypatch.setattr(mock_live, "store", store)
+    persisted = []
+    persist = store._persist
+    monkeypatch.setattr(store, "_persist", lambda record: (persisted.append(len(record.transcript)), persist(record)))
+    sent = []
+
+    async def send_json(payload):
+        sent.append((time.perf_counter(), payload))
+
+    streamer = MockLiveStreamer(
+        send_json,
+        "mock1",
+        "local",
+        mock_turns(
+            [
+                {"role": "coach", "text": "Tell me about a project.", "audio_ms": 100},
+                {"role": "candidate", "text": "I led a migration.", "audio_ms": 50}
+            ]
+        ),
+        frame_ms=20,
+        gap_ms=0
+    )
+    asyncio.run(streamer.run())
+
+    frames = [(at, payload) for at, payload in sent if payload["type"] == "audio"]
+    assert len(frames) == 5
+    assert len(base64.b64decode(frames[0][1]["data"])) == 24000 * 2 * 20 // 1000
+    assert frames[-1][0] - frames[0][0] >= 0.075
+    assert [payload.get("role") for _, payload in sent if payload["type"] == "transcript"] == ["coach", "candidate"]
+    assert sent[-1][1] == {"type": "status", "state": "stream-complete"}
+    assert persisted == [2]
+    assert len(InterviewStore(base_dir=tmp_path).get("mock1").transcript) == 2
@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+
+from app import main
+from app.main import app
+from app.services import interview_service
+from app.services.profiler import ProfileGate, profile_gate
+from app.services.store import InterviewStore
+from app.settings import load_settings
+
+
+def test_profile_gate_allows_one_profile_per_interval():
+    now = [100.0]
+    gate = ProfileGate(clock=lambda: now[0])
+
+    assert gate.try_acquire(60) is None
+    assert gate.try_acquire(60) == "busy"
+    gate.release()
+    now[0] += 30
+    assert gate.try_acquire(60) == "rate_limited"
+    now[0] += 31
+    assert gate.try_acquire(60) is None
+
+
+def test_profiled_request_writes_stats_and_is_rate_limited(monkeypatch, tmp_path):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "mock")
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("APP_PROFILE_TOKENS", "prof-1")
+    profile_gate.reset()
+    store = InterviewStore(tmp_path / "store")
+    for module in (main, interview_service):
+        monkeypatch.setattr(module, "store", store)
+    record = store.create(
+        interview_id="profile-turn",
+        adapter="mock",
+        role_title="Engineer",
+        questions=["Tell me about a project."],
+        focus_areas=[],
+        user_id=load_settings().user_id
+    )
+    client = TestClient(app)
+    payload = {"interview_id": record.interview_id, "text": "Hello there"}
+
+    response = client.post("/api/voice/turn", json=payload, headers={"X-Profile-Token": "prof-1", "X-Profile-Alloc": "1"})
+
+    assert response.status_code == 200
+    assert response.json()["coach"]["text"]
+    name = response.headers["x-profile"]
+    assert "-voice_turn-" in name
+    profiles = tmp_path / "profiles"
+    assert (profiles / name).exists()
+    assert "cumulative" in (profiles / name).with_suffix(".txt").read_text()
+    assert list(profiles.glob("*-alloc.txt"))
+
+    again = client.post("/api/voice/turn", json=payload, headers={"X-Profile-Token": "prof-1"})
+    assert again.status_code == 200
+    assert again.headers["x-profile"] == "skipped=rate_limited"
+    profile_gate.reset()
+
+
+def test_unknown_profile_token_is_ignored(monkeypatch, tmp_path):
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("APP_PROFILE_TOKENS", "prof-1")
+    profile_gate.reset()
+    client = TestClient(app)
+
+    response = client.get("/health", headers={"X-Profile-Token": "guess"})
+
+    assert response.status_code == 200
+    assert "x-profile" not in response.headers
+    assert not (tmp_path / "profiles").exists()
@@ -1,7 +1,7 @@
 import asyncio
 
 from app.services import gemini_live
-from app.services.gemini_live import _match_repeat_question
+from app.services.gemini_live import QuestionMatcher, _match_repeat_question, _question_matcher_for
 from app.services.store import InterviewStore
 
 
@@ -29,6 +29,41 @@ def test_match_repeat_question_requires_question_form():
     assert _match_repeat_question(text, questions, max_index=0) is None
 
 
+def test_question_matcher_returns_lowest_matching_index():
+    matcher = QuestionMatcher([
+        "Describe a time you handled conflict with a stakeholder.",
+        "How do you prioritize competing requests?"
+    ])
+    assert matcher.match("How do you prioritize competing requests?") == 1
+    assert matcher.match("How do you prioritize competing requests?", max_index=0) is None
+    assert matcher.match("Thanks, that was helpful.") is None
+
+
+def test_question_matcher_rebuilds_after_custom_question(tmp_path):
+    store = InterviewStore(base_dir=tmp_path, default_user_id='tester')
+    record = store.create(
+        interview_id='matcher123',
+        adapter='gemini',
+        role_title='Engineer',
+        questions=['Tell me about yourself.'],
+        focus_areas=['Communication'],
+        user_id='candidate-1'
+    )
+    matcher = _question_matcher_for(record)
+    assert _question_matcher_for(record) is matcher
+
+    store.add_custom_question(
+        record.interview_id,
+        'How do you mentor junior engineers?',
+        1,
+        user_id='candidate-1'
+    )
+
+    rebuilt = _question_matcher_for(record)
+    assert rebuilt is not matcher
+    assert rebuilt.match('How do you mentor junior engineers?') == 0
+
+
 def test_repeat_question_preserves_coach_text(tmp_path, monkeypatch):
     store = InterviewStore(base_dir=tmp_path, default_user_id='tester')
     record = store.create(
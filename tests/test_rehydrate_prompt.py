@@ -1,5 +1,4 @@
-from app.services.gemini_live import _build_rehydrate_prompt
-from app.services.store import InterviewRecord
+from app.services.store import InterviewRecord, InterviewStore, REHYDRATE_MAX_TURNS, build_rehydrate_prompt
 
 
 def test_build_rehydrate_prompt_includes_context():
@@ -17,7 +16,7 @@ def test_build_rehydrate_prompt_includes_context():
         {"role": "candidate", "text": "My answer."}
     ]
 
-    prompt = _build_rehydrate_prompt(record, transcript)
+    prompt = build_rehydrate_prompt(record, transcript)
 
     assert prompt is not None
     assert "Recent transcript:" in prompt
@@ -26,3 +25,33 @@ def test_build_rehydrate_prompt_includes_context():
     assert "Current question index: 0" in prompt
     assert "Current question: Question 1?" in prompt
     assert "Next question: Question 2?" in prompt
+
+
+def test_store_rebuilds_rehydrate_snapshot_after_writes(tmp_path):
+    store = InterviewStore(tmp_path)
+    store.create(
+        interview_id="abc",
+        adapter="gemini",
+        role_title="Role",
+        questions=["Question 1?", "Question 2?", "Question 3?"],
+        focus_areas=[]
+    )
+    assert store.rehydrate_snapshot("abc") is None
+
+    for index in range(REHYDRATE_MAX_TURNS + 2):
+        role = "coach" if index % 2 == 0 else "candidate"
+        store.append_transcript_entry("abc", {"role": role, "text": f"Turn {index}.", "timestamp": str(index)})
+    assert not store._rehydrate_snapshots
+    snapshot = store.rehydrate_snapshot("abc")
+
+    assert snapshot is store.rehydrate_snapshot("abc")
+    assert snapshot.turns == REHYDRATE_MAX_TURNS
+    assert "Turn 1." not in snapshot.prompt
+    assert f"candidate: Turn {REHYDRATE_MAX_TURNS + 1}." in snapshot.prompt
+    assert "Current question index: none" in snapshot.prompt
+
+    store.update_asked_question_index("abc", 1)
+
+    assert "Current question: Question 2?" in store.rehydrate_snapshot("abc").prompt
+    assert "Next question: Question 3?" in store.rehydrate_snapshot("abc").prompt
+    assert InterviewStore(tmp_path).rehydrate_snapshot("abc").prompt == store.rehydrate_snapshot("abc").prompt
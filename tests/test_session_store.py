@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 from app.services.store import InterviewStore
@@ -306,3 +307,58 @@ def test_session_store_lists_sessions_ordered_by_updated_at(tmp_path):
     ids = [entry.interview_id for entry in sessions]
     assert ids[0] == first.interview_id
     assert ids[1] == second.interview_id
+
+
+def test_session_store_batches_deferred_transcript_writes(tmp_path):
+    store = InterviewStore(base_dir=tmp_path, default_user_id='tester', batch_max_entries=3, batch_max_ms=60000)
+    record = store.create(
+        interview_id='batch1',
+        adapter='mock',
+        role_title='Recruiter',
+        questions=['Q1'],
+        focus_areas=['Focus']
+    )
+
+    def on_disk():
+        return InterviewStore(base_dir=tmp_path, default_user_id='tester').get(record.interview_id).transcript
+
+    for index in range(2):
+        role = 'coach' if index % 2 == 0 else 'candidate'
+        store.append_transcript_entry(record.interview_id, {'role': role, 'text': f'Turn {index}'}, defer_persist=True)
+    assert len(store.get(record.interview_id).transcript) == 2
+    assert on_disk() == []
+
+    store.append_transcript_entry(record.interview_id, {'role': 'coach', 'text': 'Turn 2'}, defer_persist=True)
+    assert len(on_disk()) == 3
+
+    store.append_transcript_entry(record.interview_id, {'role': 'candidate', 'text': 'Turn 3'}, defer_persist=True)
+    assert len(on_disk()) == 3
+    assert store.flush() == 1
+    assert len(on_disk()) == 4
+    assert store.flush() == 0
+
+
+def test_session_store_flushes_deferred_writes_after_max_age(tmp_path):
+    store = InterviewStore(base_dir=tmp_path, default_user_id='tester', batch_max_entries=100, batch_max_ms=30)
+    record = store.create(
+        interview_id='batch-age',
+        adapter='mock',
+        role_title='Recruiter',
+        questions=['Q1'],
+        focus_areas=['Focus']
+    )
+
+    def on_disk():
+        return InterviewStore(base_dir=tmp_path, default_user_id='tester').get(record.interview_id).transcript
+
+    async def run():
+        store.append_transcript_entry(record.interview_id, {'role': 'coach', 'text': 'Turn 0'}, defer_persist=True)
+        store.append_transcript_entry(record.interview_id, {'role': 'candidate', 'text': 'Turn 1'}, defer_persist=True)
+        before = len(on_disk())
+        # No further writes: only the scheduled flush can put these on disk.
+        await asyncio.sleep(0.1)
+        return before
+
+    assert asyncio.run(run()) == 0
+    assert len(on_disk()) == 2
+    assert store.flush() == 0
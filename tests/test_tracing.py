@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.main import app
+from app.services import interview_service, tracing
+from app.services.store import InterviewStore
+from app.settings import load_settings
+
+
+def test_spans_nest_and_export_in_otel_shape(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRACE_EXPORT", "1")
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    tracing.flush_trace_export()
+
+    with tracing.start_trace("root", route="/x") as root:
+        with tracing.span("outer") as outer:
+            with tracing.span("inner", bytes=3):
+                pass
+    with tracing.span("orphan") as orphan:
+        assert orphan is None
+    tracing.flush_trace_export()
+
+    spans = {item["name"]: item for item in map(json.loads, (tmp_path / "traces.jsonl").read_text().splitlines())}
+    assert set(spans) == {"root", "outer", "inner"}
+    assert {item["traceId"] for item in spans.values()} == {root.trace.trace_id}
+    assert spans["inner"]["parentSpanId"] == outer.span_id
+    assert spans["outer"]["parentSpanId"] == root.span_id
+    assert spans["root"]["parentSpanId"] == ""
+    assert spans["inner"]["attributes"] == {"bytes": 3}
+    assert spans["inner"]["endTimeUnixNano"] >= spans["inner"]["startTimeUnixNano"]
+    assert spans["root"]["status"] == {"code": "OK"}
+
+
+def test_in_context_carries_trace_into_executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    def work():
+        with tracing.span("tts_synthesis"):
+            return tracing.current_trace_id()
+
+    with tracing.start_trace("root") as root:
+        trace_id = executor.submit(tracing.in_context("tts", work)).result()
+    executor.shutdown()
+
+    assert trace_id == root.trace.trace_id
+    assert set(root.trace.stages) == {"tts_queue_wait", "tts_synthesis"}
+    assert "tts_synthesis;dur=" in root.trace.server_timing()
+
+
+def test_http_response_carries_server_timing(monkeypatch, tmp_path):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "mock")
+    store = InterviewStore(tmp_path)
+    for module in (main, interview_service):
+        monkeypatch.setattr(module, "store", store)
+    record = store.create(
+        interview_id="trace-turn",
+        adapter="mock",
+        role_title="Engineer",
+        questions=["Tell me about a project."],
+        focus_areas=[],
+        user_id=load_settings().user_id
+    )
+    client = TestClient(app)
+
+    response = client.post("/api/voice/turn", json={"interview_id": record.interview_id, "text": "Hello there"})
+
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    assert "store_get;dur=" in timing
+    assert "store_persist;dur=" in timing
+    assert "total;dur=" in timing
+    assert len(response.headers["x-trace-id"]) == 32
+
+
+def test_static_assets_are_not_traced():
+    client = TestClient(app)
+
+    response = client.get("/static/css/components.css")
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+    assert "x-trace-id" not in response.headers
@@ -1,8 +1,15 @@
 import os
 
+import pytest
 from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
 
+from app import ws
 from app.main import app
+from app.services import gemini_live, interview_service
+from app.services.fake_live import FakeLiveClient, FakeLiveConfig
+from app.services.live_capacity import LIVE_CAPACITY_CLOSE_CODE, LiveCapacity
+from app.services.store import InterviewStore
 
 
 def _pdf_bytes(label: str) -> bytes:
@@ -135,3 +142,126 @@ def test_websocket_activity_message_does_not_error(monkeypatch):
         response = websocket.receive_json()
         assert response["type"] == "status"
         assert response["state"] == "alive"
+
+
+def test_websocket_start_over_capacity_is_rejected(monkeypatch):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "mock")
+    monkeypatch.setenv("LIVE_MAX_SESSIONS", "1")
+    monkeypatch.setattr(ws, "live_capacity", LiveCapacity())
+    monkeypatch.setattr("app.api.live_capacity", ws.live_capacity)
+
+    client = TestClient(app)
+    interview_id = _create_interview(client)
+
+    with client.websocket_connect("/ws/live") as first:
+        first.receive_json()
+        first.send_json({"type": "start", "interview_id": interview_id})
+        _receive_until(first, "session")
+
+        with client.websocket_connect("/ws/live") as second:
+            second.receive_json()
+            second.send_json({"type": "start", "interview_id": interview_id})
+            status = second.receive_json()
+            assert status == {
+                "type": "status",
+                "state": "capacity",
+                "message": "Live sessions are at capacity. Try again shortly."
+            }
+            with pytest.raises(WebSocketDisconnect) as excinfo:
+                second.receive_json()
+            assert excinfo.value.code == LIVE_CAPACITY_CLOSE_CODE
+
+        gauges = client.get("/api/live/capacity").json()
+        assert gauges["active"] == 1
+        assert gauges["rejected"] == 1
+        assert gauges["max_sessions"] == 1
+
+        first.send_json({"type": "stop"})
+
+    assert ws.live_capacity.snapshot()["active"] == 0
+
+
+def test_websocket_failed_live_connect_releases_slot(monkeypatch, tmp_path):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "gemini")
+    monkeypatch.setenv("GEMINI_API_KEY", "fake-key")
+    monkeypatch.setenv("LIVE_MAX_SESSIONS", "1")
+    monkeypatch.setattr(ws, "live_capacity", LiveCapacity())
+    fake = FakeLiveClient(FakeLiveConfig(connect_ms=0, failure_rate=1.0))
+    monkeypatch.setattr(gemini_live, "fake_live_client", lambda: fake)
+    store = InterviewStore(tmp_path, default_user_id="local")
+    for module in (ws, gemini_live, interview_service):
+        monkeypatch.setattr(module, "store", store)
+    record = store.create(
+        interview_id="connect-fails",
+        adapter="gemini",
+        role_title="Engineer",
+        questions=["Tell me about a project you led."],
+        focus_areas=[],
+        user_id="local"
+    )
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/live") as websocket:
+        websocket.receive_json()
+        websocket.send_json({"type": "start", "interview_id": record.interview_id, "user_id": "local"})
+        error = _receive_until(websocket, "error", limit=10)
+        assert "failure injected" in error["message"]
+        assert ws.live_capacity.snapshot()["active"] == 0
+        websocket.send_json({"type": "stop"})
+
+    assert ws.live_capacity.snapshot()["active"] == 0
+
+
+def test_websocket_start_negotiates_input_format(monkeypatch):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "mock")
+    os.environ.pop("GEMINI_API_KEY", None)
+
+    client = TestClient(app)
+    interview_id = _create_interview(client)
+
+    with client.websocket_connect("/ws/live") as websocket:
+        websocket.receive_json()
+        websocket.send_json(
+            {"type": "start", "interview_id": interview_id, "input_sample_rate": 22050}
+        )
+        error = _receive_until(websocket, "error")
+        assert error["message"] == "Unsupported input audio format."
+
+        websocket.send_json(
+            {
+                "type": "start",
+                "interview_id": interview_id,
+                "input_sample_rate": 48000,
+                "input_format": "float32"
+            }
+        )
+        session = _receive_until(websocket, "session")
+        assert session["input_sample_rate"] == 48000
+        assert session["input_format"] == "float32"
+        websocket.send_json({"type": "stop"})
+
+
+def test_websocket_idle_session_gets_heartbeat_then_reaped(monkeypatch):
+    monkeypatch.setenv("INTERVIEW_ADAPTER", "mock")
+    monkeypatch.setenv("LIVE_HEARTBEAT_INTERVAL_MS", "50")
+    monkeypatch.setenv("LIVE_IDLE_TIMEOUT_MS", "300")
+    os.environ.pop("GEMINI_API_KEY", None)
+    monkeypatch.setattr(ws, "live_capacity", LiveCapacity())
+
+    client = TestClient(app)
+    interview_id = _create_interview(client)
+
+    with client.websocket_connect("/ws/live") as websocket:
+        websocket.receive_json()
+        websocket.send_json({"type": "start", "interview_id": interview_id})
+        states = []
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            while True:
+                states.append(websocket.receive_json().get("state"))
+
+    assert excinfo.value.code == 4408
+    assert "heartbeat" in states
+    snapshot = ws.live_capacity.snapshot()
+    assert snapshot["reaped"] == 1
+    assert snapshot["reaped_idle_seconds"] >= 0.3
+    assert snapshot["active"] == 0